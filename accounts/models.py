@@ -7,10 +7,10 @@ from typing import Optional, List
 from social_django.models import UserSocialAuth
 
 from django.template.loader import render_to_string
-from django.contrib.auth.models import User
+from django.contrib.auth.models import Group, User
 from django.db import models
 from django.db.models import QuerySet
-from django.db.models.signals import post_save
+from django.db.models.signals import m2m_changed, post_delete, post_save
 from django.contrib.postgres.fields import JSONField
 from django.dispatch import receiver
 from django.utils.html import format_html
@@ -23,6 +23,7 @@ from dataset.models.experimentset import ExperimentSet
 from dataset.models.experiment import Experiment
 from dataset.models.scoreset import ScoreSet
 
+from .permission_cache import clear_permission_cache
 from .permissions import (
     GroupTypes,
     user_is_anonymous,
@@ -629,3 +630,13 @@ def save_user_profile(sender, instance, **kwargs):
     """
     if hasattr(instance, "profile"):
         instance.profile.save()
+
+
+@receiver(m2m_changed, sender=User.groups.through)
+@receiver(post_delete, sender=Group)
+def clear_cached_memberships(sender, **kwargs):
+    """
+    Discards the request's cached group memberships whenever a user is
+    added to or removed from a group, or a group is deleted.
+    """
+    clear_permission_cache()
@@ -0,0 +1,203 @@
+"""
+Request-scoped cache of permission group memberships.
+
+Contributor checks such as ``user in instance.contributors`` build a union
+of three group queries every time they are evaluated. While a
+:class:`PermissionCache` is active (see
+:class:`middleware.permissions.PermissionCacheMiddleware`) the group names
+of each user and the members of each instance's groups are loaded once and
+answered from memory. Outside of a request, for example in Celery tasks,
+the helpers in this module fall back to querying the database.
+"""
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterable, List, Optional, Set
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group
+
+from .permissions import (
+    GroupTypes,
+    get_admin_group_name_for_instance,
+    get_editor_group_name_for_instance,
+    get_viewer_group_name_for_instance,
+    user_is_anonymous,
+)
+
+
+User = get_user_model()
+
+_state = threading.local()
+
+GROUP_ATTRS = {
+    GroupTypes.ADMIN: "administrators",
+    GroupTypes.EDITOR: "editors",
+    GroupTypes.VIEWER: "viewers",
+}
+
+
+def group_names_for_instance(instance) -> Dict[str, Optional[str]]:
+    return {
+        GroupTypes.ADMIN: get_admin_group_name_for_instance(instance),
+        GroupTypes.EDITOR: get_editor_group_name_for_instance(instance),
+        GroupTypes.VIEWER: get_viewer_group_name_for_instance(instance),
+    }
+
+
+class PermissionCache:
+    """
+    Caches the group names of users and the group members of instances for
+    the lifetime of a single request.
+    """
+
+    GROUP_ORDER = (GroupTypes.ADMIN, GroupTypes.EDITOR, GroupTypes.VIEWER)
+
+    def __init__(self):
+        self._user_groups: Dict[int, Set[str]] = {}
+        self._members: Dict[str, List[User]] = {}
+
+    def clear(self):
+        self._user_groups.clear()
+        self._members.clear()
+
+    def group_names(self, user) -> Set[str]:
+        """Returns the names of every group `user` belongs to."""
+        if user is None or user_is_anonymous(user) or user.pk is None:
+            return set()
+        if user.pk not in self._user_groups:
+            self._user_groups[user.pk] = set(
+                Group.objects.filter(user=user).values_list("name", flat=True)
+            )
+        return self._user_groups[user.pk]
+
+    def group_type(self, user, instance) -> Optional[str]:
+        """
+        Returns the group type `user` has been assigned to on `instance`,
+        or `None` if they are not a contributor.
+        """
+        names = self.group_names(user)
+        for group_type, name in group_names_for_instance(instance).items():
+            if name is not None and name in names:
+                return group_type
+        return None
+
+    def load_members(self, instances: Iterable):
+        """
+        Loads the members of every group of `instances` not already cached
+        with a single query.
+        """
+        names = set()
+        for instance in instances:
+            names.update(
+                name
+                for name in group_names_for_instance(instance).values()
+                if name is not None and name not in self._members
+            )
+        if not names:
+            return
+
+        for name in names:
+            self._members[name] = []
+        memberships = (
+            User.groups.through.objects.filter(group__name__in=names)
+            .select_related("user__profile", "group")
+            .order_by("user_id")
+        )
+        for membership in memberships:
+            self._members[membership.group.name].append(membership.user)
+
+    def members(self, instance, group_type) -> List[User]:
+        """Returns the users assigned to `group_type` on `instance`."""
+        name = group_names_for_instance(instance)[group_type]
+        if name is None:
+            return []
+        self.load_members([instance])
+        return list(self._members[name])
+
+    def contributors(self, instance) -> List[User]:
+        """Returns the administrators, editors and viewers of `instance`."""
+        users = {}
+        for group_type in self.GROUP_ORDER:
+            for user in self.members(instance, group_type):
+                users.setdefault(user.pk, user)
+        return list(users.values())
+
+
+def get_permission_cache() -> Optional[PermissionCache]:
+    """Returns the active :class:`PermissionCache`, if any."""
+    return getattr(_state, "cache", None)
+
+
+def activate():
+    _state.cache = PermissionCache()
+    return _state.cache
+
+
+def deactivate():
+    _state.cache = None
+
+
+def clear_permission_cache():
+    """Discards the cached memberships after group assignments change."""
+    cache = get_permission_cache()
+    if cache is not None:
+        cache.clear()
+
+
+@contextmanager
+def permission_cache():
+    """
+    Activates a :class:`PermissionCache` for the duration of the block,
+    re-using the active cache if one exists.
+    """
+    cache = get_permission_cache()
+    if cache is not None:
+        yield cache
+        return
+    cache = activate()
+    try:
+        yield cache
+    finally:
+        deactivate()
+
+
+def is_contributor(user, instance) -> bool:
+    """Returns `True` if `user` is in any permission group of `instance`."""
+    cache = get_permission_cache()
+    if cache is None:
+        return user is not None and user in instance.contributors
+    return cache.group_type(user, instance) is not None
+
+
+def has_group_type(user, instance, *group_types) -> bool:
+    """Returns `True` if `user` is in one of `group_types` on `instance`."""
+    cache = get_permission_cache()
+    if cache is None:
+        return user is not None and any(
+            user in getattr(instance, GROUP_ATTRS[group_type])
+            for group_type in group_types
+        )
+    return cache.group_type(user, instance) in group_types
+
+
+def get_members(instance, group_type) -> List[User]:
+    """Returns the users assigned to `group_type` on `instance`."""
+    cache = get_permission_cache()
+    if cache is None:
+        return list(getattr(instance, GROUP_ATTRS[group_type]))
+    return cache.members(instance, group_type)
+
+
+def get_contributors(instance) -> List[User]:
+    """Returns the contributors of `instance`."""
+    cache = get_permission_cache()
+    if cache is None:
+        return list(instance.contributors)
+    return cache.contributors(instance)
+
+
+def prefetch_contributors(instances: Iterable):
+    """Loads the contributors of `instances` into the active cache."""
+    cache = get_permission_cache()
+    if cache is not None:
+        cache.load_members(instances)
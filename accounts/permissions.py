@@ -2,7 +2,8 @@ from django.contrib.auth import get_user_model
 from django.contrib.auth.models import Group
 from django.contrib.auth.models import AnonymousUser
 from django.core.exceptions import ObjectDoesNotExist
-from django.db.models import QuerySet
+from django.db.models import F, Func, IntegerField, Q, QuerySet, Value
+from django.db.models.functions import Cast
 
 from guardian.shortcuts import assign_perm
 
@@ -122,16 +123,70 @@ def instances_for_user_with_group_permission(user, queryset, group_type):
     """
     if user_is_anonymous(user):
         return queryset.none()
+    return queryset.filter(
+        pk__in=group_instance_pks(user, queryset.model, group_type)
+    )
+
+
+def group_instance_pks(users, model, group_type="any"):
+    """
+    Returns a subquery selecting the primary keys of the `model` instances
+    that `users` are in a `group_type` group for. The primary keys are parsed
+    from group names such as `scoreset:1-viewer` by the database, so the
+    subquery can be used in a filter without evaluating it.
+
+    Parameters
+    ----------
+    users : `User` | `QuerySet`
+        A user or a queryset of users.
+    model : type
+        `ExperimentSet`, `Experiment` or `ScoreSet`.
+    group_type : `str`
+        The group, which is either admins, editors or viewers. Pass 'any'
+        to include all groups.
 
-    class_name = queryset.model.__name__
-    if group_type == "any":
-        pattern = r"{0}:\d+-\w+".format(class_name)
+    Returns
+    -------
+    `QuerySet`
+    """
+    if isinstance(users, QuerySet):
+        groups = Group.objects.filter(user__in=users)
     else:
-        pattern = r"{0}:\d+-{1}".format(class_name, group_type)
+        groups = Group.objects.filter(user=users)
 
-    groups = user.groups.filter(name__iregex=pattern)
-    pks = set(g.name.split(":")[-1].split("-")[0] for g in groups)
-    return queryset.filter(pk__in=pks)
+    groups = groups.filter(name__startswith=model.__name__.lower() + ":")
+    if group_type != "any":
+        groups = groups.filter(name__endswith="-" + group_type)
+
+    return groups.annotate(
+        instance_pk=Cast(
+            Func(F("name"), Value(r":([0-9]+)-"), function="substring"),
+            IntegerField(),
+        )
+    ).values("instance_pk")
+
+
+def visible_to_user(queryset, user=None):
+    """
+    Filters `queryset` to the instances that are public or that `user` is
+    a contributor for, using a single query.
+
+    Parameters
+    ----------
+    queryset : `QuerySet`
+        `ExperimentSet`, `Experiment` or `ScoreSet` instances.
+    user : `User`, optional
+        The user viewing the instances.
+
+    Returns
+    -------
+    `QuerySet`
+    """
+    if user is None or user_is_anonymous(user):
+        return queryset.exclude(private=True)
+    return queryset.filter(
+        Q(private=False) | Q(pk__in=group_instance_pks(user, queryset.model))
+    )
 
 
 # Group construction
@@ -214,6 +269,38 @@ def delete_all_groups_for_instance(instance):
         return admin_name, author_name, viewer_name
 
 
+def delete_all_groups_for_instances(instances):
+    """
+    Deletes the admin, editor and viewer groups of each instance in
+    `instances` with a single query, instead of three lookups and deletes
+    per instance. Each instance is marked with `groups_deleted` so that
+    the pre_delete receivers of the dataset models skip it.
+
+    Parameters
+    ----------
+    instances : Iterable
+        `ExperimentSet`, `Experiment` or `ScoreSet` instances.
+
+    Returns
+    -------
+    int
+        The number of deleted groups.
+    """
+    names = []
+    for instance in instances:
+        if valid_model_instance(instance):
+            names += [
+                get_admin_group_name_for_instance(instance),
+                get_editor_group_name_for_instance(instance),
+                get_viewer_group_name_for_instance(instance),
+            ]
+            instance.groups_deleted = True
+    if not names:
+        return 0
+    _, deleted = Group.objects.filter(name__in=names).delete()
+    return deleted.get(Group._meta.label, 0)
+
+
 # User assignment
 # --------------------------------------------------------------------------- #
 # Notes: A user should only be assigned to one group at any single time.
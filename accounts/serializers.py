@@ -2,6 +2,8 @@ from rest_framework import serializers
 
 from django.contrib.auth import get_user_model
 
+from .permission_cache import is_contributor
+
 User = get_user_model()
 
 
@@ -36,7 +38,7 @@ class UserSerializer(serializers.ModelSerializer):
         return [
             i.urn
             for i in getattr(obj.profile, attr)()
-            if (not i.private) or (i.private and user in i.contributors)
+            if (not i.private) or (i.private and is_contributor(user, i))
         ]
 
     def get_experimentsets(self, obj):
@@ -0,0 +1,111 @@
+from django.contrib.auth.models import AnonymousUser
+from django.test import TestCase
+
+from dataset.factories import ExperimentFactory, ScoreSetFactory
+
+from ..factories import UserFactory
+from ..permissions import GroupTypes
+from .. import permission_cache
+
+
+class TestPermissionCache(TestCase):
+    def setUp(self):
+        self.instance = ExperimentFactory()
+        self.admin = UserFactory()
+        self.editor = UserFactory()
+        self.viewer = UserFactory()
+        self.outsider = UserFactory()
+        self.instance.add_administrators(self.admin)
+        self.instance.add_editors(self.editor)
+        self.instance.add_viewers(self.viewer)
+
+    def tearDown(self):
+        permission_cache.deactivate()
+
+    def test_is_contributor_queries_without_active_cache(self):
+        self.assertIsNone(permission_cache.get_permission_cache())
+        self.assertTrue(
+            permission_cache.is_contributor(self.viewer, self.instance)
+        )
+        self.assertFalse(
+            permission_cache.is_contributor(self.outsider, self.instance)
+        )
+        self.assertFalse(
+            permission_cache.is_contributor(None, self.instance)
+        )
+
+    def test_loads_group_names_once_per_user(self):
+        other = ScoreSetFactory()
+        other.add_viewers(self.editor)
+        with permission_cache.permission_cache():
+            with self.assertNumQueries(1):
+                for instance in (self.instance, other, self.instance):
+                    self.assertTrue(
+                        permission_cache.is_contributor(self.editor, instance)
+                    )
+
+    def test_anonymous_user_is_not_a_contributor(self):
+        with permission_cache.permission_cache():
+            with self.assertNumQueries(0):
+                self.assertFalse(
+                    permission_cache.is_contributor(
+                        AnonymousUser(), self.instance
+                    )
+                )
+
+    def test_has_group_type(self):
+        with permission_cache.permission_cache():
+            for user, expected in (
+                (self.admin, True),
+                (self.editor, True),
+                (self.viewer, False),
+                (self.outsider, False),
+            ):
+                can_edit = permission_cache.has_group_type(
+                    user, self.instance, GroupTypes.ADMIN, GroupTypes.EDITOR
+                )
+                self.assertEqual(can_edit, expected)
+
+    def test_prefetch_loads_members_of_all_instances_in_one_query(self):
+        other = ScoreSetFactory()
+        other.add_administrators(self.outsider)
+        with permission_cache.permission_cache():
+            with self.assertNumQueries(1):
+                permission_cache.prefetch_contributors([self.instance, other])
+                self.assertListEqual(
+                    permission_cache.get_contributors(self.instance),
+                    [self.admin, self.editor, self.viewer],
+                )
+                self.assertListEqual(
+                    permission_cache.get_members(other, GroupTypes.ADMIN),
+                    [self.outsider],
+                )
+
+    def test_matches_uncached_contributors(self):
+        expected = set(self.instance.contributors)
+        with permission_cache.permission_cache():
+            self.assertSetEqual(
+                set(permission_cache.get_contributors(self.instance)),
+                expected,
+            )
+
+    def test_group_changes_clear_the_cache(self):
+        with permission_cache.permission_cache():
+            self.assertFalse(
+                permission_cache.is_contributor(self.outsider, self.instance)
+            )
+            self.instance.add_viewers(self.outsider)
+            self.assertTrue(
+                permission_cache.is_contributor(self.outsider, self.instance)
+            )
+            self.assertIn(
+                self.outsider,
+                permission_cache.get_members(self.instance, GroupTypes.VIEWER),
+            )
+
+    def test_nested_blocks_reuse_the_active_cache(self):
+        with permission_cache.permission_cache() as outer:
+            with permission_cache.permission_cache() as inner:
+                self.assertIs(outer, inner)
+            self.assertIs(permission_cache.get_permission_cache(), outer)
+        self.assertIsNone(permission_cache.get_permission_cache())
@@ -149,6 +149,37 @@ class UtilitiesTest(TestCase):
         )
         self.assertEqual(result.count(), 0)
 
+    def test_group_instance_pks_ignores_groups_of_other_models(self):
+        self.exps.add_viewers(self.user1)
+        pks = permissions.group_instance_pks(self.user1, Experiment)
+        self.assertEqual(list(pks), [])
+        pks = permissions.group_instance_pks(self.user1, ExperimentSet)
+        self.assertEqual([p["instance_pk"] for p in pks], [self.exps.pk])
+
+    def test_group_instance_pks_accepts_user_queryset(self):
+        self.exps.add_viewers(self.user1)
+        self.exp.add_editors(self.user2)
+        users = User.objects.filter(pk__in=[self.user1.pk, self.user2.pk])
+        result = Experiment.objects.filter(
+            pk__in=permissions.group_instance_pks(users, Experiment)
+        )
+        self.assertEqual(list(result), [self.exp])
+
+    def test_visible_to_user_includes_public_and_contributor_instances(self):
+        public = ds_factories.ExperimentFactory(private=False)
+        private = ds_factories.ExperimentFactory(private=True)
+        self.exp.add_viewers(self.user1)
+
+        result = permissions.visible_to_user(
+            Experiment.objects.all(), self.user1
+        )
+        self.assertIn(public, result)
+        self.assertIn(self.exp, result)
+        self.assertNotIn(private, result)
+
+        result = permissions.visible_to_user(Experiment.objects.all())
+        self.assertEqual(list(result), [public])
+
 
 class GroupConstructionTest(TestCase):
     # Mute pre/post save the signals so we don't create the groups
@@ -251,6 +282,15 @@ class GroupDeletionTest(TestCase):
         permissions.delete_all_groups_for_instance(self.instance)
         self.assertEqual(Group.objects.count(), 0)
 
+    def test_can_delete_all_groups_for_instances(self):
+        other = ExperimentSet.objects.create()
+        self.assertEqual(Group.objects.count(), 6)
+        n_deleted = permissions.delete_all_groups_for_instances(
+            [self.instance, other]
+        )
+        self.assertEqual(n_deleted, 6)
+        self.assertEqual(Group.objects.count(), 0)
+
 
 class UserAssignmentToInstanceGroupTest(TestCase):
     @factory.django.mute_signals(signals.pre_save, signals.post_save)
@@ -3,3 +3,11 @@ from django.apps import AppConfig
 
 class ApiConfig(AppConfig):
     name = "api"
+
+    def ready(self):
+        from django.core import checks
+
+        from .caching import check_shared_cache, connect_signals
+
+        checks.register(check_shared_cache, checks.Tags.caches)
+        connect_signals()
@@ -0,0 +1,291 @@
+"""
+Pre-rendered CSV downloads for published score sets.
+
+Published score sets do not change, so their scores and counts CSVs are
+rendered once into `settings.DOWNLOAD_ARTIFACT_DIR` and served from disk
+instead of being formatted from the variant table on every request.
+
+Files for a score set are stored under a directory keyed by its urn and
+modification date. The variant rows are kept separately from the comment
+header, so that a changed licence or data usage policy only rewrites the
+header and not the rows. Since the files outlive the request that rendered
+them, their header does not state a download time.
+"""
+import glob
+import gzip
+import hashlib
+import json
+import os
+import re
+import shutil
+import tempfile
+from typing import Iterable, List, Optional, Tuple
+
+from django.conf import settings
+from django.http import FileResponse, HttpResponse
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.http import http_date, quote_etag
+
+DTYPES = ("scores", "counts")
+RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+# Bump when the lines written by `format_header` change, so that headers
+# rendered by earlier versions are replaced.
+HEADER_VERSION = 2
+
+
+def is_cacheable(scoreset) -> bool:
+    return (not scoreset.private) and scoreset.has_public_urn
+
+
+def artifact_directory(scoreset) -> str:
+    urn_key = hashlib.sha256(scoreset.urn.encode()).hexdigest()
+    return os.path.join(
+        settings.DOWNLOAD_ARTIFACT_DIR,
+        urn_key,
+        scoreset.modification_date.isoformat(),
+    )
+
+
+def header_digest(scoreset) -> str:
+    """Digest of the fields written to the comment header of a download."""
+    key = json.dumps(
+        [
+            HEADER_VERSION,
+            scoreset.licence.long_name,
+            scoreset.licence.link,
+            scoreset.data_usage_policy,
+        ]
+    )
+    return hashlib.sha256(key.encode()).hexdigest()[:16]
+
+
+def artifact_path(scoreset, dtype, gzipped=False) -> str:
+    name = "{}-{}.csv".format(dtype, header_digest(scoreset))
+    if gzipped:
+        name += ".gz"
+    return os.path.join(artifact_directory(scoreset), name)
+
+
+def render_download_artifacts(scoreset, force=False) -> List[str]:
+    """
+    Renders the scores and counts CSV downloads of a published scoreset.
+    Variant rows are only rendered if they have not been rendered for the
+    current modification date of `scoreset`, and the header is only
+    rendered if the licence or data usage policy has changed. Files for
+    earlier modification dates or headers are removed.
+
+    Parameters
+    ----------
+    scoreset : `dataset.models.scoreset.ScoreSet`
+        A public scoreset.
+    force : bool
+        Render all files even if they exist.
+
+    Returns
+    -------
+    list[str]
+        Paths of the files that were written.
+    """
+    # Imported here since the views import this module.
+    from .views import download_columns, format_header, stream_csv_rows
+
+    if not is_cacheable(scoreset):
+        raise ValueError(
+            "Cannot render downloads for {} since it is not public.".format(
+                scoreset.urn
+            )
+        )
+
+    directory = artifact_directory(scoreset)
+    os.makedirs(directory, exist_ok=True)
+    for stale in glob.glob(os.path.join(os.path.dirname(directory), "*")):
+        if stale != directory:
+            shutil.rmtree(stale, ignore_errors=True)
+
+    written = []
+    for dtype in DTYPES:
+        rows_path = os.path.join(directory, "{}.rows".format(dtype))
+        if force or not os.path.exists(rows_path):
+            columns, type_column = download_columns(scoreset, dtype)
+            rows = stream_csv_rows(scoreset, columns, dtype=type_column)
+            _write_file(rows_path, (chunk.encode() for chunk in rows))
+            written.append(rows_path)
+
+        path = artifact_path(scoreset, dtype)
+        gzip_path = artifact_path(scoreset, dtype, gzipped=True)
+        if force or not os.path.exists(path):
+            header = format_header(scoreset, download_time=False)
+            header = "".join(header).encode()
+            _write_file(path, _concat_file(header, rows_path))
+            written.append(path)
+        if settings.DOWNLOAD_ARTIFACT_GZIP and (
+            force or not os.path.exists(gzip_path)
+        ):
+            _write_file(gzip_path, _concat_file(b"", path), compress=True)
+            written.append(gzip_path)
+
+        for stale in glob.glob(os.path.join(directory, dtype + "-*.csv*")):
+            if stale not in (path, gzip_path):
+                os.remove(stale)
+
+    return written
+
+
+def artifact_response(request, scoreset, dtype) -> Optional[HttpResponse]:
+    """
+    Serves the pre-rendered download of `scoreset` with ETag and
+    Last-Modified validators and single byte range support. The gzipped
+    file is served to clients accepting gzip when it has been rendered.
+
+    Returns
+    -------
+    `HttpResponse`, optional
+        None if the scoreset is not public or the download has not been
+        rendered.
+    """
+    if not is_cacheable(scoreset):
+        return None
+
+    path = artifact_path(scoreset, dtype)
+    encoding = None
+    if settings.DOWNLOAD_ARTIFACT_GZIP and "gzip" in request.META.get(
+        "HTTP_ACCEPT_ENCODING", ""
+    ):
+        gzip_path = artifact_path(scoreset, dtype, gzipped=True)
+        if os.path.exists(gzip_path):
+            path, encoding = gzip_path, "gzip"
+
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+
+    size = stat.st_size
+    last_modified = int(stat.st_mtime)
+    etag = quote_etag(
+        "{:x}-{:x}{}".format(last_modified, size, "-gz" if encoding else "")
+    )
+
+    response = get_conditional_response(
+        request, etag=etag, last_modified=last_modified
+    )
+    if response is None:
+        (start, length, status) = (0, size, 200)
+        if_range = request.META.get("HTTP_IF_RANGE", None)
+        if if_range is None or if_range == etag:
+            try:
+                byte_range = parse_byte_range(
+                    request.META.get("HTTP_RANGE", ""), size
+                )
+            except ValueError:
+                response = HttpResponse(status=416)
+                response["Content-Range"] = "bytes */{}".format(size)
+                return response
+            if byte_range is not None:
+                start, end = byte_range
+                (length, status) = (end - start + 1, 206)
+
+        fp = open(path, "rb")
+        fp.seek(start)
+        response = FileResponse(
+            FileRange(fp, length), status=status, content_type="text/csv"
+        )
+        response["Content-Length"] = str(length)
+        response["Content-Disposition"] = (
+            'attachment; filename="{}_{}.csv"'.format(scoreset.urn, dtype)
+        )
+        if status == 206:
+            response["Content-Range"] = "bytes {}-{}/{}".format(
+                start, start + length - 1, size
+            )
+        if encoding:
+            response["Content-Encoding"] = encoding
+
+    response["ETag"] = etag
+    response["Last-Modified"] = http_date(last_modified)
+    response["Accept-Ranges"] = "bytes"
+    if settings.DOWNLOAD_ARTIFACT_GZIP:
+        patch_vary_headers(response, ("Accept-Encoding",))
+    return response
+
+
+def parse_byte_range(header, size) -> Optional[Tuple[int, int]]:
+    """
+    Parses a `Range` header holding a single byte range.
+
+    Returns
+    -------
+    tuple[int, int], optional
+        Inclusive first and last byte positions, or None if `header` is
+        not a single byte range and should be ignored.
+
+    Raises
+    ------
+    ValueError
+        The range cannot be satisfied for a file of `size` bytes.
+    """
+    match = RANGE_RE.match(header.strip())
+    if match is None:
+        return None
+    first, last = match.groups()
+    if not first and not last:
+        return None
+
+    if not first:
+        # Suffix range with the last N bytes.
+        if int(last) == 0:
+            raise ValueError("Empty suffix range.")
+        return max(size - int(last), 0), size - 1
+
+    start = int(first)
+    if last and int(last) < start:
+        return None
+    end = size - 1 if not last else min(int(last), size - 1)
+    if start >= size:
+        raise ValueError("Range starts after the end of the file.")
+    return start, end
+
+
+class FileRange:
+    """File-like object reading at most `length` bytes from `fp`."""
+
+    def __init__(self, fp, length):
+        self.fp = fp
+        self.remaining = length
+
+    def read(self, size=-1):
+        if size < 0 or size > self.remaining:
+            size = self.remaining
+        data = self.fp.read(size) if size else b""
+        self.remaining -= len(data)
+        return data
+
+    def close(self):
+        self.fp.close()
+
+
+def _concat_file(head: bytes, path: str) -> Iterable[bytes]:
+    yield head
+    with open(path, "rb") as fp:
+        for block in iter(lambda: fp.read(64 * 1024), b""):
+            yield block
+
+
+def _write_file(path: str, chunks: Iterable[bytes], compress=False):
+    # Write to a temporary file first so readers never see partial files.
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+    try:
+        with open(fd, "wb") as fp:
+            if compress:
+                with gzip.GzipFile(fileobj=fp, mode="wb") as gz:
+                    for chunk in chunks:
+                        gz.write(chunk)
+            else:
+                for chunk in chunks:
+                    fp.write(chunk)
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except Exception:
+        os.remove(tmp_path)
+        raise
@@ -0,0 +1,305 @@
+"""
+Response cache for anonymous reads of the public API.
+
+Responses to unauthenticated ``GET`` requests are stored in the default
+cache, keyed by the request path, the normalised query parameters, the
+``Accept`` header and the current generation of each tag the view depends
+on. Saving or deleting a model replaces the generations of the tags it can
+affect, so stale entries are never read again and expire with
+`settings.API_CACHE_TTL`.
+
+Generations are plain cache entries, so any backend shared by the web
+processes and the Celery workers works, including the file based backend.
+Per-process backends are rejected by `check_shared_cache`, since
+invalidations made by a worker would not reach the web processes.
+"""
+import hashlib
+import json
+import uuid
+from functools import wraps
+from typing import Callable, Dict, Iterable, List, Tuple, Union
+
+from django.conf import settings
+from django.core import checks
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.http import HttpResponse
+
+DATASETS = "datasets"
+TARGETS = "targets"
+METADATA = "metadata"
+
+CACHEABLE_CONTENT_TYPES = ("application/json",)
+
+# Tags invalidated by the signals of each sender, populated by
+# `connect_signals`.
+_sender_tags: Dict[type, Tuple[str, ...]] = {}
+
+
+# Backend holding a separate cache in every process.
+LOCMEM_BACKEND = "django.core.cache.backends.locmem.LocMemCache"
+
+
+def check_shared_cache(app_configs=None, **kwargs):
+    """
+    System check rejecting a per-process default cache when Celery tasks,
+    which invalidate cached responses, run in separate worker processes.
+    """
+    backend = settings.CACHES["default"]["BACKEND"]
+    if backend != LOCMEM_BACKEND or getattr(
+        settings, "CELERY_TASK_ALWAYS_EAGER", False
+    ):
+        return []
+    return [
+        checks.Error(
+            "The default cache backend {} is not shared with the Celery "
+            "workers, so their invalidations would not reach the web "
+            "processes.".format(backend),
+            hint="Set APP_CACHE_BACKEND to a shared backend such as "
+            "FileBasedCache, DatabaseCache or memcached.",
+            id="api.E001",
+        )
+    ]
+
+
+def dataset_tag(urn) -> str:
+    """Tag of the responses that only depend on the dataset `urn`."""
+    return "dataset:{}".format(urn)
+
+
+def generation_key(tag) -> str:
+    return "api:generation:{}".format(tag)
+
+
+def get_generations(tags: Iterable[str]) -> List[str]:
+    """
+    Returns the current generation of each tag in `tags`, starting a new
+    generation for tags without one.
+    """
+    keys = {tag: generation_key(tag) for tag in sorted(set(tags))}
+    found = cache.get_many(list(keys.values()))
+    generations = []
+    for tag, key in keys.items():
+        generation = found.get(key)
+        if generation is None:
+            generation = uuid.uuid4().hex
+            # Another request may have started the generation first.
+            cache.add(key, generation, timeout=None)
+            generation = cache.get(key, generation)
+        generations.append(generation)
+    return generations
+
+
+def invalidate(*tags):
+    """
+    Discards the cached responses of `tags`, again once the current
+    transaction commits so that responses rendered from uncommitted data
+    are not served.
+    """
+    keys = [generation_key(tag) for tag in tags]
+    cache.delete_many(keys)
+    transaction.on_commit(lambda: cache.delete_many(keys))
+
+
+def normalise_query_params(request) -> List[Tuple[str, List[str]]]:
+    """
+    Returns the query parameters of `request` sorted by name, omitting
+    empty values.
+    """
+    params = []
+    for name in sorted(request.GET):
+        values = [v for v in request.GET.getlist(name) if v != ""]
+        if values:
+            params.append((name, values))
+    return params
+
+
+def response_cache_key(request, tags: Iterable[str]) -> str:
+    key = json.dumps(
+        [
+            request.path,
+            normalise_query_params(request),
+            request.META.get("HTTP_ACCEPT", ""),
+            get_generations(tags),
+        ]
+    )
+    return "api:response:{}".format(hashlib.sha256(key.encode()).hexdigest())
+
+
+def is_cacheable_request(request) -> bool:
+    user = getattr(request, "user", None)
+    return (
+        settings.API_CACHE_TTL > 0
+        and request.method == "GET"
+        and not request.META.get("HTTP_AUTHORIZATION")
+        and not (user is not None and user.is_authenticated)
+    )
+
+
+def is_cacheable_response(response) -> bool:
+    content_type = response.get("Content-Type", "").split(";")[0].strip()
+    return (
+        response.status_code == 200
+        and not response.streaming
+        and not response.cookies
+        and content_type in CACHEABLE_CONTENT_TYPES
+    )
+
+
+def cached_response(request, tags: Iterable[str], get_response: Callable):
+    """
+    Returns the cached response to `request` if one exists, otherwise calls
+    `get_response` and caches its response when cacheable.
+
+    Parameters
+    ----------
+    request : HttpRequest
+        The incoming request.
+    tags : Iterable[str]
+        Tags of the data the response is rendered from.
+    get_response : Callable
+        Renders the response on a cache miss.
+
+    Returns
+    -------
+    HttpResponse
+    """
+    if not is_cacheable_request(request):
+        return get_response()
+
+    key = response_cache_key(request, tags)
+    entry = cache.get(key)
+    if entry is not None:
+        content, headers = entry
+        response = HttpResponse(content)
+        for header, value in headers:
+            response[header] = value
+        return response
+
+    response = get_response()
+    if not getattr(response, "is_rendered", True):
+        response.render()
+    if is_cacheable_response(response):
+        headers = [(h, v) for h, v in response.items()]
+        cache.set(
+            key, (response.content, headers), timeout=settings.API_CACHE_TTL
+        )
+    return response
+
+
+def cache_anonymous_response(tags: Union[Iterable[str], Callable]):
+    """
+    Caches the anonymous responses of a function based view. `tags` may be
+    a callable receiving the view's keyword arguments.
+    """
+
+    def decorator(view):
+        @wraps(view)
+        def wrapper(request, *args, **kwargs):
+            view_tags = tags(**kwargs) if callable(tags) else tags
+            return cached_response(
+                request, view_tags, lambda: view(request, *args, **kwargs)
+            )
+
+        return wrapper
+
+    return decorator
+
+
+class AnonymousCacheMixin:
+    """
+    Caches the anonymous responses of a viewset under `cache_tags`. Cached
+    responses are served before authentication and throttling run.
+    """
+
+    cache_tags: Tuple[str, ...] = ()
+
+    def dispatch(self, request, *args, **kwargs):
+        return cached_response(
+            request,
+            self.cache_tags,
+            lambda: super(AnonymousCacheMixin, self).dispatch(
+                request, *args, **kwargs
+            ),
+        )
+
+
+def invalidate_for_sender(sender=None, instance=None, **kwargs):
+    """Invalidates the tags registered for `sender`."""
+    if not kwargs.get("action", "post_").startswith("post_"):
+        return
+    tags = list(_sender_tags.get(sender, ()))
+    urn = getattr(instance, "urn", None)
+    if urn and DATASETS in tags:
+        tags.append(dataset_tag(urn))
+    if tags:
+        invalidate(*tags)
+
+
+def register(models, tags):
+    for model in models:
+        _sender_tags[model] = tuple(tags)
+        post_save.connect(invalidate_for_sender, sender=model)
+        post_delete.connect(invalidate_for_sender, sender=model)
+
+
+def register_m2m(through_models, tags):
+    for through in through_models:
+        _sender_tags[through] = tuple(tags)
+        m2m_changed.connect(invalidate_for_sender, sender=through)
+
+
+def connect_signals():
+    from django.contrib.auth import get_user_model
+    from django.contrib.auth.models import Group
+
+    from dataset.models.experiment import Experiment
+    from dataset.models.experimentset import ExperimentSet
+    from dataset.models.scoreset import ScoreSet
+    from genome import models as genome_models
+    from main.models import Licence
+    from metadata import models as meta_models
+
+    datasets = (ExperimentSet, Experiment, ScoreSet)
+    # Target genes are only listed while their score set is public.
+    register(datasets, (DATASETS, TARGETS))
+    register_m2m(
+        [
+            getattr(model, field).through
+            for model in datasets
+            for field in ("keywords", "sra_ids", "doi_ids", "pubmed_ids")
+        ]
+        + [ScoreSet.meta_analysis_for.through],
+        (DATASETS,),
+    )
+    # Score sets embed their target, which embeds its reference maps,
+    # genomes, sequence and offsets.
+    register(
+        (
+            genome_models.TargetGene,
+            genome_models.ReferenceMap,
+            genome_models.ReferenceGenome,
+            genome_models.WildTypeSequence,
+            meta_models.UniprotOffset,
+            meta_models.RefseqOffset,
+            meta_models.EnsemblOffset,
+        ),
+        (DATASETS, TARGETS),
+    )
+    register(
+        (
+            meta_models.Keyword,
+            meta_models.SraIdentifier,
+            meta_models.DoiIdentifier,
+            meta_models.PubmedIdentifier,
+            meta_models.GenomeIdentifier,
+            meta_models.RefseqIdentifier,
+            meta_models.EnsemblIdentifier,
+            meta_models.UniprotIdentifier,
+        ),
+        (DATASETS, TARGETS, METADATA),
+    )
+    # Contributors are listed on every dataset.
+    register((Licence, Group), (DATASETS,))
+    register_m2m((get_user_model().groups.through,), (DATASETS,))
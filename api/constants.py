@@ -1,3 +0,0 @@
-# We should set up a periodic celery job to clear out files here
-# by oldest modified date or something later.
-BASE_RESULTS_DIR = '/tmp/results'
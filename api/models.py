@@ -1,3 +1,71 @@
+import datetime
+import uuid
+
+from django.conf import settings
 from django.db import models
+from django.utils import timezone
+
+
+class ResultJob(models.Model):
+    """
+    A result generated asynchronously for an API request too large to serve
+    inline. The result itself is stored as a zip archive by
+    :mod:`api.results`.
+
+    Attributes
+    ----------
+    uuid : `UUID`
+        Public identifier of the result.
+    state : str
+        One of `PENDING`, `RUNNING`, `READY` or `FAILED`.
+    expiry_date : `datetime`
+        When the result and its archive are evicted.
+    size : int
+        Size of the archive in bytes once ready.
+    error : str
+        Reason the job failed, if it did.
+    """
+
+    PENDING = "pending"
+    RUNNING = "running"
+    READY = "ready"
+    FAILED = "failed"
+    STATES = (PENDING, RUNNING, READY, FAILED)
+
+    class Meta:
+        verbose_name = "Result job"
+        verbose_name_plural = "Result jobs"
+        ordering = ["-creation_date"]
+
+    uuid = models.UUIDField(default=uuid.uuid4, unique=True, editable=False)
+    state = models.CharField(
+        max_length=8,
+        choices=[(state, state.capitalize()) for state in STATES],
+        default=PENDING,
+    )
+    creation_date = models.DateTimeField(auto_now_add=True)
+    modification_date = models.DateTimeField(auto_now=True)
+    expiry_date = models.DateTimeField(db_index=True)
+    size = models.BigIntegerField(default=0)
+    error = models.TextField(blank=True, default="")
+
+    def __str__(self):
+        return "{} ({})".format(self.uuid, self.state)
+
+    def save(self, *args, **kwargs):
+        if self.expiry_date is None:
+            self.reset_expiry()
+        return super().save(*args, **kwargs)
+
+    def reset_expiry(self):
+        self.expiry_date = timezone.now() + datetime.timedelta(
+            seconds=settings.API_RESULTS_TTL
+        )
+
+    @property
+    def is_expired(self) -> bool:
+        return self.expiry_date <= timezone.now()
 
-# Create your models here.
+    @property
+    def is_ready(self) -> bool:
+        return self.state == self.READY
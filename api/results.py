@@ -0,0 +1,202 @@
+"""
+Store of results generated asynchronously for API requests too large to
+serve inline.
+
+Each result is tracked by a :class:`api.models.ResultJob` and written as a
+zip archive named by the job's uuid under `settings.API_RESULTS_DIR`.
+Archives are streamed to a temporary file and renamed once complete, so a
+result is either missing or whole.
+
+A result may hold at most `settings.API_RESULTS_MAX_SIZE` bytes before
+compression. Results expire `settings.API_RESULTS_TTL` seconds after they
+are ready, and the oldest results are evicted early when the archives
+exceed `settings.API_RESULTS_MAX_TOTAL_SIZE` bytes. `evict_results` is run
+periodically by Celery beat.
+"""
+import os
+import tempfile
+import time
+import zipfile
+from typing import Iterable, Optional
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db.models import Sum
+from django.utils import timezone
+
+from .models import ResultJob
+
+PARTIAL_SUFFIX = ".part"
+
+
+class ResultTooLarge(Exception):
+    """Raised when a result exceeds `settings.API_RESULTS_MAX_SIZE`."""
+
+
+def result_path(results_uuid) -> str:
+    return os.path.join(
+        settings.API_RESULTS_DIR, "{}.zip".format(results_uuid)
+    )
+
+
+def get_job(results_uuid) -> Optional[ResultJob]:
+    """
+    Returns the unexpired job with uuid `results_uuid`, or `None` if there
+    is none or `results_uuid` is not a valid uuid.
+    """
+    try:
+        return ResultJob.objects.filter(
+            uuid=results_uuid, expiry_date__gt=timezone.now()
+        ).first()
+    except (ValidationError, ValueError):
+        return None
+
+
+def write_zip(path, arcname, chunks: Iterable[str], max_size=None) -> int:
+    """
+    Streams `chunks` into the member `arcname` of a new zip archive at
+    `path`.
+
+    Parameters
+    ----------
+    path : str
+        Path of the archive, replaced once it is complete.
+    arcname : str
+        Name of the single file in the archive.
+    chunks : Iterable[str]
+        Contents of the file.
+    max_size : int, optional
+        Largest number of bytes the file may hold before compression.
+
+    Raises
+    ------
+    ResultTooLarge : The file would exceed `max_size`.
+
+    Returns
+    -------
+    int
+        The size of the archive in bytes.
+    """
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, partial_path = tempfile.mkstemp(dir=directory, suffix=PARTIAL_SUFFIX)
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            with zipfile.ZipFile(
+                handle, "w", compression=zipfile.ZIP_DEFLATED
+            ) as archive:
+                with archive.open(arcname, "w", force_zip64=True) as member:
+                    written = 0
+                    for chunk in chunks:
+                        data = chunk.encode()
+                        written += len(data)
+                        if max_size and written > max_size:
+                            raise ResultTooLarge(
+                                "The result exceeds the limit of {} "
+                                "bytes. Request fewer variants.".format(
+                                    max_size
+                                )
+                            )
+                        member.write(data)
+        os.replace(partial_path, path)
+    except BaseException:
+        remove_file(partial_path)
+        raise
+    return os.path.getsize(path)
+
+
+def run_job(job: ResultJob, arcname, chunks: Iterable[str]) -> ResultJob:
+    """
+    Writes the result of `job` from `chunks`, recording its state as it
+    runs. Errors other than `ResultTooLarge` are re-raised after the job is
+    marked as failed.
+    """
+    job.state = ResultJob.RUNNING
+    job.save()
+    try:
+        job.size = write_zip(
+            result_path(job.uuid),
+            arcname,
+            chunks,
+            max_size=settings.API_RESULTS_MAX_SIZE,
+        )
+    except ResultTooLarge as e:
+        job.state, job.error = ResultJob.FAILED, str(e)
+    except Exception:
+        job.state = ResultJob.FAILED
+        job.error = "Something went wrong. Please try again."
+        job.save()
+        raise
+    else:
+        job.state = ResultJob.READY
+        job.reset_expiry()
+    job.save()
+    if job.is_ready:
+        enforce_total_size()
+    return job
+
+
+def remove_file(path):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def evict_jobs(jobs) -> int:
+    """Deletes `jobs` and their archives."""
+    jobs = list(jobs)
+    for job in jobs:
+        remove_file(result_path(job.uuid))
+    ResultJob.objects.filter(pk__in=[job.pk for job in jobs]).delete()
+    return len(jobs)
+
+
+def enforce_total_size() -> int:
+    """
+    Evicts the oldest ready results until the archives fit within
+    `settings.API_RESULTS_MAX_TOTAL_SIZE`. Returns the number evicted.
+    """
+    ready = ResultJob.objects.filter(state=ResultJob.READY)
+    total = ready.aggregate(total=Sum("size"))["total"] or 0
+    excess = total - settings.API_RESULTS_MAX_TOTAL_SIZE
+    if excess <= 0:
+        return 0
+
+    evicted = []
+    for job in ready.order_by("modification_date", "pk"):
+        if excess <= 0:
+            break
+        evicted.append(job)
+        excess -= job.size
+    return evict_jobs(evicted)
+
+
+def evict_results() -> int:
+    """
+    Evicts expired results and results over the size quota, and removes
+    files left in `settings.API_RESULTS_DIR` that no job owns, such as
+    partial archives of interrupted jobs. Returns the number of results
+    evicted.
+    """
+    evicted = evict_jobs(
+        ResultJob.objects.filter(expiry_date__lte=timezone.now())
+    )
+    evicted += enforce_total_size()
+
+    directory = settings.API_RESULTS_DIR
+    if not os.path.isdir(directory):
+        return evicted
+    known = {
+        os.path.basename(result_path(uuid))
+        for uuid in ResultJob.objects.values_list("uuid", flat=True)
+    }
+    cutoff = time.time() - settings.API_RESULTS_TTL
+    for entry in os.scandir(directory):
+        if (
+            entry.is_file()
+            and entry.name not in known
+            and entry.stat().st_mtime < cutoff
+        ):
+            remove_file(entry.path)
+    return evicted
@@ -0,0 +1,129 @@
+import os
+import shutil
+import tempfile
+
+from django.test import TestCase, RequestFactory, override_settings
+
+import dataset.constants as constants
+from dataset.factories import ScoreSetFactory
+from dataset.utilities import publish_dataset
+from variant.factories import VariantFactory
+
+from .. import artifacts
+
+
+class TestDownloadArtifacts(TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.settings = override_settings(
+            DOWNLOAD_ARTIFACT_DIR=self.directory
+        )
+        self.settings.enable()
+        self.factory = RequestFactory()
+        self.scoreset = publish_dataset(ScoreSetFactory())
+        self.scoreset.dataset_columns = {
+            constants.score_columns: ["score"],
+            constants.count_columns: [],
+        }
+        self.scoreset.save()
+        for _ in range(3):
+            VariantFactory(scoreset=self.scoreset)
+
+    def tearDown(self):
+        self.settings.disable()
+        shutil.rmtree(self.directory)
+
+    def get(self, **headers):
+        request = self.factory.get("/", **headers)
+        return artifacts.artifact_response(request, self.scoreset, "scores")
+
+    def test_renders_header_and_rows(self):
+        artifacts.render_download_artifacts(self.scoreset)
+        path = artifacts.artifact_path(self.scoreset, "scores")
+        with open(path, "rt") as fp:
+            lines = fp.read().splitlines()
+        self.assertEqual(lines[0], "# Accession: {}".format(self.scoreset.urn))
+        self.assertEqual(len([l for l in lines if not l.startswith("#")]), 4)
+
+    def test_rendered_header_has_no_download_time(self):
+        artifacts.render_download_artifacts(self.scoreset)
+        path = artifacts.artifact_path(self.scoreset, "scores")
+        with open(path, "rt") as fp:
+            self.assertNotIn("# Downloaded (UTC):", fp.read())
+
+    def test_only_rerenders_header_when_policy_changes(self):
+        artifacts.render_download_artifacts(self.scoreset)
+        old_path = artifacts.artifact_path(self.scoreset, "scores")
+        self.scoreset.data_usage_policy = "Use freely."
+
+        written = artifacts.render_download_artifacts(self.scoreset)
+        new_path = artifacts.artifact_path(self.scoreset, "scores")
+        self.assertIn(new_path, written)
+        self.assertFalse(any(p.endswith(".rows") for p in written))
+        self.assertFalse(os.path.exists(old_path))
+
+    def test_raises_value_error_for_private_scoreset(self):
+        with self.assertRaises(ValueError):
+            artifacts.render_download_artifacts(ScoreSetFactory())
+
+    def test_returns_none_when_not_rendered(self):
+        self.assertIsNone(self.get())
+
+    def test_serves_rendered_file_with_validators(self):
+        artifacts.render_download_artifacts(self.scoreset)
+        response = self.get()
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("ETag", response)
+        self.assertIn("Last-Modified", response)
+        content = b"".join(response.streaming_content)
+        path = artifacts.artifact_path(self.scoreset, "scores")
+        with open(path, "rb") as fp:
+            self.assertEqual(content, fp.read())
+
+    def test_not_modified_when_etag_matches(self):
+        artifacts.render_download_artifacts(self.scoreset)
+        etag = self.get()["ETag"]
+        response = self.get(HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+    def test_serves_byte_range(self):
+        artifacts.render_download_artifacts(self.scoreset)
+        response = self.get(HTTP_RANGE="bytes=2-11")
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(b"".join(response.streaming_content), b"Accession:")
+        self.assertTrue(response["Content-Range"].startswith("bytes 2-11/"))
+
+    def test_unsatisfiable_range_returns_416(self):
+        artifacts.render_download_artifacts(self.scoreset)
+        response = self.get(HTTP_RANGE="bytes=100000000-")
+        self.assertEqual(response.status_code, 416)
+
+    @override_settings(DOWNLOAD_ARTIFACT_GZIP=True)
+    def test_serves_gzip_when_accepted(self):
+        artifacts.render_download_artifacts(self.scoreset)
+        response = self.get(HTTP_ACCEPT_ENCODING="gzip, deflate")
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        response = self.get()
+        self.assertNotIn("Content-Encoding", response)
+
+
+class TestParseByteRange(TestCase):
+    def test_parses_closed_range(self):
+        self.assertEqual(artifacts.parse_byte_range("bytes=0-9", 100), (0, 9))
+
+    def test_parses_open_range(self):
+        self.assertEqual(
+            artifacts.parse_byte_range("bytes=90-", 100), (90, 99)
+        )
+
+    def test_parses_suffix_range(self):
+        self.assertEqual(
+            artifacts.parse_byte_range("bytes=-10", 100), (90, 99)
+        )
+
+    def test_ignores_multiple_ranges(self):
+        self.assertIsNone(artifacts.parse_byte_range("bytes=0-1,5-6", 100))
+
+    def test_raises_value_error_past_end_of_file(self):
+        with self.assertRaises(ValueError):
+            artifacts.parse_byte_range("bytes=100-", 100)
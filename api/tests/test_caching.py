@@ -0,0 +1,119 @@
+import json
+
+from django.contrib.auth.models import AnonymousUser
+from django.core.cache import cache
+from django.test import TestCase, RequestFactory, override_settings
+
+from accounts.factories import UserFactory
+from dataset import utilities
+from dataset.factories import ScoreSetWithTargetFactory
+from metadata.factories import KeywordFactory
+
+from .. import caching, views
+
+
+LOCMEM_CACHE = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+}
+
+
+@override_settings(CACHES=LOCMEM_CACHE, API_CACHE_TTL=60)
+class TestAnonymousResponseCache(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.factory = RequestFactory()
+        self.list_view = views.ScoreSetViewset.as_view({"get": "list"})
+        self.keyword_view = views.KeywordViewSet.as_view({"get": "list"})
+
+    def tearDown(self):
+        cache.clear()
+
+    def get(self, view, path="/api/scoresets/", user=None, **kwargs):
+        request = self.factory.get(path, **kwargs)
+        request.user = user or AnonymousUser()
+        return view(request)
+
+    def urns(self, response):
+        return sorted(row["urn"] for row in json.loads(response.content))
+
+    def test_serves_cached_anonymous_response(self):
+        ScoreSetWithTargetFactory(private=False)
+        first = self.get(self.list_view)
+        with self.assertNumQueries(0):
+            second = self.get(self.list_view)
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(first.content, second.content)
+        self.assertEqual(second["Content-Type"], first["Content-Type"])
+
+    def test_does_not_cache_authenticated_requests(self):
+        user = UserFactory()
+        token, _ = user.profile.generate_token()
+        self.get(self.list_view, user=user)
+        self.get(self.list_view, HTTP_AUTHORIZATION=token)
+        instance = ScoreSetWithTargetFactory(private=True)
+        instance.add_viewers(user)
+        response = self.get(self.list_view, HTTP_AUTHORIZATION=token)
+        self.assertEqual(self.urns(response), [instance.urn])
+
+    def test_query_params_are_normalised(self):
+        self.get(self.list_view, data={"title": "a", "urn": "", "b": "c"})
+        with self.assertNumQueries(0):
+            self.get(self.list_view, data={"b": "c", "title": "a"})
+
+    def test_saving_a_dataset_invalidates_dataset_responses(self):
+        self.assertEqual(self.urns(self.get(self.list_view)), [])
+        instance = ScoreSetWithTargetFactory(private=True)
+        instance.private = False
+        instance.save()
+        self.assertEqual(self.urns(self.get(self.list_view)), [instance.urn])
+
+    def test_saving_a_dataset_keeps_metadata_responses(self):
+        self.get(self.keyword_view, path="/api/keyword/")
+        ScoreSetWithTargetFactory(private=False)
+        with self.assertNumQueries(0):
+            self.get(self.keyword_view, path="/api/keyword/")
+
+    def test_keyword_changes_invalidate_dataset_responses(self):
+        instance = ScoreSetWithTargetFactory(private=False)
+        self.get(self.list_view)
+        instance.keywords.add(KeywordFactory(text="cached"))
+        response = self.get(self.list_view)
+        keywords = json.loads(response.content)[0]["keywords"]
+        self.assertIn("cached", json.dumps(keywords))
+
+    def test_publish_invalidates_dataset_responses(self):
+        instance = ScoreSetWithTargetFactory(private=True)
+        self.assertEqual(self.urns(self.get(self.list_view)), [])
+        instance = utilities.publish_dataset(instance)
+        self.assertEqual(self.urns(self.get(self.list_view)), [instance.urn])
+
+    def test_does_not_cache_errors(self):
+        calls = []
+
+        def view(request):
+            calls.append(request)
+            return views.JsonResponse({}, status=404)
+
+        cached_view = caching.cache_anonymous_response(["tag"])(view)
+        for _ in range(2):
+            request = self.factory.get("/")
+            request.user = AnonymousUser()
+            cached_view(request)
+        self.assertEqual(len(calls), 2)
+
+    @override_settings(API_CACHE_TTL=0)
+    def test_disabled_with_zero_ttl(self):
+        request = self.factory.get("/")
+        request.user = AnonymousUser()
+        self.assertFalse(caching.is_cacheable_request(request))
+
+
+class TestCheckSharedCache(TestCase):
+    @override_settings(CACHES=LOCMEM_CACHE, CELERY_TASK_ALWAYS_EAGER=False)
+    def test_rejects_locmem_cache_with_celery_workers(self):
+        errors = caching.check_shared_cache()
+        self.assertListEqual([e.id for e in errors], ["api.E001"])
+
+    @override_settings(CACHES=LOCMEM_CACHE, CELERY_TASK_ALWAYS_EAGER=True)
+    def test_allows_locmem_cache_with_eager_tasks(self):
+        self.assertListEqual(caching.check_shared_cache(), [])
@@ -0,0 +1,139 @@
+import datetime
+import json
+import os
+import shutil
+import tempfile
+import zipfile
+
+from django.test import TestCase
+from django.utils import timezone
+
+from dataset.factories import ScoreSetFactory
+from variant.factories import VariantFactory
+
+from .. import results, tasks, utilities
+from ..models import ResultJob
+
+
+class ResultStoreTestCase(TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.override = self.settings(
+            API_RESULTS_DIR=self.directory,
+            API_RESULTS_TTL=60,
+            API_RESULTS_MAX_SIZE=1000,
+            API_RESULTS_MAX_TOTAL_SIZE=10 ** 6,
+        )
+        self.override.enable()
+
+    def tearDown(self):
+        self.override.disable()
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def read(self, path, arcname):
+        with zipfile.ZipFile(path) as archive:
+            return archive.read(arcname).decode()
+
+
+class TestResultStore(ResultStoreTestCase):
+    def test_write_zip_streams_chunks(self):
+        path = os.path.join(self.directory, "out.zip")
+        size = results.write_zip(path, "out.json", ["[1, ", "2", "]"])
+        self.assertEqual(size, os.path.getsize(path))
+        self.assertEqual(self.read(path, "out.json"), "[1, 2]")
+
+    def test_write_zip_removes_partial_archive_when_too_large(self):
+        path = os.path.join(self.directory, "out.zip")
+        with self.assertRaises(results.ResultTooLarge):
+            results.write_zip(path, "out.json", ["a" * 600] * 2, max_size=1000)
+        self.assertListEqual(os.listdir(self.directory), [])
+
+    def test_run_job_records_state(self):
+        job = ResultJob.objects.create()
+        results.run_job(job, "out.json", ["{}"])
+        job.refresh_from_db()
+        self.assertEqual(job.state, ResultJob.READY)
+        self.assertEqual(
+            job.size, os.path.getsize(results.result_path(job.uuid))
+        )
+
+        job = ResultJob.objects.create()
+        results.run_job(job, "out.json", ["a" * 1001])
+        job.refresh_from_db()
+        self.assertEqual(job.state, ResultJob.FAILED)
+        self.assertIn("1000", job.error)
+
+    def test_get_job_ignores_expired_and_invalid_uuids(self):
+        job = ResultJob.objects.create()
+        self.assertEqual(results.get_job(str(job.uuid)), job)
+        job.expiry_date = timezone.now()
+        job.save()
+        self.assertIsNone(results.get_job(str(job.uuid)))
+        self.assertIsNone(results.get_job("NOT_A_REAL_UUID"))
+
+    def test_evicts_expired_results_and_orphaned_files(self):
+        expired = ResultJob.objects.create()
+        current = ResultJob.objects.create()
+        for job in (expired, current):
+            results.run_job(job, "out.json", ["{}"])
+        expired.expiry_date = timezone.now() - datetime.timedelta(seconds=1)
+        expired.save()
+        orphan = os.path.join(self.directory, "orphan.zip.part")
+        open(orphan, "w").close()
+        os.utime(orphan, (0, 0))
+
+        self.assertEqual(results.evict_results(), 1)
+        self.assertListEqual(list(ResultJob.objects.all()), [current])
+        self.assertListEqual(
+            os.listdir(self.directory),
+            [os.path.basename(results.result_path(current.uuid))],
+        )
+
+    def test_evicts_oldest_results_over_total_size(self):
+        jobs = [ResultJob.objects.create() for _ in range(3)]
+        for job in jobs:
+            results.run_job(job, "out.json", ["{}"])
+        with self.settings(API_RESULTS_MAX_TOTAL_SIZE=2 * jobs[0].size):
+            self.assertEqual(results.enforce_total_size(), 1)
+        self.assertSetEqual(set(ResultJob.objects.all()), set(jobs[1:]))
+
+
+class TestFormatVariantLargeGetResponse(ResultStoreTestCase):
+    def test_streams_the_variant_response(self):
+        scoreset = ScoreSetFactory()
+        for i in range(1, 4):
+            variant = VariantFactory(scoreset=scoreset)
+            variant.urn = "tmp:abcdef123456#{}".format(i)
+            variant.save()
+
+        job = ResultJob.objects.create()
+        with self.settings(API_RESULTS_MAX_SIZE=10 ** 6):
+            tasks.format_variant_large_get_response(
+                str(job.uuid), "tmp:abcdef123456#2", 0, -1
+            )
+        job.refresh_from_db()
+        self.assertEqual(job.state, ResultJob.READY)
+
+        content = self.read(
+            results.result_path(job.uuid), "{}.json".format(job.uuid)
+        )
+        expected = utilities.format_variant_get_response(
+            "tmp:abcdef123456#2", 0, -1
+        )
+        self.assertEqual(json.loads(content), json.loads(json.dumps(expected)))
+
+    def test_status_view_reports_state(self):
+        job = ResultJob.objects.create()
+        url = "/api/results/{}/status/".format(job.uuid)
+        content = json.loads(self.client.get(url).content)
+        self.assertEqual(content["state"], ResultJob.PENDING)
+        self.assertIsNone(content["url"])
+
+        results.run_job(job, "out.json", ["{}"])
+        content = json.loads(self.client.get(url).content)
+        self.assertEqual(content["state"], ResultJob.READY)
+        response = self.client.get(content["url"])
+        self.assertEqual(response.status_code, 200)
+
+        response = self.client.get("/api/results/NOT_A_REAL_UUID/status/")
+        self.assertEqual(response.status_code, 404)
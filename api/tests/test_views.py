@@ -4,10 +4,12 @@ import pandas as pd
 import numpy as np
 from datetime import timedelta
 
+from django.db import connection
+from django.http import QueryDict
 from django.test import TestCase, RequestFactory, mock
+from django.test.utils import CaptureQueriesContext
 from django.contrib.auth import get_user_model
 from django.core import exceptions
-from django.http import HttpResponse
 
 from rest_framework import exceptions
 
@@ -20,14 +22,16 @@ from dataset.utilities import publish_dataset
 from dataset.models import scoreset, experimentset
 from dataset.factories import (
     ScoreSetFactory,
+    ScoreSetWithTargetFactory,
     ExperimentFactory,
     ExperimentSetFactory,
 )
 
 from variant.factories import VariantFactory
-from variant.models import Variant
+from variant.models import ColumnarVariantData, Variant, VariantSpan
 
 from .. import views
+from ..tasks import format_variant_large_get_response
 
 
 User = get_user_model()
@@ -294,6 +298,105 @@ class TestExperimentAPIViews(TestCase):
         self.assertContains(response, instance2.urn)
 
 
+class TestListQueryCounts(TestCase):
+    """
+    Tests that the list views use a fixed number of queries regardless of
+    the number of rows returned.
+    """
+
+    def setUp(self):
+        self.user = UserFactory()
+        self.user.profile.generate_token()
+
+    def assert_fixed_query_count(self, url, create, **kwargs):
+        create()
+        # Warm up per-visitor state such as sessions and tracking.
+        self.client.get(url, **kwargs)
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url, **kwargs)
+        self.assertEqual(response.status_code, 200)
+
+        for _ in range(3):
+            create()
+        with self.assertNumQueries(len(context)):
+            response = self.client.get(url, **kwargs)
+        self.assertEqual(response.status_code, 200)
+        return json.loads(response.content)
+
+    def create_scoreset(self):
+        previous = ScoreSetWithTargetFactory(private=False)
+        instance = ScoreSetWithTargetFactory(
+            private=False, experiment=previous.experiment, replaces=previous
+        )
+        VariantFactory(scoreset=instance)
+        instance.add_viewers(UserFactory())
+        private = ScoreSetWithTargetFactory(private=True)
+        private.add_editors(self.user)
+
+    def create_experiment(self):
+        instance = ExperimentFactory(private=False)
+        ScoreSetFactory(experiment=instance, private=False)
+        ScoreSetFactory(experiment=instance, private=True)
+        instance.add_administrators(UserFactory())
+
+    def create_experimentset(self):
+        instance = ExperimentSetFactory(private=False)
+        ExperimentFactory(experimentset=instance, private=False)
+        ExperimentFactory(experimentset=instance, private=True)
+        instance.add_administrators(UserFactory())
+
+    def test_scoreset_list_anonymous(self):
+        data = self.assert_fixed_query_count(
+            "/api/scoresets/", self.create_scoreset
+        )
+        self.assertEqual(len(data), 8)
+        self.assertTrue(all(row["variant_count"] >= 0 for row in data))
+
+    def test_scoreset_list_authenticated(self):
+        data = self.assert_fixed_query_count(
+            "/api/scoresets/",
+            self.create_scoreset,
+            HTTP_AUTHORIZATION=self.user.profile.auth_token,
+        )
+        self.assertEqual(len(data), 12)
+
+    def test_scoreset_list_serializes_versions(self):
+        self.create_scoreset()
+        response = self.client.get("/api/scoresets/")
+        data = {row["urn"]: row for row in json.loads(response.content)}
+        instance = scoreset.ScoreSet.objects.exclude(replaces=None).first()
+        self.assertEqual(
+            data[instance.urn]["previous_version"], instance.replaces.urn
+        )
+        self.assertEqual(
+            data[instance.replaces.urn]["next_version"], instance.urn
+        )
+        self.assertEqual(
+            data[instance.replaces.urn]["current_version"], instance.urn
+        )
+        self.assertEqual(data[instance.urn]["variant_count"], 1)
+
+    def test_experiment_list(self):
+        self.assert_fixed_query_count(
+            "/api/experiments/", self.create_experiment
+        )
+        self.assert_fixed_query_count(
+            "/api/experiments/",
+            self.create_experiment,
+            HTTP_AUTHORIZATION=self.user.profile.auth_token,
+        )
+
+    def test_experimentset_list(self):
+        self.assert_fixed_query_count(
+            "/api/experimentsets/", self.create_experimentset
+        )
+        self.assert_fixed_query_count(
+            "/api/experimentsets/",
+            self.create_experimentset,
+            HTTP_AUTHORIZATION=self.user.profile.auth_token,
+        )
+
+
 class TestFormatCSVRows(TestCase):
     def test_dicts_include_urn(self):
         vs = [VariantFactory() for _ in range(5)]
@@ -380,13 +483,11 @@ class TestFormatResponse(TestCase):
     def setUp(self):
         self.user = UserFactory()
         self.instance = ScoreSetFactory(private=True)
-        self.response = HttpResponse(content_type="text/csv")
 
     def test_adds_comments_to_response(self):
-        response = views.format_response(
-            self.response, self.instance, dtype="scores"
+        content = "".join(
+            views.format_response(self.instance, dtype="scores")
         )
-        content = response.content.decode()
         self.assertIn("# Accession: {}".format(self.instance.urn), content)
         self.assertIn("# Downloaded (UTC):", content)
         self.assertIn(
@@ -398,7 +499,7 @@ class TestFormatResponse(TestCase):
 
     def test_raises_value_error_unknown_dtype(self):
         with self.assertRaises(ValueError):
-            views.format_response(self.response, self.instance, dtype="---")
+            views.format_response(self.instance, dtype="---")
 
     @mock.patch("api.views.format_csv_rows")
     def test_calls_format_csv_correct_call_dtype_is_scores(self, patch):
@@ -414,7 +515,7 @@ class TestFormatResponse(TestCase):
             }
             VariantFactory(scoreset=self.instance, data=data)
 
-        _ = views.format_response(self.response, self.instance, dtype="scores")
+        _ = "".join(views.format_response(self.instance, dtype="scores"))
 
         called_dtype = patch.call_args[1]["dtype"]
         called_columns = patch.call_args[1]["columns"]
@@ -443,7 +544,7 @@ class TestFormatResponse(TestCase):
             }
             VariantFactory(scoreset=self.instance, data=data)
 
-        _ = views.format_response(self.response, self.instance, dtype="counts")
+        _ = "".join(views.format_response(self.instance, dtype="counts"))
 
         called_dtype = patch.call_args[1]["dtype"]
         called_columns = patch.call_args[1]["columns"]
@@ -460,7 +561,7 @@ class TestFormatResponse(TestCase):
 
     @mock.patch("api.views.format_csv_rows")
     def test_returns_empty_csv_when_no_additional_columns_present(self, patch):
-        _ = views.format_response(self.response, self.instance, dtype="scores")
+        _ = "".join(views.format_response(self.instance, dtype="scores"))
         patch.assert_not_called()
 
     def test_double_quotes_column_values_containing_commas(self):
@@ -476,15 +577,13 @@ class TestFormatResponse(TestCase):
             }
             VariantFactory(scoreset=self.instance, data=data)
 
-        response = views.format_response(
-            self.response, self.instance, dtype="scores"
+        content = "".join(
+            views.format_response(self.instance, dtype="scores")
         )
-        content = response.content.decode()
         self.assertIn('"hello,world"', content)
 
     def test_formats_null_values_as_NA(self):
         for null in null_values_list:
-            response = HttpResponse(content_type="text/csv")
             self.instance.variants.all().delete()
             self.assertFalse(self.instance.variants.count())
             self.instance.dataset_columns = {
@@ -498,11 +597,11 @@ class TestFormatResponse(TestCase):
                     constants.variant_count_data: {},
                 }
                 VariantFactory(scoreset=self.instance, data=data)
-            response = views.format_response(
-                response, self.instance, dtype="scores"
+            content = "".join(
+                views.format_response(self.instance, dtype="scores")
             )
 
-            handle = io.StringIO(response.content.decode())
+            handle = io.StringIO(content)
             comment_line_count = 0
             for line in handle:
                 if line.startswith("#"):
@@ -514,6 +613,71 @@ class TestFormatResponse(TestCase):
             self.assertEqual(df.score.where(np.isnan).size, variant_count)
             handle.close()
 
+    def test_orders_rows_by_numeric_urn_suffix(self):
+        self.instance.dataset_columns = {
+            constants.score_columns: ["score"],
+            constants.count_columns: [],
+        }
+        self.instance.save()
+        for number in [10, 2, 1]:
+            VariantFactory(
+                scoreset=self.instance,
+                urn="{}#{}".format(self.instance.urn, number),
+            )
+
+        content = "".join(views.format_response(self.instance, "scores"))
+        lines = [l for l in content.splitlines() if not l.startswith("#")]
+        self.assertListEqual(
+            [line.split(",")[0] for line in lines[1:]],
+            ["{}#{}".format(self.instance.urn, n) for n in [1, 2, 10]],
+        )
+
+    @mock.patch("api.views.DOWNLOAD_BATCH_SIZE", 2)
+    def test_writes_rows_in_batches(self):
+        self.instance.dataset_columns = {
+            constants.score_columns: ["score"],
+            constants.count_columns: [],
+        }
+        self.instance.save()
+        for _ in range(5):
+            VariantFactory(scoreset=self.instance)
+
+        chunks = list(
+            views.stream_csv_rows(
+                self.instance,
+                columns=["accession"] + self.instance.score_columns,
+                dtype=constants.variant_score_data,
+            )
+        )
+        # Header and two rows, two rows, one row.
+        self.assertEqual(len(chunks), 3)
+        self.assertEqual(len("".join(chunks).splitlines()), 6)
+
+    def test_columnar_data_gives_the_same_rows(self):
+        self.instance.dataset_columns = {
+            constants.score_columns: ["score", "se"],
+            constants.count_columns: ["count"],
+        }
+        self.instance.save()
+        for i in range(5):
+            data = {
+                constants.variant_score_data: {
+                    "score": i / 3,
+                    "se": None if i % 2 else i,
+                },
+                constants.variant_count_data: {"count": i},
+            }
+            VariantFactory(scoreset=self.instance, data=data)
+
+        def rows(dtype):
+            content = "".join(views.format_response(self.instance, dtype))
+            return [l for l in content.splitlines() if not l.startswith("#")]
+
+        expected = {dtype: rows(dtype) for dtype in ("scores", "counts")}
+        ColumnarVariantData.build(self.instance)
+        for dtype in ("scores", "counts"):
+            self.assertListEqual(rows(dtype), expected[dtype])
+
 
 class TestScoreSetAPIViews(TestCase):
     factory = ScoreSetFactory
@@ -575,6 +739,34 @@ class TestScoreSetAPIViews(TestCase):
         self.assertContains(response, instance1.urn)
         self.assertContains(response, instance2.urn)
 
+    def test_list_is_paginated_by_keyset_with_page_size(self):
+        instances = sorted(
+            [self.factory(private=False) for _ in range(3)],
+            key=lambda i: i.urn,
+        )
+        response = self.client.get(
+            "/api/{}/".format(self.url), data={"page_size": 2}
+        )
+        data = json.loads(response.content)
+        self.assertEqual(
+            [r["urn"] for r in data["results"]],
+            [i.urn for i in instances[:2]],
+        )
+        self.assertIsNone(data["previous"])
+
+        response = self.client.get(data["next"])
+        data = json.loads(response.content)
+        self.assertEqual(
+            [r["urn"] for r in data["results"]], [instances[2].urn]
+        )
+        self.assertIsNone(data["next"])
+        self.assertIsNotNone(data["previous"])
+
+    def test_list_is_not_paginated_without_page_size(self):
+        self.factory(private=False)
+        response = self.client.get("/api/{}/".format(self.url))
+        self.assertIsInstance(json.loads(response.content), list)
+
     # ----- Function based file download views
     def test_403_private_download_scores(self):
         instance = self.factory(private=True)
@@ -685,6 +877,135 @@ class TestScoreSetAPIViews(TestCase):
         )
         self.assertEqual(response, scs.extra_metadata)
 
+
+class TestScoreSetVariantsAPIView(TestCase):
+    def setUp(self):
+        self.instance = ScoreSetFactory(private=False)
+        self.scores = [0.5, -2.0, None, 3.0, -1.5, 0.5, "NA"]
+        self.variants = []
+        for score in self.scores:
+            data = {
+                constants.variant_score_data: {
+                    constants.required_score_column: score
+                },
+                constants.variant_count_data: {},
+            }
+            self.variants.append(
+                VariantFactory(scoreset=self.instance, data=data)
+            )
+        self.url = "/api/scoresets/{}/variants/".format(self.instance.urn)
+
+    def get(self, **params):
+        response = self.client.get(self.url, data=params)
+        return response.status_code, json.loads(response.content)
+
+    def test_lists_variants_in_creation_order(self):
+        status, content = self.get()
+        self.assertEqual(status, 200)
+        self.assertIsNone(content["next"])
+        self.assertListEqual(
+            [row["urn"] for row in content["results"]],
+            [v.urn for v in self.variants],
+        )
+        self.assertEqual(content["results"][0]["data"], self.variants[0].data)
+
+    def test_filters_scores_by_range(self):
+        _, content = self.get(score__gt=-1.75, score__lt=1)
+        self.assertListEqual(
+            [row["score"] for row in content["results"]], [0.5, -1.5, 0.5]
+        )
+
+    def test_orders_by_score(self):
+        _, content = self.get(order="score")
+        self.assertListEqual(
+            [row["score"] for row in content["results"]],
+            [-2.0, -1.5, 0.5, 0.5, 3.0],
+        )
+        _, content = self.get(order="-score", limit=2)
+        self.assertListEqual(
+            [row["score"] for row in content["results"]], [3.0, 0.5]
+        )
+
+    def test_follows_cursor_across_tied_scores(self):
+        seen = []
+        params = {"order": "-score", "limit": 2}
+        while True:
+            _, content = self.get(**params)
+            seen += [row["urn"] for row in content["results"]]
+            if content["next"] is None:
+                break
+            params["cursor"] = QueryDict(
+                content["next"].split("?", 1)[1]
+            )["cursor"]
+        expected = [
+            v.urn
+            for v in sorted(
+                (
+                    v
+                    for v in self.variants
+                    if isinstance(v.data["score_data"]["score"], float)
+                ),
+                key=lambda v: (-v.data["score_data"]["score"], -v.pk),
+            )
+        ]
+        self.assertListEqual(seen, expected)
+
+    def test_cursor_seek_bounds_score_for_index_range_scan(self):
+        for order, bound in (("score", " >= "), ("-score", " <= ")):
+            _, cursor = views.variant_page(self.instance, order=order, limit=2)
+            with CaptureQueriesContext(connection) as queries:
+                views.variant_page(
+                    self.instance, order=order, limit=2, cursor=cursor
+                )
+            self.assertIn(bound, queries[-1]["sql"])
+
+    def test_follows_cursor_in_creation_order(self):
+        _, first = self.get(limit=4)
+        cursor = QueryDict(first["next"].split("?", 1)[1])["cursor"]
+        _, second = self.get(limit=4, cursor=cursor)
+        self.assertIsNone(second["next"])
+        self.assertListEqual(
+            [row["urn"] for row in first["results"] + second["results"]],
+            [v.urn for v in self.variants],
+        )
+
+    def test_filters_by_region(self):
+        for position, variant in enumerate(self.variants, start=1):
+            variant.hgvs_pro = "p.Leu{}Pro".format(position)
+            variant.save()
+        VariantSpan.build(self.instance)
+        _, content = self.get(start=2, end=4)
+        self.assertListEqual(
+            [row["urn"] for row in content["results"]],
+            [v.urn for v in self.variants[1:4]],
+        )
+        _, content = self.get(start=4, order="score")
+        self.assertListEqual(
+            [row["score"] for row in content["results"]], [3.0]
+        )
+
+    def test_400_invalid_parameters(self):
+        for params in (
+            {"score__lt": "abc"},
+            {"score__gt": "nan"},
+            {"order": "urn"},
+            {"start": "a"},
+            {"end": 2},
+            {"start": 3, "end": 2},
+            {"start": 1, "column": "urn"},
+            {"limit": 0},
+            {"limit": views.MAX_VARIANT_PAGE_SIZE + 1},
+        ):
+            status, _ = self.get(**params)
+            self.assertEqual(status, 400, params)
+
+    def test_403_private_scoreset(self):
+        self.instance.private = True
+        self.instance.save()
+        status, _ = self.get()
+        self.assertEqual(status, 403)
+
+
 class TestVariantAPIViews(TestCase):
     factory = VariantFactory
     url = "variants"
@@ -730,7 +1051,8 @@ class TestVariantAPIViews(TestCase):
         variant_fake_base_urn = 'tmp:abcdef123456'
         variants_count = 5
         offset = 3
-        vs = [self.factory() for _ in range(variants_count)]
+        scoreset = ScoreSetFactory()
+        vs = [self.factory(scoreset=scoreset) for _ in range(variants_count)]
         for i in range(len(vs)):
             # Overwrite the variant's urn so they all share a urn_prefix
             v = vs[i]
@@ -751,7 +1073,8 @@ class TestVariantAPIViews(TestCase):
         variant_fake_base_urn = 'tmp:abcdef123456'
         variants_count = 5
         limit = 3
-        vs = [self.factory() for _ in range(variants_count)]
+        scoreset = ScoreSetFactory()
+        vs = [self.factory(scoreset=scoreset) for _ in range(variants_count)]
         for i in range(len(vs)):
             v = vs[i]
             v.urn = variant_fake_base_urn + f'#{i}'
@@ -773,7 +1096,8 @@ class TestVariantAPIViews(TestCase):
         """
         variant_fake_base_urn = 'tmp:abcdef123456'
         variants_count = 5
-        vs = [self.factory() for _ in range(variants_count)]
+        scoreset = ScoreSetFactory()
+        vs = [self.factory(scoreset=scoreset) for _ in range(variants_count)]
         for i in range(len(vs)):
             v = vs[i]
             v.urn = variant_fake_base_urn + f'#{i}'
@@ -809,6 +1133,47 @@ class TestVariantAPIViews(TestCase):
                 f'{variant_fake_base_urn}#{requested_variant_id}'
             )
 
+    def test_orders_related_variants_by_urn_number(self):
+        variant_fake_base_urn = 'tmp:abcdef123456'
+        scoreset = ScoreSetFactory()
+        other = self.factory()
+        other.urn = 'tmp:abcdef1234567#1'
+        other.save()
+        for i in (10, 2, 1, 11):
+            v = self.factory(scoreset=scoreset)
+            v.urn = variant_fake_base_urn + f'#{i}'
+            v.save()
+
+        response = self.client.get(
+            f"{self.variants_base_url}/{variant_fake_base_urn}?variant_id=11"
+        )
+        response_json = json.loads(response.content.decode())
+        self.assertListEqual(
+            [
+                v['urn']
+                for v in response_json['experiment']['scoreset']['variants']
+            ],
+            [f'{variant_fake_base_urn}#{i}' for i in (11, 1, 2, 10)],
+        )
+
+    def test_query_count_does_not_depend_on_limit(self):
+        variant_fake_base_urn = 'tmp:abcdef123456'
+        scoreset = ScoreSetFactory()
+        for i in range(10):
+            v = self.factory(scoreset=scoreset)
+            v.urn = variant_fake_base_urn + f'#{i}'
+            v.save()
+        url = f"{self.variants_base_url}/{variant_fake_base_urn}?variant_id=0"
+        with CaptureQueriesContext(connection) as few:
+            self.client.get(url + "&limit=2")
+        with CaptureQueriesContext(connection) as many:
+            response = self.client.get(url + "&limit=20")
+        response_json = json.loads(response.content.decode())
+        self.assertEqual(
+            len(response_json['experiment']['scoreset']['variants']), 10
+        )
+        self.assertEqual(len(many), len(few))
+
     def test_can_get_large_response_for_variant(self):
         variant = self.factory()
         variant_urn = variant.urn
@@ -817,7 +1182,7 @@ class TestVariantAPIViews(TestCase):
         variant.save()
         response = self.client.get(
             f"{self.variants_base_url}/{variant_urn}?variant_id={variant_id}" \
-            "&limit=51"
+            f"&limit={views.MAX_INLINE_VARIANTS + 1}"
         )
         self.assertEqual(response.status_code, 202)
         response_json = json.loads(response.content.decode())
@@ -857,10 +1222,19 @@ class TestResultsAPIViews(TestCase):
         variant.save()
         response = self.client.get(
             f"{self.variants_base_url}/{variant_urn}?variant_id={variant_id}" \
-            "&limit=51"
+            f"&limit={views.MAX_INLINE_VARIANTS + 1}"
         )
         response_json = json.loads(response.content.decode())
         results_uuid = response_json['results_uuid']
+        response = self.client.get(f"{self.results_base_url}/{results_uuid}")
+        self.assertEqual(response.status_code, 404)
 
+        format_variant_large_get_response(
+            results_uuid,
+            variant.urn,
+            0,
+            views.MAX_INLINE_VARIANTS + 1,
+        )
         response = self.client.get(f"{self.results_base_url}/{results_uuid}")
         self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'application/zip')
@@ -23,6 +23,11 @@ router.register("target", views.TargetGeneViewSet)
 router.register("reference", views.ReferenceGenomeViewSet)
 
 urlpatterns = [
+    url(
+        r"^results/(?P<results_uuid>[^/]+)/status/$",
+        views.ResultStatusView.as_view(),
+        name="result_status",
+    ),
     url(
         r"^results/(?P<results_uuid>.*)$",
         views.ResultsView.as_view(),
@@ -43,6 +48,11 @@ urlpatterns = [
         views.scoreset_metadata,
         name="api_download_metadata",
     ),
+    url(
+        r"^scoresets/(?P<urn>{})/variants/$".format(scoreset_url_pattern),
+        views.scoreset_variants,
+        name="api_scoreset_variants",
+    ),
     url(
         r"^variants/(?P<urn>.*)$",
         views.VariantView.as_view(),
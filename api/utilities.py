@@ -1,13 +1,100 @@
-from dataset.models import Experiment, ScoreSet
+import json
+import uuid
+from itertools import islice
+from typing import Iterator, List
+
+from django.core.serializers.json import DjangoJSONEncoder
+
+from dataset import constants
 from dataset.serializers import (
     ExperimentSerializer,
     ScoreSetSerializer,
 )
-from variant.models import Variant
-from variant.serializers import VariantSerializer
+from variant.models import ColumnarVariantData, Variant, urn_number_expression
+
+VARIANT_RESPONSE_KEYS = ("urn", constants.hgvs_pro_column, "data")
+SCORESET_RESPONSE_KEYS = (
+    "urn",
+    "pmid",
+    "keywords",
+    "score_ranges",
+    "license",
+    "variants",
+)
+EXPERIMENT_RESPONSE_KEYS = ("urn", "pmid", "keywords", "target", "scoreset")
+
+# Number of variant rows whose data is resolved per query.
+ROW_BATCH_SIZE = 1000
+
+
+def iter_related_variant_rows(variant, offset, limit) -> Iterator[dict]:
+    """
+    Yields the other variants of the score set of `variant` in upload order
+    as dictionaries of `VARIANT_RESPONSE_KEYS`. A negative `limit` yields
+    all of them, otherwise rows `offset` to `limit - 1` are yielded, leaving
+    room for `variant` itself.
+
+    When all variants are requested, their `data` is read from the columnar
+    copy of the score set's data if one is available. Pages are read from
+    `Variant.data`, since loading the copy costs as much as a full scan.
+    """
+    if limit == 0:
+        return
+
+    variants = (
+        Variant.objects.filter(scoreset_id=variant.scoreset_id)
+        .exclude(pk=variant.pk)
+        .order_by(urn_number_expression(), "id")
+    )
+    columnar = None
+    if limit < 0:
+        columnar = ColumnarVariantData.for_scoreset(variant.scoreset)
+    if columnar is None:
+        rows = variants.values(*VARIANT_RESPONSE_KEYS)
+    else:
+        rows = variants.values("id", *VARIANT_RESPONSE_KEYS[:-1])
+    if limit > 0:
+        rows = rows[offset : limit - 1]
+    rows = rows.iterator()
+    if columnar is None:
+        yield from rows
+        return
+
+    index = columnar.row_index()
+    while True:
+        batch = list(islice(rows, ROW_BATCH_SIZE))
+        if not batch:
+            return
+        missing = [row["id"] for row in batch if row["id"] not in index]
+        data = dict(
+            Variant.objects.filter(pk__in=missing).values_list("id", "data")
+        )
+        for row in batch:
+            pk = row.pop("id")
+            if pk in index:
+                row["data"] = columnar.data_at(index[pk])
+            else:
+                row["data"] = data[pk]
+            yield row
+
+
+def related_variant_rows(variant, offset, limit) -> List[dict]:
+    """Returns the rows of `iter_related_variant_rows` as a list."""
+    return list(iter_related_variant_rows(variant, offset, limit))
+
+
+def requested_variant_row(variant) -> dict:
+    return {key: getattr(variant, key) for key in VARIANT_RESPONSE_KEYS}
+
+
+def get_requested_variant(variant_urn) -> Variant:
+    return Variant.objects.select_related("scoreset__experiment").get(
+        urn=variant_urn
+    )
+
 
 def format_variant_get_response(variant_urn, offset, limit):
-    '''
+    """
     This function assumes a check has already been done on the existence of a
     Variant object with the urn of variant_urn exists in the database with a
     corresponding ScoreSet and, in turn, Experiment object.
@@ -27,64 +114,68 @@ def format_variant_get_response(variant_urn, offset, limit):
             }
         }
     }
-    '''
-    # Fetch the original variant object
-    variant = Variant.objects.get(urn=variant_urn)
-    variant_dict = VariantSerializer(variant).data
 
-    variant_urn_prefix = variant_urn.split('#')[0]
-    # When getting related variants, exclude the requested one; it'll be first.
-    # If limit is zero, only return the requested variant.
-    other_variants = []
-    if limit < 0:
-        other_variants = Variant.objects.order_by('urn') \
-            .filter(urn__startswith=variant_urn_prefix) \
-            .exclude(urn=variant_urn)
-    elif limit > 0:
-        other_variants = Variant.objects.order_by('urn') \
-            .filter(urn__startswith=variant_urn_prefix) \
-            .exclude(urn=variant_urn)[offset:limit-1]
+    The score set and experiment are serialized once, and the variants are
+    read as flat rows; see `related_variant_rows`.
+    """
+    # Fetch the original variant object
+    variant = get_requested_variant(variant_urn)
     # Always return the requested variant first
-    all_variants = [variant] + list(other_variants)
-    variants_response_list = []
-    for v in all_variants:
-        v_dict = VariantSerializer(v).data
-        v_response_keys = ['urn', 'hgvs_pro', 'data']
-        v_response_dict = {}
-        for key in v_response_keys:
-            if key in v_dict:
-                v_response_dict[key] = v_dict[key]
-        variants_response_list.append(v_response_dict)
+    variants_response_list = [
+        requested_variant_row(variant)
+    ] + related_variant_rows(variant, offset, limit)
+    return format_variant_response(variant, variants_response_list)
+
 
+def format_variant_response(variant, variants_response_list):
+    """
+    Formats the response of `format_variant_get_response` for `variant`,
+    listing `variants_response_list` as the variants of its score set.
+    """
     # Format the scoreset to include the variants list
-    scoreset_urn = variant.scoreset.urn
-    scoreset = ScoreSet.objects.get(urn=scoreset_urn)
+    scoreset = variant.scoreset
     scoreset_dict = ScoreSetSerializer(scoreset).data
     scoreset_response_dict = {}
-    scoreset_response_keys = [
-        'urn', 'pmid', 'keywords', 'score_ranges', 'license', 'variants'
-    ]
-    for key in scoreset_response_keys:
+    for key in SCORESET_RESPONSE_KEYS:
         if key in scoreset_dict:
             scoreset_response_dict[key] = scoreset_dict[key]
-        elif key == 'variants':
+        elif key == "variants":
             scoreset_response_dict[key] = variants_response_list
 
     # Finally, format the experiment to include the scoreset
-    experiment_urn = variant.scoreset.experiment
-    experiment = Experiment.objects.get(urn=experiment_urn)
-    experiment_dict = ExperimentSerializer(experiment).data
+    experiment_dict = ExperimentSerializer(scoreset.experiment).data
     experiment_response_dict = {}
-    experiment_response_keys = ['urn', 'pmid', 'keywords', 'target', 'scoreset']
-    for key in experiment_response_keys:
+    for key in EXPERIMENT_RESPONSE_KEYS:
         if key in experiment_dict:
             experiment_response_dict[key] = experiment_dict[key]
-        elif key == 'target':
+        elif key == "target":
             experiment_response_dict[key] = scoreset_dict[key]
-        elif key == 'scoreset':
+        elif key == "scoreset":
             experiment_response_dict[key] = scoreset_response_dict
 
-    response_data = {
-        'experiment': experiment_response_dict
-    }
+    response_data = {"experiment": experiment_response_dict}
     return response_data
+
+
+def stream_variant_get_response(variant_urn, offset, limit) -> Iterator[str]:
+    """
+    Yields the JSON encoding of `format_variant_get_response` in chunks,
+    without holding more than a batch of variant rows in memory.
+    """
+    variant = get_requested_variant(variant_urn)
+    # Render everything but the variants, then split the document where the
+    # variants list goes.
+    placeholder = uuid.uuid4().hex
+    document = json.dumps(
+        format_variant_response(variant, placeholder), cls=DjangoJSONEncoder
+    )
+    head, tail = document.split(json.dumps(placeholder), 1)
+
+    yield head
+    yield "["
+    yield json.dumps(requested_variant_row(variant), cls=DjangoJSONEncoder)
+    for row in iter_related_variant_rows(variant, offset, limit):
+        yield ", "
+        yield json.dumps(row, cls=DjangoJSONEncoder)
+    yield "]"
+    yield tail
@@ -1,9 +1,12 @@
 import csv
+import io
+import itertools
 import json
 import logging
+import math
 import os
 import re
-import uuid
+from collections import OrderedDict
 from datetime import datetime
 from reversion import create_revision
 
@@ -11,16 +14,29 @@ from django.contrib.auth import get_user_model
 from django.core.files.uploadedfile import InMemoryUploadedFile
 from django.core.serializers import serialize
 from django.db import transaction
-from django.http import FileResponse, HttpResponse, JsonResponse
+from django.db.models import Prefetch, Q
+from django.http import (
+    FileResponse,
+    HttpResponse,
+    JsonResponse,
+    StreamingHttpResponse,
+)
 from rest_framework import exceptions, parsers, status, views, viewsets
 from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
 
-from .constants import BASE_RESULTS_DIR
+from . import caching
+from .artifacts import artifact_response
+from . import results
+from .models import ResultJob
 from .tasks import format_variant_large_get_response
 from .utilities import format_variant_get_response
 from accounts.filters import UserFilter
 from accounts.models import AUTH_TOKEN_RE, Profile
+from accounts.permission_cache import is_contributor
 from accounts.serializers import UserSerializer
+from core.filters import TrigramFilterBackend
+from core.pagination import KeysetPagination, decode_cursor, encode_cursor
 from core.utilities import is_null
 from dataset import models, filters, constants
 from dataset.forms.experiment import ExperimentForm
@@ -33,6 +49,7 @@ from dataset.serializers import (
     ExperimentSerializer,
     ScoreSetSerializer,
 )
+from dataset.staging import discard_staged_variants
 from dataset.tasks import create_variants
 from dataset.templatetags.dataset_tags import filter_visible
 from genome import models as genome_models, serializers as genome_serializers
@@ -45,7 +62,12 @@ from metadata.forms import (
     EnsemblOffsetForm,
     RefseqOffsetForm,
 )
-from variant.models import Variant
+from variant.models import (
+    ColumnarVariantData,
+    Variant,
+    numeric_scores,
+    urn_number_expression,
+)
 
 User = get_user_model()
 ScoreSet = models.scoreset.ScoreSet
@@ -53,6 +75,16 @@ logger = logging.getLogger("django")
 
 words_re = re.compile(r"\w+|[^\w\s]", flags=re.IGNORECASE)
 
+# Number of variant rows written between chunks of a streamed CSV download.
+DOWNLOAD_BATCH_SIZE = 1000
+
+# Default and maximum number of variants per page of `scoreset_variants`.
+VARIANT_PAGE_SIZE = 100
+MAX_VARIANT_PAGE_SIZE = 1000
+
+# Largest `limit` of `VariantView` served inline rather than asynchronously.
+MAX_INLINE_VARIANTS = 1000
+
 
 def authenticate(request):
     user, token = None, request.META.get("HTTP_AUTHORIZATION", None)
@@ -92,7 +124,7 @@ def check_permission(instance, user=None):
             )
             return can_access_at_least_one_meta_scoreset
         else:
-            has_perm = user in instance.contributors
+            has_perm = is_contributor(user, instance)
             if not has_perm:
                 raise exceptions.PermissionDenied()
     return instance
@@ -122,12 +154,23 @@ class AuthenticatedViewSet(viewsets.ReadOnlyModelViewSet):
         return context
 
 
-class DatasetListViewSet(AuthenticatedViewSet):
+class DatasetListViewSet(caching.AnonymousCacheMixin, AuthenticatedViewSet):
+    filter_backends = (TrigramFilterBackend,)
+    pagination_class = KeysetPagination
     filter_class = None
     model_class = None
+    cache_tags = (caching.DATASETS,)
+
+    # Relations read by the serializer, loaded with a fixed number of
+    # queries regardless of the number of rows.
+    select_related = ("created_by", "modified_by")
+    prefetch_related = ("keywords", "sra_ids", "doi_ids", "pubmed_ids")
 
     def get_queryset(self):
-        return filter_visible(self.queryset.all(), user=self.user)
+        queryset = filter_visible(self.queryset.all(), user=self.user)
+        return queryset.select_related(*self.select_related).prefetch_related(
+            *self.prefetch_related
+        )
 
     def get_object(self):
         urn = self.kwargs.get("urn", None)
@@ -147,6 +190,13 @@ class ExperimentSetViewset(DatasetListViewSet):
     model_class = models.experimentset.ExperimentSet
     queryset = models.experimentset.ExperimentSet.objects.all()
     lookup_field = "urn"
+    # `filter_visible` combines querysets for authenticated users, so
+    # foreign keys are prefetched rather than joined.
+    prefetch_related = DatasetListViewSet.prefetch_related + (
+        "created_by",
+        "modified_by",
+    )
+    select_related = ()
 
 
 class ExperimentViewset(DatasetListViewSet):
@@ -159,6 +209,14 @@ class ExperimentViewset(DatasetListViewSet):
     model_class = models.experiment.Experiment
     queryset = models.experiment.Experiment.objects.all()
     lookup_field = "urn"
+    # `filter_visible` combines querysets for authenticated users, so
+    # foreign keys are prefetched rather than joined.
+    prefetch_related = DatasetListViewSet.prefetch_related + (
+        "created_by",
+        "modified_by",
+        "experimentset",
+    )
+    select_related = ()
 
     def create(self, request, format=None):
         """
@@ -279,6 +337,46 @@ class ScoreSetViewset(DatasetListViewSet):
     model_class = models.scoreset.ScoreSet
     queryset = models.scoreset.ScoreSet.objects.all()
     lookup_field = "urn"
+    select_related = DatasetListViewSet.select_related + (
+        "experiment",
+        "licence",
+        "target__wt_sequence",
+    )
+    prefetch_related = (
+        "keywords",
+        "doi_ids",
+        "pubmed_ids",
+        "meta_analysis_for",
+        Prefetch(
+            "target__reference_maps",
+            queryset=genome_models.ReferenceMap.objects.select_related(
+                "genome__genome_id"
+            ),
+        ),
+        Prefetch(
+            "target__uniprotoffset",
+            queryset=meta_models.UniprotOffset.objects.select_related(
+                "identifier"
+            ),
+        ),
+        Prefetch(
+            "target__ensembloffset",
+            queryset=meta_models.EnsemblOffset.objects.select_related(
+                "identifier"
+            ),
+        ),
+        Prefetch(
+            "target__refseqoffset",
+            queryset=meta_models.RefseqOffset.objects.select_related(
+                "identifier"
+            ),
+        ),
+    )
+
+    def get_queryset(self):
+        return models.scoreset.ScoreSet.annotate_variant_counts(
+            super().get_queryset()
+        )
 
     parser_classes = (
         parsers.MultiPartParser,
@@ -310,12 +408,11 @@ class ScoreSetViewset(DatasetListViewSet):
                 object.processing_state = constants.processing
                 object.save()
 
-                scores_rs, counts_rs, index = form.serialize_variants()
+                staged_upload, index = form.stage_variants()
                 task_kwargs = {
                     "user_pk": user.pk,
                     "scoreset_urn": object.urn,
-                    "scores_records": scores_rs,
-                    "counts_records": counts_rs,
+                    "staged_upload": staged_upload,
                     "dataset_columns": form.dataset_columns.copy(),
                     "index": index,
                 }
@@ -333,6 +430,7 @@ class ScoreSetViewset(DatasetListViewSet):
                 if not success:
                     object.processing_state = constants.failed
                     object.save()
+                    discard_staged_variants(staged_upload)
 
         @transaction.atomic()
         def save_forms(forms, user):
@@ -699,8 +797,8 @@ def format_csv_rows(variants, columns, dtype, na_rep="NA"):
 
     Parameters
     ----------
-    variants : list[variant.models.Variant`]
-        List of variants.
+    variants : Iterable[variant.models.Variant`]
+        Iterable of variants.
     columns : list[str]
         Columns to serialize.
     dtype : str, {'scores', 'counts'}
@@ -708,11 +806,10 @@ def format_csv_rows(variants, columns, dtype, na_rep="NA"):
     na_rep : str
         String to represent null values.
 
-    Returns
-    -------
-    list[dict]
+    Yields
+    ------
+    dict
     """
-    rowdicts = []
     for variant in variants:
         data = {}
         for column_key in columns:
@@ -729,15 +826,7 @@ def format_csv_rows(variants, columns, dtype, na_rep="NA"):
             if is_null(value):
                 value = na_rep
             data[column_key] = value
-        rowdicts.append(data)
-    return rowdicts
-
-
-def urn_number(variant):
-    number = variant.urn.split("#")[-1]
-    if not str.isdigit(number):
-        return 0
-    return int(number)
+        yield data
 
 
 def format_policy(policy, line_wrap_len=77):
@@ -763,32 +852,20 @@ def format_policy(policy, line_wrap_len=77):
     return lines
 
 
-def format_response(response, scoreset, dtype):
+def format_header(scoreset, download_time=True):
     """
-    Writes the CSV response by formatting each variant into a row including
-    the columns `hgvs_nt`, `hgvs_pro`, `urn` and other uploaded columns.
-
-    Parameters
-    ----------
-    response : `HttpResponse`
-        Reponse object to write to.
-    scoreset : `dataset.models.scoreset.ScoreSet`
-        The scoreset requested.
-    dtype : str
-        The type of data requested. Either 'scores' or 'counts'.
-
-    Returns
-    -------
-    `HttpResponse`
+    Formats the comment lines written before the variant rows of a CSV
+    download, including the licence and data usage policy of `scoreset`.
+    The time of the download is omitted when `download_time` is False, as
+    for files rendered ahead of the request.
     """
-    response.writelines(
-        [
-            "# Accession: {}\n".format(scoreset.urn),
-            "# Downloaded (UTC): {}\n".format(datetime.utcnow()),
-            "# Licence: {}\n".format(scoreset.licence.long_name),
-            "# Licence URL: {}\n".format(scoreset.licence.link or str(None)),
-        ]
-    )
+    lines = ["# Accession: {}\n".format(scoreset.urn)]
+    if download_time:
+        lines.append("# Downloaded (UTC): {}\n".format(datetime.utcnow()))
+    lines += [
+        "# Licence: {}\n".format(scoreset.licence.long_name),
+        "# Licence URL: {}\n".format(scoreset.licence.link or str(None)),
+    ]
 
     # Append data usage policy
     if (
@@ -798,11 +875,27 @@ def format_response(response, scoreset, dtype):
         policy = "Data usage policy: {}".format(
             scoreset.data_usage_policy.strip()
         )
-        lines = format_policy(policy)
-        response.writelines(lines)
+        lines += format_policy(policy)
+
+    return lines
 
-    variants = sorted(scoreset.children.all(), key=lambda v: urn_number(v))
 
+def download_columns(scoreset, dtype):
+    """
+    Returns the CSV columns of a download and the key of the variant data
+    they are read from.
+
+    Parameters
+    ----------
+    scoreset : `dataset.models.scoreset.ScoreSet`
+        The scoreset requested.
+    dtype : str
+        The type of data requested. Either 'scores' or 'counts'.
+
+    Returns
+    -------
+    tuple[list[str], str]
+    """
     if dtype == "scores":
         columns = ["accession"] + scoreset.score_columns
         type_column = constants.variant_score_data
@@ -814,42 +907,104 @@ def format_response(response, scoreset, dtype):
             "Unknown variant dtype {}. Expected "
             "either 'scores' or 'counts'.".format(dtype)
         )
+    return columns, type_column
 
-    # 'hgvs_nt', 'hgvs_splice', 'hgvs_pro', 'urn' are present by default
-    if not variants or len(columns) <= 4:
-        return response
 
-    rows = format_csv_rows(variants, columns=columns, dtype=type_column)
-    writer = csv.DictWriter(
-        response, fieldnames=columns, quoting=csv.QUOTE_MINIMAL
+def format_response(scoreset, dtype):
+    """
+    Formats the CSV download of a scoreset. Each variant is formatted into a
+    row including the columns `hgvs_nt`, `hgvs_pro`, `urn` and other uploaded
+    columns.
+
+    The comment header is built immediately. Variant rows are produced
+    lazily, ordered by the numeric suffix of their urn in SQL and read with a
+    server-side cursor, so that the response can be streamed without
+    loading the whole scoreset into memory.
+
+    Parameters
+    ----------
+    scoreset : `dataset.models.scoreset.ScoreSet`
+        The scoreset requested.
+    dtype : str
+        The type of data requested. Either 'scores' or 'counts'.
+
+    Returns
+    -------
+    Iterator[str]
+        Chunks of CSV text to pass to a `StreamingHttpResponse`.
+    """
+    lines = format_header(scoreset)
+    columns, type_column = download_columns(scoreset, dtype)
+    return itertools.chain(
+        lines, stream_csv_rows(scoreset, columns=columns, dtype=type_column)
     )
-    writer.writeheader()
-    writer.writerows(rows)
-    return response
 
 
-def scoreset_score_data(request, urn):
-    response = HttpResponse(content_type="text/csv")
-    response[
-        "Content-Disposition"
-    ] = 'attachment; filename="{}_scores.csv"'.format(urn)
+def stream_csv_rows(scoreset, columns, dtype):
+    """
+    Writes the variants of `scoreset` as CSV, yielding the text written
+    every `DOWNLOAD_BATCH_SIZE` rows. Nothing is written if the scoreset has
+    no variants or no data columns.
+    """
+    # 'hgvs_nt', 'hgvs_splice', 'hgvs_pro', 'urn' are present by default
+    if len(columns) <= 4:
+        return
+
+    variants = ColumnarVariantData.load_variants(
+        scoreset,
+        scoreset.children.only(
+            "urn",
+            constants.hgvs_nt_column,
+            constants.hgvs_splice_column,
+            constants.hgvs_pro_column,
+            "data",
+        ).order_by(urn_number_expression(), "id"),
+    )
+    rows = format_csv_rows(variants, columns=columns, dtype=dtype)
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, quoting=csv.QUOTE_MINIMAL)
+    for (i, row) in enumerate(rows, start=1):
+        if i == 1:
+            writer.writerow(columns)
+        writer.writerow([row[column] for column in columns])
+        if i % DOWNLOAD_BATCH_SIZE == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+def scoreset_data_response(request, urn, dtype):
     scoreset = validate_request(request, urn)
     if not isinstance(scoreset, ScoreSet):
         return scoreset  # Invalid request, return response.
-    return format_response(response, scoreset, dtype="scores")
 
+    # Published scoresets are served from pre-rendered files when available.
+    response = artifact_response(request, scoreset, dtype)
+    if response is not None:
+        return response
 
-def scoreset_count_data(request, urn):
-    response = HttpResponse(content_type="text/csv")
+    response = StreamingHttpResponse(
+        format_response(scoreset, dtype=dtype), content_type="text/csv"
+    )
     response[
         "Content-Disposition"
-    ] = 'attachment; filename="{}_counts.csv"'.format(urn)
-    scoreset = validate_request(request, urn)
-    if not isinstance(scoreset, ScoreSet):
-        return scoreset  # Invalid request, return response.
-    return format_response(response, scoreset, dtype="counts")
+    ] = 'attachment; filename="{}_{}.csv"'.format(urn, dtype)
+    return response
+
+
+def scoreset_score_data(request, urn):
+    return scoreset_data_response(request, urn, dtype="scores")
+
 
+def scoreset_count_data(request, urn):
+    return scoreset_data_response(request, urn, dtype="counts")
 
+
+@caching.cache_anonymous_response(lambda urn: (caching.dataset_tag(urn),))
 def scoreset_metadata(request, urn):
     instance_or_response = validate_request(request, urn)
     if not isinstance(instance_or_response, ScoreSet):
@@ -858,63 +1013,294 @@ def scoreset_metadata(request, urn):
     return JsonResponse(scoreset.extra_metadata, status=200)
 
 
+def parse_variant_query(params):
+    """
+    Parses the query parameters of `scoreset_variants`.
+
+    Raises
+    ------
+    ValueError : A parameter has an invalid value.
+    """
+    query = {"order": params.get("order") or None}
+    if query["order"] not in (None, "score", "-score"):
+        raise ValueError("'order' must be one of 'score' or '-score'.")
+
+    for name in ("score__lt", "score__gt"):
+        value = params.get(name) or None
+        if value is not None:
+            try:
+                value = float(value)
+                if not math.isfinite(value):
+                    raise ValueError()
+            except ValueError:
+                raise ValueError("'{}' must be a finite number.".format(name))
+        query[name] = value
+
+    for name in ("start", "end"):
+        value = params.get(name) or None
+        if value is not None:
+            try:
+                value = int(value)
+            except ValueError:
+                raise ValueError("'{}' must be an integer.".format(name))
+        query[name] = value
+    if query["start"] is None and query["end"] is not None:
+        raise ValueError("'end' requires 'start'.")
+    if query["end"] is None:
+        query["end"] = query["start"]
+    if query["start"] is not None and query["end"] < query["start"]:
+        raise ValueError("'end' must not be less than 'start'.")
+
+    query["column"] = params.get("column") or constants.hgvs_pro_column
+    if query["column"] not in constants.hgvs_columns:
+        raise ValueError(
+            "'column' must be one of {}.".format(
+                ", ".join("'{}'".format(c) for c in constants.hgvs_columns)
+            )
+        )
+
+    try:
+        query["limit"] = int(params.get("limit") or VARIANT_PAGE_SIZE)
+        if not 0 < query["limit"] <= MAX_VARIANT_PAGE_SIZE:
+            raise ValueError()
+    except ValueError:
+        raise ValueError(
+            "'limit' must be between 1 and {}.".format(MAX_VARIANT_PAGE_SIZE)
+        )
+    query["cursor"] = params.get("cursor") or None
+    return query
+
+
+def variant_page(
+    scoreset,
+    order=None,
+    score__lt=None,
+    score__gt=None,
+    start=None,
+    end=None,
+    column=constants.hgvs_pro_column,
+    limit=VARIANT_PAGE_SIZE,
+    cursor=None,
+):
+    """
+    Fetches a page of the variants of `scoreset` using keyset pagination.
+
+    Filtering or ordering on the primary score restricts the variants to
+    those with a numeric score, so that the query can be answered from the
+    score index. Otherwise variants are returned in order of creation.
+
+    Parameters
+    ----------
+    scoreset : `ScoreSet`
+        Score set to list the variants of.
+    order : str, optional
+        Either 'score' or '-score'.
+    score__lt : float, optional
+        Only include variants with a score less than this value.
+    score__gt : float, optional
+        Only include variants with a score greater than this value.
+    start : int, optional
+        Only include variants touching a position from `start` to `end`,
+        as indexed by `VariantSpan`.
+    end : int, optional
+        Last position of the region, inclusive.
+    column : str
+        HGVS column the region refers to.
+    limit : int
+        Number of variants per page.
+    cursor : str, optional
+        Cursor returned with the previous page of the same ordering.
+
+    Returns
+    -------
+    tuple[list[`Variant`], str]
+        The variants and the cursor of the next page, if any.
+    """
+    variants = scoreset.children.only(
+        "urn",
+        constants.hgvs_nt_column,
+        constants.hgvs_splice_column,
+        constants.hgvs_pro_column,
+        "data",
+    )
+    if start is not None:
+        variants = variants.overlapping(
+            start, end, column=column, scoreset=scoreset
+        )
+    if order is not None or score__lt is not None or score__gt is not None:
+        variants = numeric_scores(variants)
+        if score__lt is not None:
+            variants = variants.filter(score__lt=score__lt)
+        if score__gt is not None:
+            variants = variants.filter(score__gt=score__gt)
+
+    field = "score" if order is not None else "pk"
+    descending = order == "-score"
+    prefix = "-" if descending else ""
+    if field == "pk":
+        variants = variants.order_by("pk")
+    else:
+        variants = variants.order_by(prefix + "score", prefix + "pk")
+
+    position = decode_cursor(cursor)
+    if position is not None and (
+        position["field"] == field and position["descending"] == descending
+    ):
+        after, bound = ("lt", "lte") if descending else ("gt", "gte")
+        pk_after = Q(**{"pk__{}".format(after): position["pk"]})
+        if field == "pk":
+            variants = variants.filter(pk_after)
+        else:
+            # The redundant bound on the score lets the seek be answered by
+            # a range scan of the score index.
+            variants = variants.filter(
+                Q(**{"score__{}".format(bound): position["key"]}),
+                Q(**{"score__{}".format(after): position["key"]})
+                | (Q(score=position["key"]) & pk_after),
+            )
+
+    rows = list(variants[: limit + 1])
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = encode_cursor(
+            {
+                "field": field,
+                "descending": descending,
+                "key": getattr(last, "score", None),
+                "pk": last.pk,
+                "reverse": False,
+            }
+        )
+    return rows, next_cursor
+
+
+@caching.cache_anonymous_response(lambda urn: (caching.dataset_tag(urn),))
+def scoreset_variants(request, urn):
+    """
+    Lists the variants of a score set as JSON. Accepts the query parameters
+    `score__lt`, `score__gt`, `order` ('score' or '-score'), the region
+    `start`, `end` and `column` ('hgvs_pro' by default), `limit` and
+    `cursor`; see `variant_page`.
+    """
+    scoreset = validate_request(request, urn)
+    if not isinstance(scoreset, ScoreSet):
+        return scoreset  # Invalid request, return response.
+
+    try:
+        query = parse_variant_query(request.GET)
+    except ValueError as e:
+        return JsonResponse({"detail": str(e)}, status=400)
+
+    variants, next_cursor = variant_page(scoreset, **query)
+    next_url = None
+    if next_cursor is not None:
+        next_url = replace_query_param(
+            request.build_absolute_uri(), "cursor", next_cursor
+        )
+    results = [
+        OrderedDict(
+            [
+                ("urn", variant.urn),
+                (constants.hgvs_nt_column, variant.hgvs_nt),
+                (constants.hgvs_splice_column, variant.hgvs_splice),
+                (constants.hgvs_pro_column, variant.hgvs_pro),
+                (
+                    "score",
+                    variant.data[constants.variant_score_data].get(
+                        constants.required_score_column
+                    ),
+                ),
+                ("data", variant.data),
+            ]
+        )
+        for variant in variants
+    ]
+    return JsonResponse(
+        OrderedDict([("next", next_url), ("results", results)]), status=200
+    )
+
+
 # ----- Other API endpoints
-class KeywordViewSet(viewsets.ModelViewSet):
+class KeywordViewSet(caching.AnonymousCacheMixin, viewsets.ModelViewSet):
     http_method_names = ("get",)
+    cache_tags = (caching.METADATA,)
     queryset = meta_models.Keyword.objects.all()
     serializer_class = meta_serializers.KeywordSerializer
 
 
-class PubmedIdentifierViewSet(viewsets.ModelViewSet):
+class PubmedIdentifierViewSet(
+    caching.AnonymousCacheMixin, viewsets.ModelViewSet
+):
     http_method_names = ("get",)
+    cache_tags = (caching.METADATA,)
     queryset = meta_models.PubmedIdentifier.objects.all()
     serializer_class = meta_serializers.PubmedIdentifierSerializer
 
 
-class SraIdentifierViewSet(viewsets.ModelViewSet):
+class SraIdentifierViewSet(caching.AnonymousCacheMixin, viewsets.ModelViewSet):
     http_method_names = ("get",)
+    cache_tags = (caching.METADATA,)
     queryset = meta_models.SraIdentifier.objects.all()
     serializer_class = meta_serializers.SraIdentifierSerializer
 
 
-class DoiIdentifierViewSet(viewsets.ModelViewSet):
+class DoiIdentifierViewSet(caching.AnonymousCacheMixin, viewsets.ModelViewSet):
     http_method_names = ("get",)
+    cache_tags = (caching.METADATA,)
     queryset = meta_models.DoiIdentifier.objects.all()
     serializer_class = meta_serializers.DoiIdentifierSerializer
 
 
-class EnsemblIdentifierViewSet(viewsets.ModelViewSet):
+class EnsemblIdentifierViewSet(
+    caching.AnonymousCacheMixin, viewsets.ModelViewSet
+):
     http_method_names = ("get",)
+    cache_tags = (caching.METADATA,)
     queryset = meta_models.EnsemblIdentifier.objects.all()
     serializer_class = meta_serializers.EnsemblIdentifierSerializer
 
 
-class RefseqIdentifierViewSet(viewsets.ModelViewSet):
+class RefseqIdentifierViewSet(
+    caching.AnonymousCacheMixin, viewsets.ModelViewSet
+):
     http_method_names = ("get",)
+    cache_tags = (caching.METADATA,)
     queryset = meta_models.RefseqIdentifier.objects.all()
     serializer_class = meta_serializers.RefseqIdentifierSerializer
 
 
-class UniprotIdentifierViewSet(viewsets.ModelViewSet):
+class UniprotIdentifierViewSet(
+    caching.AnonymousCacheMixin, viewsets.ModelViewSet
+):
     http_method_names = ("get",)
+    cache_tags = (caching.METADATA,)
     queryset = meta_models.UniprotIdentifier.objects.all()
     serializer_class = meta_serializers.UniprotIdentifierSerializer
 
 
-class GenomeIdentifierViewSet(viewsets.ModelViewSet):
+class GenomeIdentifierViewSet(
+    caching.AnonymousCacheMixin, viewsets.ModelViewSet
+):
     http_method_names = ("get",)
+    cache_tags = (caching.METADATA,)
     queryset = meta_models.GenomeIdentifier.objects.all()
     serializer_class = meta_serializers.GenomeIdentifierSerializer
 
 
-class TargetGeneViewSet(viewsets.ModelViewSet):
+class TargetGeneViewSet(caching.AnonymousCacheMixin, viewsets.ModelViewSet):
     http_method_names = ("get",)
+    cache_tags = (caching.TARGETS,)
     queryset = genome_models.TargetGene.objects.exclude(scoreset__private=True)
     serializer_class = genome_serializers.TargetGeneSerializer
 
 
-class ReferenceGenomeViewSet(viewsets.ModelViewSet):
+class ReferenceGenomeViewSet(
+    caching.AnonymousCacheMixin, viewsets.ModelViewSet
+):
     http_method_names = ("get",)
+    cache_tags = (caching.TARGETS,)
     queryset = genome_models.ReferenceGenome.objects.all()
     serializer_class = genome_serializers.ReferenceGenomeSerializer
 
@@ -956,8 +1342,6 @@ class VariantView(views.APIView):
         -------
         `HttpResponse`
         """
-        MAX_VARIANTS_TO_RETURN = 50
-
         variant_id_key = "variant_id"
         if variant_id_key not in request.query_params:
             response_data = {
@@ -992,16 +1376,25 @@ class VariantView(views.APIView):
             }
             return Response(response_data, status=status.HTTP_400_BAD_REQUEST)
 
-        if limit < 0 or limit > MAX_VARIANTS_TO_RETURN:
-            results_uuid = str(uuid.uuid4())
-            format_variant_large_get_response(
-                results_uuid, variant_urn, offset, limit
+        if limit < 0 or limit > MAX_INLINE_VARIANTS:
+            job = ResultJob.objects.create()
+            results_uuid = str(job.uuid)
+            transaction.on_commit(
+                lambda: format_variant_large_get_response.submit_task(
+                    kwargs=dict(
+                        results_uuid=results_uuid,
+                        variant_urn=variant_urn,
+                        offset=offset,
+                        limit=limit,
+                    )
+                )
             )
             return JsonResponse(
                 {
                     "status": "Large response.",
                     "message": f"When ready, your results will be available for "
-                    f"download at /api/results/{results_uuid} .",
+                    f"download at /api/results/{results_uuid} . Check their "
+                    f"progress at /api/results/{results_uuid}/status/ .",
                     "results_uuid": results_uuid,
                 },
                 status=status.HTTP_202_ACCEPTED,
@@ -1041,14 +1434,58 @@ class ResultsView(views.APIView):
             The zipped file that contains the response generated from
             VariantView.get()
         """
-        filepath = f"{BASE_RESULTS_DIR}/{results_uuid}.zip"
-        if not os.path.exists(filepath):
+        job = results.get_job(results_uuid)
+        filepath = results.result_path(results_uuid)
+        if job is None or not job.is_ready or not os.path.exists(filepath):
             return JsonResponse(
                 {
                     "status": "Bad request.",
                     "message": "File not found. Either check later or make your "
                     "request again.",
+                    "state": job.state if job is not None else None,
                 },
                 status=status.HTTP_404_NOT_FOUND,
             )
-        return FileResponse(open(filepath, "rb"))
+        response = FileResponse(
+            open(filepath, "rb"), content_type="application/zip"
+        )
+        response["Content-Disposition"] = 'attachment; filename="{}"'.format(
+            os.path.basename(filepath)
+        )
+        return response
+
+
+class ResultStatusView(views.APIView):
+    """
+    Reports the state of results generated asynchronously by VariantView.
+    """
+
+    def get(self, request, results_uuid):
+        """
+        Get the state of the results with uuid `results_uuid`: one of
+        'pending', 'running', 'ready' or 'failed'.
+
+        Returns
+        -------
+        `JsonResponse`
+        """
+        job = results.get_job(results_uuid)
+        if job is None:
+            return JsonResponse(
+                {
+                    "status": "Not found.",
+                    "message": "These results do not exist or have expired. "
+                    "Please make your request again.",
+                },
+                status=status.HTTP_404_NOT_FOUND,
+            )
+        return JsonResponse(
+            {
+                "results_uuid": str(job.uuid),
+                "state": job.state,
+                "size": job.size if job.is_ready else None,
+                "expires": job.expiry_date.isoformat(),
+                "error": job.error or None,
+                "url": f"/api/results/{job.uuid}" if job.is_ready else None,
+            }
+        )
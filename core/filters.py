@@ -3,6 +3,9 @@ import csv
 from django.core.exceptions import ImproperlyConfigured
 
 from django_filters import filters
+from django_filters.rest_framework import DjangoFilterBackend
+
+from .lookups import TrigramIContains
 
 
 class MultiCharFilter(filters.CharFilter):
@@ -25,3 +28,41 @@ class MultiCharFilter(filters.CharFilter):
 
 class CSVCharFilter(MultiCharFilter):
     sep = ","
+
+
+class TrigramFilterSetMixin:
+    """
+    Mixin for a `FilterSet` that can rewrite its `icontains` char filters
+    into `trgm_icontains` lookups answered from `pg_trgm` indexes. Off by
+    default; enabled per instance with `trigram=True`.
+    """
+
+    trigram = False
+
+    def __init__(self, *args, trigram=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if trigram is not None:
+            self.trigram = trigram
+        if self.trigram:
+            for filter_ in self.filters.values():
+                if (
+                    isinstance(filter_, filters.CharFilter)
+                    and filter_.lookup_expr == "icontains"
+                ):
+                    filter_.lookup_expr = TrigramIContains.lookup_name
+
+
+class TrigramFilterBackend(DjangoFilterBackend):
+    """
+    `DjangoFilterBackend` building filter sets that support it in trigram
+    mode.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        filter_class = self.get_filter_class(view, queryset)
+        if filter_class is None:
+            return queryset
+        kwargs = dict(queryset=queryset, request=request)
+        if issubclass(filter_class, TrigramFilterSetMixin):
+            kwargs["trigram"] = True
+        return filter_class(request.query_params, **kwargs).qs
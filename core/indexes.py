@@ -0,0 +1,34 @@
+from django.db import migrations
+
+
+def trigram_index(table: str, column: str) -> migrations.RunSQL:
+    """
+    Migration operation creating a `pg_trgm` GIN index on `table.column`
+    for `trgm_icontains` lookups. Requires the `pg_trgm` extension, see
+    `django.contrib.postgres.operations.TrigramExtension`.
+    """
+    name = "{}_{}_trgm".format(table, column)
+    return migrations.RunSQL(
+        sql='CREATE INDEX "{}" ON "{}" USING gin ("{}" gin_trgm_ops)'.format(
+            name, table, column
+        ),
+        reverse_sql='DROP INDEX IF EXISTS "{}"'.format(name),
+    )
+
+
+def prefix_index(table: str, column: str, length: int) -> migrations.RunSQL:
+    """
+    Migration operation creating a B-tree index on the first `length`
+    characters of `table.column` and the primary key, for keyset pagination
+    on unbounded text columns. See `core.pagination.PREFIX_SORTED_FIELDS`.
+    """
+    name = "{}_{}_prefix".format(table, column)
+    return migrations.RunSQL(
+        sql=(
+            'CREATE INDEX "{}" ON "{}" '
+            '(SUBSTRING("{}", 1, {}), "id")'.format(
+                name, table, column, length
+            )
+        ),
+        reverse_sql='DROP INDEX IF EXISTS "{}"'.format(name),
+    )
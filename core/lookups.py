@@ -0,0 +1,23 @@
+from django.db.models import CharField, TextField
+from django.db.models.lookups import IContains
+
+
+class TrigramIContains(IContains):
+    """
+    Case-insensitive containment written as `ILIKE`, which Postgres can
+    answer from a `gin_trgm_ops` index on the column. The built-in
+    `icontains` lookup compares `UPPER(column)` instead, which such an
+    index does not cover.
+    """
+
+    lookup_name = "trgm_icontains"
+
+    def as_sql(self, compiler, connection):
+        lhs_sql, params = self.process_lhs(compiler, connection)
+        rhs_sql, rhs_params = self.process_rhs(compiler, connection)
+        params.extend(rhs_params)
+        return "{} ILIKE {}".format(lhs_sql, rhs_sql), params
+
+
+CharField.register_lookup(TrigramIContains)
+TextField.register_lookup(TrigramIContains)
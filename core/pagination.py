@@ -0,0 +1,251 @@
+"""
+Keyset pagination for the search table and the API list endpoints.
+
+Pages are fetched by filtering on the sort key of the row at the edge of
+the previous page instead of by OFFSET, so every page costs the same as the
+first one. Positions are handed to the client as opaque cursors.
+
+Pages are ordered and seeked on the raw column so that its index can be
+scanned in either direction. Null values sort after all others, as they do
+in a Postgres index. Unbounded text fields in `PREFIX_SORTED_FIELDS` are
+sorted on their first `SORT_PREFIX_LENGTH` characters instead, which are
+indexed by expression since the whole value may not fit in an index entry.
+"""
+import base64
+import json
+from collections import OrderedDict
+from typing import List, Optional
+
+from django.db.models import F, Q, QuerySet
+from django.db.models.functions import Substr
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+SORT_KEY = "keyset_sort_key"
+SORT_PREFIX_LENGTH = 255
+PREFIX_SORTED_FIELDS = ("short_description",)
+
+
+class KeysetPage:
+    def __init__(
+        self,
+        object_list: List,
+        next_cursor: Optional[str] = None,
+        previous_cursor: Optional[str] = None,
+    ):
+        self.object_list = object_list
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+
+
+def encode_cursor(position: dict) -> str:
+    return base64.urlsafe_b64encode(json.dumps(position).encode()).decode()
+
+
+def decode_cursor(cursor: Optional[str]) -> Optional[dict]:
+    """Returns the position encoded in `cursor`, or None if it is invalid."""
+    if not cursor:
+        return None
+    try:
+        position = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (ValueError, TypeError):
+        return None
+    if not isinstance(position, dict):
+        return None
+    if not {"field", "descending", "key", "pk", "reverse"} <= set(position):
+        return None
+    return position
+
+
+def sort_key(field: str):
+    """Returns the expression pages ordered by `field` are sorted on."""
+    if field in PREFIX_SORTED_FIELDS:
+        return Substr(F(field), 1, SORT_PREFIX_LENGTH)
+    return F(field)
+
+
+def seek(key, pk, ascending: bool) -> Q:
+    """
+    Returns the filter selecting the rows after the row with sort key `key`
+    and primary key `pk`. The redundant bound on the sort key lets the
+    filter be answered by an index range scan.
+    """
+    after, bound = ("gt", "gte") if ascending else ("lt", "lte")
+    isnull = "{}__isnull".format(SORT_KEY)
+    is_null = Q(**{isnull: True})
+    if key is None:
+        tie = is_null & Q(**{"pk__{}".format(after): pk})
+        return tie if ascending else tie | Q(**{isnull: False})
+
+    rows = Q(**{"{}__{}".format(SORT_KEY, bound): key}) & (
+        Q(**{"{}__{}".format(SORT_KEY, after): key})
+        | Q(**{SORT_KEY: key, "pk__{}".format(after): pk})
+    )
+    return rows | is_null if ascending else rows
+
+
+def keyset_page(
+    queryset: QuerySet,
+    field: str,
+    descending: bool = False,
+    per_page: int = 10,
+    cursor: Optional[str] = None,
+    offset: int = 0,
+) -> KeysetPage:
+    """
+    Fetches a page of `queryset` ordered by `field` with the primary key as
+    a tiebreaker. Null values of `field` sort last in ascending order.
+
+    Parameters
+    ----------
+    queryset : `QuerySet`
+    field : str
+        A single-valued field or lookup, such as `urn` or `target__name`.
+    descending : bool
+        Order by `field` in descending order.
+    per_page : int
+        Number of rows per page.
+    cursor : str, optional
+        A cursor returned with a previous page of the same ordering. Cursors
+        for a different ordering are ignored.
+    offset : int
+        Number of rows to skip when no cursor is given. Used to jump to an
+        arbitrary page, after which the returned cursors can be followed.
+
+    Returns
+    -------
+    `KeysetPage`
+    """
+    position = decode_cursor(cursor)
+    if position is not None and (
+        position["field"] != field or position["descending"] != descending
+    ):
+        position = None
+
+    # Walk backwards from the cursor when fetching the previous page.
+    reverse = bool(position and position["reverse"])
+    ascending = descending == reverse
+    prefix = "" if ascending else "-"
+    queryset = queryset.annotate(**{SORT_KEY: sort_key(field)}).order_by(
+        prefix + SORT_KEY, prefix + "pk"
+    )
+
+    if position is not None:
+        queryset = queryset.filter(
+            seek(position["key"], position["pk"], ascending)
+        )
+        offset = 0
+
+    rows = list(queryset[offset : offset + per_page + 1])
+    has_more = len(rows) > per_page
+    rows = rows[:per_page]
+    if reverse:
+        rows.reverse()
+        # The row at the cursor follows this page.
+        has_next, has_previous = True, has_more
+    else:
+        has_next, has_previous = has_more, bool(position or offset)
+
+    def edge(row, backwards):
+        return encode_cursor(
+            {
+                "field": field,
+                "descending": descending,
+                "key": getattr(row, SORT_KEY),
+                "pk": row.pk,
+                "reverse": backwards,
+            }
+        )
+
+    next_cursor = previous_cursor = None
+    if rows:
+        if has_next:
+            next_cursor = edge(rows[-1], backwards=False)
+        if has_previous:
+            previous_cursor = edge(rows[0], backwards=True)
+    return KeysetPage(rows, next_cursor, previous_cursor)
+
+
+class KeysetPagination(BasePagination):
+    """
+    Keyset pagination for DRF list views. Pagination is opt-in: lists are
+    returned whole unless the `page_size` query parameter is given. Results
+    are ordered by the field named in the `ordering` query parameter (one of
+    `orderings`, prefixed with '-' for descending order), with the primary
+    key as a tiebreaker.
+    """
+
+    cursor_query_param = "cursor"
+    page_size_query_param = "page_size"
+    ordering_query_param = "ordering"
+    max_page_size = 1000
+    orderings = {
+        "urn": "urn",
+        "short_description": "short_description",
+        "target": "target__name",
+    }
+    default_ordering = "urn"
+
+    page = None
+    request = None
+
+    def get_page_size(self, request) -> Optional[int]:
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return None
+        if page_size <= 0:
+            return None
+        return min(page_size, self.max_page_size)
+
+    def get_ordering(self, request, view=None):
+        ordering = request.query_params.get(
+            self.ordering_query_param, self.default_ordering
+        )
+        descending = ordering.startswith("-")
+        field = self.orderings.get(ordering.lstrip("-"))
+        if field is None or not self.supports_field(field, view):
+            return self.orderings[self.default_ordering], False
+        return field, descending
+
+    @staticmethod
+    def supports_field(field, view) -> bool:
+        model = getattr(view, "model_class", None)
+        if model is None:
+            return True
+        name = field.split("__")[0]
+        return name in [f.name for f in model._meta.get_fields()]
+
+    def paginate_queryset(self, queryset, request, view=None):
+        page_size = self.get_page_size(request)
+        if page_size is None:
+            return None
+
+        field, descending = self.get_ordering(request, view)
+        self.request = request
+        self.page = keyset_page(
+            queryset,
+            field=field,
+            descending=descending,
+            per_page=page_size,
+            cursor=request.query_params.get(self.cursor_query_param),
+        )
+        return self.page.object_list
+
+    def get_link(self, cursor) -> Optional[str]:
+        if cursor is None:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, cursor)
+
+    def get_paginated_response(self, data):
+        return Response(
+            OrderedDict(
+                [
+                    ("next", self.get_link(self.page.next_cursor)),
+                    ("previous", self.get_link(self.page.previous_cursor)),
+                    ("results", data),
+                ]
+            )
+        )
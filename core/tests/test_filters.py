@@ -1,4 +1,8 @@
-from django.test import TestCase
+from django.test import RequestFactory, TestCase
+
+from dataset import factories as dataset_factories
+from dataset.filters import ScoreSetFilter
+from dataset.models.scoreset import ScoreSet
 
 from metadata import factories as meta_factories
 
@@ -38,3 +42,66 @@ class TestCSVCharFilter(TestCase):
     def test_returns_all_no_value(self):
         qs = self.filter.filter(self.queryset, "")
         self.assertEqual(qs.count(), 3)
+
+
+class TestTrigramIContains(TestCase):
+    def setUp(self):
+        self.kw1 = meta_factories.KeywordFactory(text="Thermostability")
+        self.kw2 = meta_factories.KeywordFactory(text="100% stable")
+        self.queryset = meta_factories.KeywordFactory._meta.model.objects
+
+    def test_matches_case_insensitive_substring(self):
+        qs = self.queryset.filter(text__trgm_icontains="STABIL")
+        self.assertEqual(list(qs), [self.kw1])
+
+    def test_escapes_like_wildcards(self):
+        qs = self.queryset.filter(text__trgm_icontains="0%")
+        self.assertEqual(list(qs), [self.kw2])
+
+    def test_uses_ilike(self):
+        qs = self.queryset.filter(text__trgm_icontains="stab")
+        self.assertIn("ILIKE", str(qs.query))
+
+
+class TestTrigramFilterSetMixin(TestCase):
+    def test_rewrites_icontains_filters_when_enabled(self):
+        filterset = ScoreSetFilter(data={}, trigram=True)
+        self.assertEqual(
+            filterset.filters["title"].lookup_expr, "trgm_icontains"
+        )
+        self.assertEqual(filterset.filters["uniprot"].lookup_expr, "iexact")
+
+    def test_does_not_rewrite_by_default(self):
+        filterset = ScoreSetFilter(data={})
+        self.assertEqual(filterset.filters["title"].lookup_expr, "icontains")
+        self.assertEqual(
+            ScoreSetFilter.base_filters["title"].lookup_expr, "icontains"
+        )
+
+    def test_trigram_mode_returns_same_results(self):
+        scoreset = dataset_factories.ScoreSetFactory(title="Kinase scan")
+        dataset_factories.ScoreSetFactory(title="Other")
+        for trigram in (False, True):
+            qs = ScoreSetFilter(
+                data={"title": "kinase"},
+                queryset=ScoreSet.objects.all(),
+                trigram=trigram,
+            ).qs
+            self.assertEqual(list(qs), [scoreset])
+
+
+class TestTrigramFilterBackend(TestCase):
+    def test_filters_in_trigram_mode(self):
+        scoreset = dataset_factories.ScoreSetFactory(title="Kinase scan")
+        dataset_factories.ScoreSetFactory(title="Other")
+
+        class View:
+            filter_class = ScoreSetFilter
+
+        request = RequestFactory().get("/", data={"title": "KINASE"})
+        request.query_params = request.GET
+        qs = filters.TrigramFilterBackend().filter_queryset(
+            request, ScoreSet.objects.all(), View()
+        )
+        self.assertEqual(list(qs), [scoreset])
+        self.assertIn("ILIKE", str(qs.query))
@@ -0,0 +1,167 @@
+from django.db import connection
+from django.test import TestCase, RequestFactory
+from django.test.utils import CaptureQueriesContext
+from rest_framework.request import Request
+
+from dataset.factories import ScoreSetFactory
+from dataset.models.scoreset import ScoreSet
+from genome.factories import TargetGeneFactory
+
+from ..pagination import KeysetPagination, decode_cursor, keyset_page
+
+
+class TestKeysetPage(TestCase):
+    def setUp(self):
+        self.instances = [
+            ScoreSetFactory(short_description=description)
+            for description in ["b", "a", "b", "c", "a"]
+        ]
+        self.queryset = ScoreSet.objects.all()
+
+    def ordered(self, descending=False):
+        return sorted(
+            self.instances,
+            key=lambda i: (i.short_description, i.pk),
+            reverse=descending,
+        )
+
+    def walk(self, descending=False, field="short_description"):
+        pages = []
+        cursor = None
+        while True:
+            page = keyset_page(
+                self.queryset,
+                field=field,
+                descending=descending,
+                per_page=2,
+                cursor=cursor,
+            )
+            pages.append(page)
+            if page.next_cursor is None:
+                return pages
+            cursor = page.next_cursor
+
+    def test_walks_forward_with_pk_tiebreaker(self):
+        for descending in (False, True):
+            pages = self.walk(descending)
+            self.assertEqual(
+                [i for page in pages for i in page.object_list],
+                self.ordered(descending),
+            )
+            self.assertEqual(len(pages), 3)
+
+    def test_previous_cursor_returns_previous_page(self):
+        pages = self.walk()
+        page = keyset_page(
+            self.queryset,
+            field="short_description",
+            per_page=2,
+            cursor=pages[2].previous_cursor,
+        )
+        self.assertEqual(page.object_list, pages[1].object_list)
+        page = keyset_page(
+            self.queryset,
+            field="short_description",
+            per_page=2,
+            cursor=page.previous_cursor,
+        )
+        self.assertEqual(page.object_list, pages[0].object_list)
+        self.assertIsNone(page.previous_cursor)
+
+    def test_first_page_has_no_previous_cursor(self):
+        self.assertIsNone(self.walk()[0].previous_cursor)
+
+    def test_offset_jumps_to_page(self):
+        page = keyset_page(
+            self.queryset, field="short_description", per_page=2, offset=2
+        )
+        self.assertEqual(page.object_list, self.ordered()[2:4])
+        self.assertIsNotNone(page.previous_cursor)
+        self.assertIsNotNone(page.next_cursor)
+
+    def test_ignores_cursor_for_other_ordering(self):
+        cursor = self.walk()[0].next_cursor
+        page = keyset_page(
+            self.queryset, field="urn", per_page=2, cursor=cursor
+        )
+        self.assertEqual(
+            page.object_list,
+            sorted(self.instances, key=lambda i: (i.urn, i.pk))[:2],
+        )
+
+    def test_sorts_null_values_last(self):
+        TargetGeneFactory(scoreset=self.instances[1], name="BRCA1")
+        page = keyset_page(self.queryset, field="target__name", per_page=5)
+        self.assertEqual(page.object_list[0], self.instances[1])
+
+    def test_walks_across_null_values(self):
+        TargetGeneFactory(scoreset=self.instances[1], name="BRCA1")
+        TargetGeneFactory(scoreset=self.instances[3], name="ABL1")
+        nulls = sorted(
+            set(self.instances) - {self.instances[1], self.instances[3]},
+            key=lambda i: i.pk,
+        )
+        expected = [self.instances[3], self.instances[1]] + nulls
+        for descending in (False, True):
+            pages = self.walk(descending, field="target__name")
+            self.assertEqual(
+                [i for page in pages for i in page.object_list],
+                expected[::-1] if descending else expected,
+            )
+
+    def test_seeks_with_index_range_bound_on_sort_key(self):
+        for descending, bound in ((False, ">="), (True, "<=")):
+            cursor = self.walk(descending, field="urn")[0].next_cursor
+            with CaptureQueriesContext(connection) as queries:
+                keyset_page(
+                    self.queryset,
+                    field="urn",
+                    descending=descending,
+                    per_page=2,
+                    cursor=cursor,
+                )
+            self.assertIn(
+                '"dataset_scoreset"."urn" {} '.format(bound),
+                queries[-1]["sql"],
+            )
+
+    def test_invalid_cursor_is_ignored(self):
+        self.assertIsNone(decode_cursor("not a cursor"))
+        page = keyset_page(
+            self.queryset,
+            field="short_description",
+            per_page=2,
+            cursor="not a cursor",
+        )
+        self.assertEqual(page.object_list, self.ordered()[:2])
+
+
+class TestKeysetPagination(TestCase):
+    def request(self, **params):
+        return Request(RequestFactory().get("/", data=params))
+
+    def test_does_not_paginate_without_page_size(self):
+        ScoreSetFactory()
+        paginator = KeysetPagination()
+        self.assertIsNone(
+            paginator.paginate_queryset(
+                ScoreSet.objects.all(), self.request()
+            )
+        )
+
+    def test_caps_page_size(self):
+        paginator = KeysetPagination()
+        self.assertEqual(
+            paginator.get_page_size(self.request(page_size=10 ** 6)),
+            paginator.max_page_size,
+        )
+
+    def test_orders_by_requested_field(self):
+        a = ScoreSetFactory(short_description="a")
+        b = ScoreSetFactory(short_description="b")
+        paginator = KeysetPagination()
+        results = paginator.paginate_queryset(
+            ScoreSet.objects.all(),
+            self.request(page_size=2, ordering="-short_description"),
+        )
+        self.assertEqual(results, [b, a])
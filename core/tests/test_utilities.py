@@ -1,6 +1,8 @@
 from datetime import datetime, timedelta
 from numpy import NaN
 
+import pandas as pd
+
 from django.conf import settings
 from django.test import TestCase, mock
 
@@ -10,7 +12,13 @@ from accounts.factories import UserFactory
 from dataset.factories import ScoreSetFactory
 from dataset import constants
 
-from ..utilities import notify_admins, is_null, format_delta, base_url
+from ..utilities import (
+    notify_admins,
+    is_null,
+    null_mask,
+    format_delta,
+    base_url,
+)
 
 
 class TestBaseUrl(TestCase):
@@ -70,6 +78,22 @@ class TestIsNull(TestCase):
         self.assertFalse(is_null("hello world"))
 
 
+class TestNullMask(TestCase):
+    def test_matches_is_null_for_text_values(self):
+        values = pd.Series(list(null_values_list) + [" NA ", "c.1A>G", 0])
+        self.assertListEqual(
+            null_mask(values).tolist(), [bool(is_null(v)) for v in values]
+        )
+
+    def test_detects_nan_in_numeric_values(self):
+        values = pd.Series([1.0, NaN, 0.0])
+        self.assertListEqual(null_mask(values).tolist(), [False, True, False])
+
+    def test_keeps_duplicate_index(self):
+        values = pd.Series(["a", "None"], index=["x", "x"])
+        self.assertListEqual(null_mask(values).tolist(), [False, True])
+
+
 class TestFormatDelta(TestCase):
     def test_correctly_deduces_today(self):
         ta = datetime.now()
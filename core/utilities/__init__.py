@@ -53,6 +53,24 @@ def is_null(value):
     return null_values_re.fullmatch(value) or not value
 
 
+def null_mask(values):
+    """
+    Vectorized counterpart of `is_null` for a `pd.Series`. Returns a boolean
+    `pd.Series` which is True where the value is missing or where the
+    stripped, lower-cased string value is one of `null_values_list`.
+    """
+    mask = values.isna().to_numpy(copy=True)
+    if values.dtype == object:
+        present = pd.Series(values.to_numpy()[~mask]).astype(str)
+        mask[~mask] = (
+            present.str.strip()
+            .str.lower()
+            .isin([v.lower() for v in null_values_list])
+            .to_numpy()
+        )
+    return pd.Series(mask, index=values.index)
+
+
 def format_delta(ta, tb=None):
     if tb is None:
         tb = datetime.now()
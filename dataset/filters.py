@@ -1,4 +1,3 @@
-import re
 import csv
 
 from django_filters import FilterSet, filters, constants
@@ -7,15 +6,18 @@ from django.contrib.auth.models import Group, User
 
 from django import forms
 
-from core.filters import CSVCharFilter
+from accounts.permission_cache import (
+    get_contributors,
+    is_contributor,
+    prefetch_contributors,
+)
+from accounts.permissions import group_instance_pks, visible_to_user
+from core.filters import CSVCharFilter, TrigramFilterSetMixin
 
 from . import models
 
 
-digit_re = re.compile(r"\d+")
-
-
-class DatasetModelFilter(FilterSet):
+class DatasetModelFilter(TrigramFilterSetMixin, FilterSet):
     """
     Filter for the base `DatasetModel` fields:
         - urn
@@ -131,34 +133,21 @@ class DatasetModelFilter(FilterSet):
     def contributor_model_ids(self, user, queryset=None):
         if queryset is None:
             queryset = self.qs
-        model_class_name = queryset.model.__name__.lower()
-        instance_group_names = (
-            user.groups.filter(name__icontains=model_class_name)
-        ).values_list("name", flat=True)
-        ids = re.findall(digit_re, ",".join(instance_group_names))
-        return ids
+        return group_instance_pks(user, queryset.model)
 
     def filter_for_user(self, user, qs=None):
         if qs is None:
             qs = self.qs
-
-        private_visible_ids = []
-        if user is not None:
-            private_visible_ids = self.contributor_model_ids(user, qs)
-
-        public = qs.filter(private=False)
-        private = qs.filter(private=True).filter(id__in=private_visible_ids)
-        return (public | private).distinct()
+        return visible_to_user(qs, user).distinct()
 
     def filter_contributor(self, queryset, name, value):
-        model_ids = set()
+        query = Q()
         for v in self.split(value):
-            users = User.objects.filter(**{name: v})
-            for user in users:
-                model_ids |= set(
-                    self.contributor_model_ids(user, queryset=queryset)
-                )
-        return queryset.filter(id__in=model_ids)
+            query |= Q(**{name: v})
+        users = User.objects.filter(query)
+        return queryset.filter(
+            id__in=self.contributor_model_ids(users, queryset=queryset)
+        )
 
     def filter_contributor_display_name(self, queryset, name, value):
         # FIXME: Optimize this. Remove triple for loop. Can make a new
@@ -168,12 +157,14 @@ class DatasetModelFilter(FilterSet):
         if not queryset.count():
             return queryset
         model = queryset.first().__class__
-        for instance in queryset.all():
+        instances = list(queryset.all())
+        prefetch_contributors(instances)
+        for instance in instances:
             for v in self.split(value):
                 matches = any(
                     [
                         v.lower() in c.profile.get_display_name().lower()
-                        for c in instance.contributors
+                        for c in get_contributors(instance)
                     ]
                 )
                 if matches:
@@ -244,7 +235,7 @@ class ExperimentFilter(DatasetModelFilter):
         )
         for scoreset in scoresets:
             if scoreset.private:
-                if user is not None and user in scoreset.contributors:
+                if is_contributor(user, scoreset):
                     experiments.add(scoreset.parent.pk)
             else:
                 experiments.add(scoreset.parent.pk)
@@ -25,6 +25,7 @@ from ..forms.base import DatasetModelForm
 from ..models import ExperimentSet
 from ..models.experiment import Experiment
 from ..models.scoreset import ScoreSet
+from ..staging import stage_variants
 from ..validators import (
     validate_scoreset_score_data_input,
     validate_csv_extension,
@@ -693,8 +694,8 @@ class ScoreSetForm(DatasetModelForm):
             if not has_count_data:
                 count_data = MaveDataset()
             variants = {
-                "scores_df": score_data.data(serializable=True),
-                "counts_df": count_data.data(serializable=True),
+                "scores": score_data,
+                "counts": count_data,
                 "index": score_data.index_column,
             }
             cleaned_data["variants"] = variants
@@ -745,12 +746,24 @@ class ScoreSetForm(DatasetModelForm):
     def serialize_variants(
         self,
     ) -> Tuple[pd.DataFrame, pd.DataFrame, Optional[str]]:
-        """Serializes variants in JSON format."""
+        """Returns the validated scores and counts dataframes and index."""
         variants = self.cleaned_data.get("variants", {})
-        scores_df = variants.get("scores_df", pd.DataFrame())
-        counts_df = variants.get("counts_df", pd.DataFrame())
+        scores = variants.get("scores", MaveDataset())
+        counts = variants.get("counts", MaveDataset())
         index = variants.get("index", None)
-        return scores_df, counts_df, index
+        return scores.data(), counts.data(), index
+
+    def stage_variants(self) -> Tuple[str, Optional[str]]:
+        """
+        Moves the validated scores and counts into a staged upload for
+        `dataset.tasks.create_variants` without reading them back into
+        memory. Returns the staged upload handle and the index column.
+        """
+        variants = self.cleaned_data.get("variants", {})
+        handle = stage_variants(
+            variants["scores"].frame, variants["counts"].frame
+        )
+        return handle, variants["index"]
 
     def has_variants(self):
         return bool(self.cleaned_data.get("variants", {}))
@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def populate_latest_versions(apps, schema_editor):
+    ScoreSet = apps.get_model("dataset", "ScoreSet")
+    rows = ScoreSet.objects.values_list("pk", "replaces_id", "private")
+    private = {pk: is_private for (pk, _, is_private) in rows}
+    next_pk = {replaces: pk for (pk, replaces, _) in rows if replaces}
+
+    for pk in private:
+        latest = pk
+        while latest in next_pk:
+            latest = next_pk[latest]
+        latest_public = pk
+        while latest_public in next_pk and not private[next_pk[latest_public]]:
+            latest_public = next_pk[latest_public]
+        ScoreSet.objects.filter(pk=pk).update(
+            latest_version_id=latest, latest_public_version_id=latest_public
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("dataset", "0017_auto_20210825_1634"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="scoreset",
+            name="latest_public_version",
+            field=models.ForeignKey(
+                blank=True,
+                editable=False,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="+",
+                to="dataset.ScoreSet",
+            ),
+        ),
+        migrations.AddField(
+            model_name="scoreset",
+            name="latest_version",
+            field=models.ForeignKey(
+                blank=True,
+                editable=False,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="+",
+                to="dataset.ScoreSet",
+            ),
+        ),
+        migrations.RunPython(
+            populate_latest_versions, migrations.RunPython.noop
+        ),
+    ]
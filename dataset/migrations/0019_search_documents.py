@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+import operator
+from functools import reduce
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.contrib.postgres.search import SearchVector
+from django.db import migrations
+from django.db.models import TextField, Value
+
+# Copied from dataset.models.base as of this migration, since migrations
+# must not depend on the current models.
+SEARCH_CONFIG = "english"
+
+
+def search_document_text(instance, user_model):
+    def values(manager, field):
+        return [str(v) for v in manager.values_list(field, flat=True)]
+
+    group_prefix = "{}:{}-".format(instance._meta.model_name, instance.pk)
+    contributors = user_model.objects.filter(
+        groups__name__startswith=group_prefix
+    ).distinct()
+    names = []
+    for first, last, username in contributors.values_list(
+        "first_name", "last_name", "username"
+    ):
+        names.extend([first, last, username])
+
+    return {
+        "A": " ".join([instance.urn or "", instance.title]),
+        "B": " ".join(
+            [instance.short_description]
+            + values(instance.keywords, "text")
+            + values(instance.doi_ids, "identifier")
+            + values(instance.sra_ids, "identifier")
+            + values(instance.pubmed_ids, "identifier")
+        ),
+        "C": " ".join(names),
+        "D": " ".join([instance.abstract_text, instance.method_text]),
+    }
+
+
+def search_document_vector(text):
+    return reduce(
+        operator.add,
+        [
+            SearchVector(
+                Value(text[weight], output_field=TextField()),
+                weight=weight,
+                config=SEARCH_CONFIG,
+            )
+            for weight in sorted(text)
+        ],
+    )
+
+
+def populate_search_documents(apps, schema_editor):
+    User = apps.get_model("auth", "User")
+    for model_name in ("Experiment", "ScoreSet"):
+        model = apps.get_model("dataset", model_name)
+        for instance in model.objects.all():
+            text = search_document_text(instance, User)
+            model.objects.filter(pk=instance.pk).update(
+                search_document=search_document_vector(text)
+            )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("dataset", "0018_scoreset_latest_versions"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="experiment",
+            name="search_document",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False, null=True
+            ),
+        ),
+        migrations.AddField(
+            model_name="scoreset",
+            name="search_document",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False, null=True
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="experiment",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_document"], name="dataset_exp_search_gin"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="scoreset",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_document"], name="dataset_scs_search_gin"
+            ),
+        ),
+        migrations.RunPython(
+            populate_search_documents, migrations.RunPython.noop
+        ),
+    ]
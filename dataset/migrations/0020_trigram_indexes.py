@@ -0,0 +1,24 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import migrations
+
+from core.indexes import trigram_index
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("dataset", "0019_search_documents"),
+        # Creates the pg_trgm extension.
+        ("metadata", "0008_trigram_indexes"),
+    ]
+
+    operations = [
+        trigram_index("dataset_experimentset", "urn"),
+        trigram_index("dataset_experimentset", "title"),
+        trigram_index("dataset_experiment", "urn"),
+        trigram_index("dataset_experiment", "title"),
+        trigram_index("dataset_scoreset", "urn"),
+        trigram_index("dataset_scoreset", "title"),
+    ]
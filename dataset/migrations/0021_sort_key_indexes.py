@@ -0,0 +1,18 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import migrations
+
+from core.indexes import prefix_index
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [("dataset", "0020_trigram_indexes")]
+
+    # Matches `core.pagination.SORT_PREFIX_LENGTH`.
+    operations = [
+        prefix_index("dataset_experimentset", "short_description", 255),
+        prefix_index("dataset_experiment", "short_description", 255),
+        prefix_index("dataset_scoreset", "short_description", 255),
+    ]
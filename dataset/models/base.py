@@ -1,16 +1,28 @@
 import datetime
-from typing import Optional
+import operator
+import re
+from functools import reduce
+from typing import Dict, Optional
 
 from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group
 from django.contrib.postgres.fields import JSONField
+from django.contrib.postgres.search import (
+    SearchQuery,
+    SearchRank,
+    SearchVector,
+)
 from django.core.validators import MinValueValidator
 from django.db import models, transaction
-from django.db.models import QuerySet
+from django.db.models import F, QuerySet, TextField, Value
+from django.db.models.signals import m2m_changed, post_save
+from django.dispatch import receiver
 
 from core.mixins import SingletonMixin
 from core.models import TimeStampedModel
 
 from accounts.mixins import GroupPermissionMixin
+from accounts.permission_cache import is_contributor
 
 from core.utilities import pandoc
 from metadata.models import (
@@ -26,6 +38,13 @@ from dataset import constants
 
 User = get_user_model()
 
+# Text search configuration used for search documents and queries.
+SEARCH_CONFIG = "english"
+
+# Models with a maintained `search_document`, keyed by their permission
+# group prefix. Populated by `register_search_document`.
+SEARCHABLE_MODELS = {}
+
 
 class PublicDatasetCounter(SingletonMixin, TimeStampedModel):
     """
@@ -302,9 +321,11 @@ class DatasetModel(UrnModel, GroupPermissionMixin):
         elif not self.parent.private:
             return self.parent
         elif user and self.parent.private:
-            if self.is_meta_analysis:
+            # Contributor checks are answered by the request's permission
+            # cache, so test them before the meta-analysis queries.
+            if is_contributor(user, self.parent):
                 return self.parent
-            elif user in self.parent.contributors:
+            elif self.is_meta_analysis:
                 return self.parent
             return None
         else:
@@ -321,3 +342,161 @@ class DatasetModel(UrnModel, GroupPermissionMixin):
     @property
     def children(self) -> Optional[QuerySet]:
         return None
+
+
+# --------------------------------------------------------------------------- #
+#                           Full-text search
+# --------------------------------------------------------------------------- #
+def search_document_text(instance) -> Dict[str, str]:
+    """
+    Collects the text indexed in the search document of a dataset, keyed by
+    the Postgres weight ('A' ranks highest) it is given.
+
+    Parameters
+    ----------
+    instance : `DatasetModel`
+        A saved dataset instance.
+
+    Returns
+    -------
+    dict[str, str]
+    """
+
+    def values(manager, field):
+        return [str(v) for v in manager.values_list(field, flat=True)]
+
+    group_prefix = "{}:{}-".format(instance._meta.model_name, instance.pk)
+    contributors = User.objects.filter(
+        groups__name__startswith=group_prefix
+    ).distinct()
+    names = []
+    for first, last, username in contributors.values_list(
+        "first_name", "last_name", "username"
+    ):
+        names.extend([first, last, username])
+
+    return {
+        "A": " ".join([instance.urn or "", instance.title]),
+        "B": " ".join(
+            [instance.short_description]
+            + values(instance.keywords, "text")
+            + values(instance.doi_ids, "identifier")
+            + values(instance.sra_ids, "identifier")
+            + values(instance.pubmed_ids, "identifier")
+        ),
+        "C": " ".join(names),
+        "D": " ".join([instance.abstract_text, instance.method_text]),
+    }
+
+
+def search_document_vector(text: Dict[str, str]) -> SearchVector:
+    """
+    Weighted `tsvector` expression for text from `search_document_text`.
+    """
+    return reduce(
+        operator.add,
+        [
+            SearchVector(
+                Value(text[weight], output_field=TextField()),
+                weight=weight,
+                config=SEARCH_CONFIG,
+            )
+            for weight in sorted(text)
+        ],
+    )
+
+
+def update_search_document(instance):
+    """
+    Rebuilds the `search_document` of `instance`. Uses `QuerySet.update` so
+    that no save signals are sent.
+    """
+    if instance.pk is None:
+        return
+    document = search_document_vector(search_document_text(instance))
+    type(instance).objects.filter(pk=instance.pk).update(
+        search_document=document
+    )
+
+
+def full_text_search(queryset: QuerySet, value: str) -> QuerySet:
+    """
+    Filters a queryset of a searchable model to the instances whose search
+    document matches `value`. Matching is answered by the GIN index on
+    `search_document`.
+    """
+    return queryset.filter(
+        search_document=SearchQuery(value, config=SEARCH_CONFIG)
+    )
+
+
+def search_rank(value: str) -> SearchRank:
+    """Expression ranking the search document of a row against `value`."""
+    return SearchRank(
+        F("search_document"), SearchQuery(value, config=SEARCH_CONFIG)
+    )
+
+
+def register_search_document(model):
+    """
+    Keeps the `search_document` of `model` up to date when an instance is
+    saved, when its many-to-many metadata changes and when its contributors
+    change.
+    """
+    SEARCHABLE_MODELS[model._meta.model_name] = model
+    post_save.connect(
+        update_search_document_on_save,
+        sender=model,
+        dispatch_uid="search_document_{}".format(model._meta.model_name),
+    )
+    for field_name in model.M2M_FIELD_NAMES:
+        m2m_changed.connect(
+            update_search_documents_on_m2m_change,
+            sender=getattr(model, field_name).through,
+            dispatch_uid="search_document_{}_{}".format(
+                model._meta.model_name, field_name
+            ),
+        )
+
+
+def update_search_document_on_save(sender, instance, **kwargs):
+    update_search_document(instance)
+
+
+def update_search_documents_on_m2m_change(
+    sender, instance, action, reverse, model, pk_set, **kwargs
+):
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    if not reverse:
+        update_search_document(instance)
+    elif pk_set:
+        for dataset in model.objects.filter(pk__in=pk_set):
+            update_search_document(dataset)
+
+
+GROUP_NAME_RE = re.compile(r"^([a-z]+):([0-9]+)-")
+
+
+@receiver(m2m_changed, sender=User.groups.through)
+def update_search_documents_on_contributor_change(
+    sender, instance, action, reverse, model, pk_set, **kwargs
+):
+    if action not in ("post_add", "post_remove"):
+        return
+    if reverse:
+        names = [instance.name]
+    else:
+        names = Group.objects.filter(pk__in=pk_set).values_list(
+            "name", flat=True
+        )
+    for name in names:
+        match = GROUP_NAME_RE.match(name)
+        if match and match.group(1) in SEARCHABLE_MODELS:
+            dataset = (
+                SEARCHABLE_MODELS[match.group(1)]
+                .objects.filter(pk=int(match.group(2)))
+                .first()
+            )
+            if dataset is not None:
+                update_search_document(dataset)
@@ -3,6 +3,8 @@ from functools import reduce
 
 from django.db.models import Count
 from django.shortcuts import reverse
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models, transaction
 from django.db.models.signals import post_save, pre_delete
 from django.dispatch import receiver
@@ -20,7 +22,7 @@ from genome.models import TargetGene
 from urn.models import UrnModel
 from urn.validators import validate_mavedb_urn_experiment
 
-from ..models.base import DatasetModel
+from ..models.base import DatasetModel, register_search_document
 from ..models.experimentset import ExperimentSet
 
 
@@ -121,6 +123,11 @@ class Experiment(DatasetModel):
             (PermissionTypes.CAN_EDIT, "Can edit"),
             (PermissionTypes.CAN_MANAGE, "Can manage"),
         )
+        indexes = [
+            GinIndex(
+                fields=["search_document"], name="dataset_exp_search_gin"
+            ),
+        ]
 
     # ---------------------------------------------------------------------- #
     #                       Required Model fields
@@ -140,6 +147,9 @@ class Experiment(DatasetModel):
         verbose_name="Experiment Set",
     )
 
+    # Weighted full-text search document, see `update_search_document`.
+    search_document = SearchVectorField(null=True, editable=False)
+
     # ---------------------------------------------------------------------- #
     #                       Methods
     # ---------------------------------------------------------------------- #
@@ -235,9 +245,15 @@ def create_groups_for_experiment(sender, instance, **kwargs):
     create_all_groups_for_instance(instance)
 
 
+register_search_document(Experiment)
+
+
 # --------------------------------------------------------------------------- #
 #                            Post Delete
 # --------------------------------------------------------------------------- #
 @receiver(pre_delete, sender=Experiment)
 def delete_groups_for_experiment(sender, instance, **kwargs):
+    # Already done in bulk by `dataset.utilities.delete_instance`.
+    if getattr(instance, "groups_deleted", False):
+        return
     delete_all_groups_for_instance(instance)
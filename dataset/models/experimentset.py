@@ -172,4 +172,7 @@ def create_groups_for_experimentset(sender, instance, **kwargs):
 # --------------------------------------------------------------------------- #
 @receiver(pre_delete, sender=ExperimentSet)
 def delete_groups_for_experimentset(sender, instance, **kwargs):
+    # Already done in bulk by `dataset.utilities.delete_instance`.
+    if getattr(instance, "groups_deleted", False):
+        return
     delete_all_groups_for_instance(instance)
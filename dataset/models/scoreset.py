@@ -1,16 +1,24 @@
+from collections import defaultdict
+
 from billiard.exceptions import SoftTimeLimitExceeded
 from django.contrib.auth import get_user_model
 from django.contrib.postgres.fields import JSONField
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models, transaction
 from django.db.models import Count
-from django.db.models.signals import post_save, pre_delete
+from django.db.models.functions import Coalesce
+from django.db.models.signals import post_delete, post_save, pre_delete
 from django.dispatch import receiver
 from django.shortcuts import reverse
 
+from accounts.permission_cache import is_contributor
 from accounts.permissions import (
     PermissionTypes,
     create_all_groups_for_instance,
     delete_all_groups_for_instance,
+    instances_for_user_with_group_permission,
+    user_is_anonymous,
 )
 from core.models import FailedTask
 from core.utilities import base_url
@@ -18,7 +26,7 @@ from dataset import constants as constants
 from main.models import Licence
 from urn.models import UrnModel
 from urn.validators import validate_mavedb_urn_scoreset
-from ..models.base import DatasetModel
+from ..models.base import DatasetModel, register_search_document
 from ..models.experiment import Experiment
 from ..validators import validate_scoreset_json, WordLimitValidator
 
@@ -135,6 +143,11 @@ class ScoreSet(DatasetModel):
             (PermissionTypes.CAN_EDIT, "Can edit"),
             (PermissionTypes.CAN_MANAGE, "Can manage"),
         )
+        indexes = [
+            GinIndex(
+                fields=["search_document"], name="dataset_scs_search_gin"
+            ),
+        ]
 
     # ---------------------------------------------------------------------- #
     #                       Required Model fields
@@ -191,6 +204,26 @@ class ScoreSet(DatasetModel):
         blank=True,
     )
 
+    # Denormalised ends of the replacement chain containing this instance,
+    # maintained by `update_current_versions`.
+    latest_version = models.ForeignKey(
+        to="dataset.ScoreSet",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        editable=False,
+        related_name="+",
+    )
+
+    latest_public_version = models.ForeignKey(
+        to="dataset.ScoreSet",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        editable=False,
+        related_name="+",
+    )
+
     normalised = models.BooleanField(
         default=False,
         blank=True,
@@ -206,6 +239,9 @@ class ScoreSet(DatasetModel):
         validators=[WordLimitValidator(250)],
     )
 
+    # Weighted full-text search document, see `update_search_document`.
+    search_document = SearchVectorField(null=True, editable=False)
+
     # ---------------------------------------------------------------------- #
     #                       Methods
     # ---------------------------------------------------------------------- #
@@ -215,6 +251,19 @@ class ScoreSet(DatasetModel):
             self.licence = Licence.get_default()
         return super().save(*args, **kwargs)
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the fields which place this instance in its replacement
+        # chain, so saves that leave them alone skip
+        # `update_current_versions`.
+        loaded = dict(zip(field_names, values))
+        instance._loaded_chain = (
+            loaded.get("replaces_id"),
+            loaded.get("private"),
+        )
+        return instance
+
     @classmethod
     def tracked_fields(cls):
         return super().tracked_fields() + ("licence", "data_usage_policy")
@@ -281,7 +330,9 @@ class ScoreSet(DatasetModel):
         )
 
     def delete_variants(self):
-        self.variants.all().delete()
+        from variant.models import Variant
+
+        Variant.bulk_delete(self)
         self.dataset_columns = default_dataset()
         self.last_child_value = 0
         self.save()
@@ -375,10 +426,11 @@ class ScoreSet(DatasetModel):
     # ----- Return public/private versions
     @property
     def current_version(self):
-        instance = self
-        while instance.next_version is not None:
-            instance = instance.next_version
-        return instance
+        # Read from the end of the chain kept by `update_current_versions`
+        # rather than following `replaced_by` one query at a time.
+        if self.latest_version_id in (None, self.pk):
+            return self
+        return self.latest_version
 
     @property
     def next_version(self):
@@ -395,13 +447,9 @@ class ScoreSet(DatasetModel):
     # ---- Return public version only
     @property
     def current_public_version(self):
-        instance = self
-        while instance.next_version is not None:
-            if instance.next_version.private:
-                break
-            else:
-                instance = instance.next_version
-        return instance
+        if self.latest_public_version_id in (None, self.pk):
+            return self
+        return self.latest_public_version
 
     @property
     def next_public_version(self):
@@ -431,11 +479,15 @@ class ScoreSet(DatasetModel):
         this private version, otherwise returns the public version defined
         by `public_attr`, which may be `None`.
         """
-        version = getattr(self, attr)
-        public_version = getattr(self, public_attr)
+        return self.choose_version(
+            getattr(self, attr), getattr(self, public_attr), user
+        )
+
+    @staticmethod
+    def choose_version(version, public_version, user=None):
         if user is None or version is None:
             return public_version
-        elif version.private and user in version.contributors:
+        elif version.private and is_contributor(user, version):
             return version
         else:
             return public_version
@@ -474,6 +526,143 @@ class ScoreSet(DatasetModel):
             "current_version", "current_public_version", user
         )
 
+    @classmethod
+    def resolve_versions(cls, scoresets, user=None):
+        """
+        Bulk version of `get_previous_version`, `get_next_version` and
+        `get_current_version`. Every score set in the replacement chains of
+        `scoresets` is loaded with a single query, using the denormalised
+        `latest_version` column shared by all members of a chain.
+
+        Parameters
+        ----------
+        scoresets : Iterable[`ScoreSet`]
+            Score sets to resolve.
+        user : `User`, optional
+            User to resolve private versions for.
+
+        Returns
+        -------
+        dict[int, dict[str, Optional[ScoreSet]]]
+            Maps the primary key of each score set to its 'previous', 'next'
+            and 'current' version.
+        """
+        scoresets = list(scoresets)
+        chains = set(s.latest_version_id or s.pk for s in scoresets)
+        members = {
+            s.pk: s
+            for s in cls.objects.filter(
+                models.Q(latest_version__in=chains) | models.Q(pk__in=chains)
+            ).only(
+                "urn",
+                "private",
+                "replaces",
+                "latest_version",
+                "latest_public_version",
+            )
+        }
+        successors = {s.replaces_id: s for s in members.values()}
+
+        def previous_public(instance):
+            public_versions = []
+            while instance.replaces_id is not None:
+                instance = members[instance.replaces_id]
+                if not instance.private:
+                    public_versions.append(instance)
+            return public_versions[-1] if public_versions else None
+
+        resolved = {}
+        for scoreset in scoresets:
+            try:
+                previous = members.get(scoreset.replaces_id)
+                following = successors.get(scoreset.pk)
+                resolved[scoreset.pk] = {
+                    "previous": cls.choose_version(
+                        previous, previous_public(scoreset), user
+                    ),
+                    "next": cls.choose_version(
+                        following,
+                        following
+                        if following is not None and not following.private
+                        else None,
+                        user,
+                    ),
+                    "current": cls.choose_version(
+                        members[scoreset.latest_version_id],
+                        members[scoreset.latest_public_version_id],
+                        user,
+                    ),
+                }
+            except KeyError:
+                # The denormalised columns are out of date, walk the chain.
+                resolved[scoreset.pk] = {
+                    "previous": scoreset.get_previous_version(user),
+                    "next": scoreset.get_next_version(user),
+                    "current": scoreset.get_current_version(user),
+                }
+        return resolved
+
+    @classmethod
+    def annotate_variant_counts(cls, queryset):
+        """
+        Annotates `queryset` with the number of variants of each score set
+        as `num_variants`, using a correlated subquery.
+        """
+        variants = cls._meta.get_field("variants").related_model.objects
+        counts = (
+            variants.filter(scoreset=models.OuterRef("pk"))
+            .order_by()
+            .values("scoreset")
+            .annotate(count=Count("pk"))
+            .values("count")
+        )
+        return queryset.annotate(
+            num_variants=Coalesce(
+                models.Subquery(counts, output_field=models.IntegerField()),
+                0,
+            )
+        )
+
+    @classmethod
+    def resolve_current_versions(cls, queryset, user=None):
+        """
+        Bulk version of `get_current_version` using the denormalised
+        `latest_version` and `latest_public_version` columns.
+
+        Parameters
+        ----------
+        queryset : `QuerySet`
+            Score sets to resolve.
+        user : `User`, optional
+            User to resolve private current versions for.
+
+        Returns
+        -------
+        `QuerySet`
+            The distinct current versions of the score sets in `queryset`.
+        """
+        # Ordering is irrelevant in the subqueries below and conflicts with
+        # DISTINCT querysets such as those returned by `filter_visible`.
+        queryset = queryset.order_by()
+        public = queryset.values("latest_public_version")
+        if user is None or user_is_anonymous(user):
+            return cls.objects.filter(pk__in=public)
+
+        contributed = instances_for_user_with_group_permission(
+            user=user,
+            queryset=cls.objects.filter(private=True),
+            group_type="any",
+        )
+        private = queryset.filter(latest_version__in=contributed)
+        return cls.objects.filter(
+            models.Q(pk__in=private.values("latest_version"))
+            | models.Q(
+                pk__in=queryset.exclude(
+                    pk__in=private.values("pk")
+                ).values("latest_public_version")
+            )
+        )
+
     def get_error_message(self):
         """
         Return the error message associated with the most recent task submitted
@@ -504,14 +693,72 @@ class ScoreSet(DatasetModel):
 # --------------------------------------------------------------------------- #
 #                               Post Save
 # --------------------------------------------------------------------------- #
+def update_current_versions(scoreset):
+    """
+    Recomputes `latest_version` and `latest_public_version` for every score
+    set in the replacement chain containing `scoreset`.
+    """
+    instance = ScoreSet.objects.get(pk=scoreset.pk)
+    while instance.previous_version is not None:
+        instance = instance.previous_version
+    chain = [instance]
+    while chain[-1].next_version is not None:
+        chain.append(chain[-1].next_version)
+
+    # Walking backwards, the current public version of a score set is that
+    # of its successor unless the successor is private.
+    current_public = {}
+    following = None
+    for instance in reversed(chain):
+        if following is not None and not following.private:
+            current_public[instance.pk] = current_public[following.pk]
+        else:
+            current_public[instance.pk] = instance
+        following = instance
+
+    groups = defaultdict(list)
+    for pk, public in current_public.items():
+        groups[public].append(pk)
+    for public, pks in groups.items():
+        ScoreSet.objects.filter(pk__in=pks).update(
+            latest_version=chain[-1], latest_public_version=public
+        )
+
+    scoreset.latest_version = chain[-1]
+    scoreset.latest_public_version = current_public[scoreset.pk]
+
+
 @receiver(post_save, sender=ScoreSet)
 def create_permission_groups_for_scoreset(sender, instance, **kwargs):
     create_all_groups_for_instance(instance)
 
 
+@receiver(post_save, sender=ScoreSet)
+def update_current_versions_for_scoreset(sender, instance, created, **kwargs):
+    # The chain only changes when a score set is created, replaces another
+    # score set or is published.
+    chain = (instance.replaces_id, instance.private)
+    if created or chain != getattr(instance, "_loaded_chain", None):
+        update_current_versions(instance)
+    instance._loaded_chain = chain
+
+
+register_search_document(ScoreSet)
+
+
 # --------------------------------------------------------------------------- #
 #                            Post Delete
 # --------------------------------------------------------------------------- #
 @receiver(pre_delete, sender=ScoreSet)
 def delete_permission_groups_for_scoreset(sender, instance, **kwargs):
+    # Already done in bulk by `dataset.utilities.delete_instance`.
+    if getattr(instance, "groups_deleted", False):
+        return
     delete_all_groups_for_instance(instance)
+
+
+@receiver(post_delete, sender=ScoreSet)
+def update_current_versions_of_previous(sender, instance, **kwargs):
+    previous = ScoreSet.objects.filter(pk=instance.replaces_id).first()
+    if previous is not None:
+        update_current_versions(previous)
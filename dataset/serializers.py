@@ -1,7 +1,9 @@
 import logging
 
+from django.db import models
 from rest_framework import serializers
 
+from accounts.permission_cache import get_contributors, prefetch_contributors
 from core.serializers import TimeStampedModelSerializer
 
 from main.serializers import LicenceSerializer
@@ -19,12 +21,47 @@ from .models.experimentset import ExperimentSet
 from .models.experiment import Experiment
 from .models.scoreset import ScoreSet
 
-from .templatetags.dataset_tags import visible_children
+from .templatetags.dataset_tags import group_visible_children, visible_children
 
 
 logger = logging.getLogger("django")
 
 
+def resolve_children(serializer, instances):
+    """Stores the visible children of `instances` in the context."""
+    serializer.context["children"] = group_visible_children(
+        instances, user=serializer.context.get("user", None)
+    )
+
+
+def get_children(serializer, obj):
+    """Returns the URNs of the visible children of `obj`."""
+    children = serializer.context.get("children", None)
+    if children is None:
+        children = {
+            obj.pk: visible_children(
+                obj, user=serializer.context.get("user", None)
+            )
+        }
+    return [c.urn for c in children.get(obj.pk, [])]
+
+
+class DatasetModelListSerializer(serializers.ListSerializer):
+    """
+    Loads the contributors of every instance into the request's permission
+    cache, and lets the child serializer resolve its remaining relations in
+    bulk, before serializing the instances.
+    """
+
+    def to_representation(self, data):
+        if isinstance(data, models.Manager):
+            data = data.all()
+        data = list(data)
+        prefetch_contributors(data)
+        self.child.resolve_related(data)
+        return super().to_representation(data)
+
+
 class DatasetModelSerializer(TimeStampedModelSerializer):
 
     keywords = KeywordSerializer(many=True)
@@ -38,6 +75,7 @@ class DatasetModelSerializer(TimeStampedModelSerializer):
 
     class Meta(TimeStampedModelSerializer.Meta):
         model = DatasetModel
+        list_serializer_class = DatasetModelListSerializer
         fields = TimeStampedModelSerializer.Meta.fields + (
             "urn",
             "publish_date",
@@ -57,8 +95,16 @@ class DatasetModelSerializer(TimeStampedModelSerializer):
         read_only_fields = fields
         lookup_field = "urn"
 
+    def resolve_related(self, instances):
+        """
+        Resolves relations of `instances` that cannot be loaded with
+        `select_related` or `prefetch_related` and stores them in the
+        serializer context.
+        """
+        pass
+
     def get_contributors(self, obj):
-        return [u.username for u in obj.contributors]
+        return [u.username for u in get_contributors(obj)]
 
     @staticmethod
     def stringify_instance(instance):
@@ -80,6 +126,20 @@ class ScoreSetSerializer(DatasetModelSerializer):
     current_version = serializers.SerializerMethodField()
 
     is_meta_analysis = serializers.BooleanField()
+    variant_count = serializers.SerializerMethodField()
+
+    def resolve_related(self, instances):
+        self.context["versions"] = ScoreSet.resolve_versions(
+            instances, self.context.get("user", None)
+        )
+
+    def get_version(self, obj, name):
+        versions = self.context.get("versions", {})
+        if obj.pk in versions:
+            return self.stringify_instance(versions[obj.pk][name])
+        user = self.context.get("user", None)
+        method = getattr(obj, "get_{}_version".format(name))
+        return self.stringify_instance(method(user))
 
     def get_experiment(self, obj):
         return self.stringify_instance(
@@ -87,16 +147,20 @@ class ScoreSetSerializer(DatasetModelSerializer):
         )
 
     def get_previous_version(self, obj):
-        user = self.context.get("user", None)
-        return self.stringify_instance(obj.get_previous_version(user))
+        return self.get_version(obj, "previous")
 
     def get_current_version(self, obj):
-        user = self.context.get("user", None)
-        return self.stringify_instance(obj.get_current_version(user))
+        return self.get_version(obj, "current")
 
     def get_next_version(self, obj):
-        user = self.context.get("user", None)
-        return self.stringify_instance(obj.get_next_version(user))
+        return self.get_version(obj, "next")
+
+    def get_variant_count(self, obj):
+        # Annotated by `ScoreSet.annotate_variant_counts` in list views.
+        count = getattr(obj, "num_variants", None)
+        if count is None:
+            return obj.variant_count
+        return count
 
     class Meta(DatasetModelSerializer.Meta):
         model = ScoreSet
@@ -125,9 +189,11 @@ class ExperimentSerializer(DatasetModelSerializer):
             obj.parent_for_user(self.context.get("user", None))
         )
 
+    def resolve_related(self, instances):
+        resolve_children(self, instances)
+
     def get_children(self, obj):
-        children_ = visible_children(obj, user=self.context.get("user", None))
-        return [c.urn for c in children_]
+        return get_children(self, obj)
 
     class Meta(DatasetModelSerializer.Meta):
         model = Experiment
@@ -140,9 +206,11 @@ class ExperimentSerializer(DatasetModelSerializer):
 class ExperimentSetSerializer(DatasetModelSerializer):
     experiments = serializers.SerializerMethodField("get_children")
 
+    def resolve_related(self, instances):
+        resolve_children(self, instances)
+
     def get_children(self, obj):
-        children_ = visible_children(obj, user=self.context.get("user", None))
-        return [c.urn for c in children_]
+        return get_children(self, obj)
 
     class Meta(DatasetModelSerializer.Meta):
         model = ExperimentSet
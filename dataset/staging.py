@@ -0,0 +1,251 @@
+"""
+Staged storage for validated score and count data awaiting the
+`dataset.tasks.create_variants` task.
+
+Uploads are written once to a directory under `settings.UPLOAD_SPOOL_DIR`
+as one uncompressed `.npy` file per column and chunk, so that only a short
+handle is sent through the Celery broker and the worker can memory-map the
+columns instead of unpickling whole dataframes from a message.
+"""
+import json
+import os
+import re
+import shutil
+import tempfile
+import uuid
+import weakref
+from typing import Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+from django.conf import settings
+
+MANIFEST_FILE = "manifest.json"
+HANDLE_RE = re.compile(r"^[0-9a-f]{32}$")
+
+
+class StagedFrame:
+    """
+    A dataframe written to the spool directory one chunk at a time, so that
+    uploads can be parsed and validated without holding every row in
+    memory. Chunks are stored in the same format as staged uploads and can
+    be handed to `stage_variants` without being read back.
+
+    The files are deleted when the instance is garbage collected unless
+    they have been moved into a staged upload.
+    """
+
+    def __init__(self, columns: List[str]):
+        os.makedirs(settings.UPLOAD_SPOOL_DIR, exist_ok=True)
+        self.path = tempfile.mkdtemp(
+            prefix="frame-", dir=settings.UPLOAD_SPOOL_DIR
+        )
+        self.columns = list(columns)
+        self.chunks: List[dict] = []
+        self._finalizer = weakref.finalize(
+            self, shutil.rmtree, self.path, True
+        )
+
+    def __iter__(self) -> Iterator[pd.DataFrame]:
+        for spec in self.chunks:
+            yield _read_frame(spec, self.path)
+
+    def __len__(self) -> int:
+        return sum(spec["n_rows"] for spec in self.chunks)
+
+    def append(self, df: pd.DataFrame) -> None:
+        """Writes `df` as the next chunk. The index is not stored."""
+        self.chunks.append(
+            _write_frame(df, self.path, prefix=f"chunk{len(self.chunks)}")
+        )
+
+    def read(self) -> pd.DataFrame:
+        """Reads every chunk back into a single dataframe."""
+        return _concat_chunks(list(self), self.columns)
+
+    def null_count(self, column: str) -> int:
+        """
+        Returns the number of null values in `column`, counted when each
+        chunk was written.
+        """
+        return sum(
+            c["n_null"]
+            for spec in self.chunks
+            for c in spec["columns"]
+            if c["name"] == column
+        )
+
+    def move(self, path: str) -> None:
+        """Moves the files to `path`, which will no longer be deleted."""
+        os.replace(self.path, path)
+        self.path = path
+        self._finalizer.detach()
+
+    def discard(self) -> None:
+        """Deletes the files unless they have been moved."""
+        self._finalizer()
+
+
+def stage_variants(
+    scores: Union[pd.DataFrame, StagedFrame, None],
+    counts: Union[pd.DataFrame, StagedFrame, None],
+) -> str:
+    """
+    Writes the validated scores and counts to the spool directory. The
+    dataframe indices are not stored. Staged frames are moved rather than
+    copied.
+
+    Parameters
+    ----------
+    scores : `pd.DataFrame` or `StagedFrame`
+        Validated scores.
+    counts : `pd.DataFrame` or `StagedFrame`, optional
+        Validated counts. May be empty.
+
+    Returns
+    -------
+    str
+        Handle to pass to `load_staged_variants`.
+    """
+    handle = uuid.uuid4().hex
+    path = staged_variants_path(handle)
+    os.makedirs(path)
+
+    try:
+        manifest = {
+            "scores": _stage_frame(scores, path, name="scores"),
+            "counts": _stage_frame(counts, path, name="counts"),
+        }
+        with open(os.path.join(path, MANIFEST_FILE), "wt") as fp:
+            json.dump(manifest, fp)
+    except Exception:
+        shutil.rmtree(path, ignore_errors=True)
+        raise
+
+    return handle
+
+
+def load_staged_variants(handle: str) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Loads the scores and counts dataframes staged under `handle`.
+
+    Raises
+    ------
+    FileNotFoundError
+        No upload has been staged under `handle`.
+    """
+    path = staged_variants_path(handle)
+    with open(os.path.join(path, MANIFEST_FILE), "rt") as fp:
+        manifest = json.load(fp)
+    return (
+        _load_frame(manifest["scores"], path),
+        _load_frame(manifest["counts"], path),
+    )
+
+
+def discard_staged_variants(handle: str) -> None:
+    """Deletes the files staged under `handle` if they exist."""
+    shutil.rmtree(staged_variants_path(handle), ignore_errors=True)
+
+
+def staged_variants_path(handle: str) -> str:
+    if not HANDLE_RE.fullmatch(str(handle)):
+        raise ValueError(f"'{handle}' is not a valid staged upload handle.")
+    return os.path.join(settings.UPLOAD_SPOOL_DIR, handle)
+
+
+def _stage_frame(
+    frame: Union[pd.DataFrame, StagedFrame, None], path: str, name: str
+) -> dict:
+    directory = os.path.join(path, name)
+    if isinstance(frame, StagedFrame):
+        frame.move(directory)
+        return {"dir": name, "columns": frame.columns, "chunks": frame.chunks}
+
+    frame = pd.DataFrame() if frame is None else frame
+    os.makedirs(directory)
+    return {
+        "dir": name,
+        "columns": list(frame.columns),
+        "chunks": [_write_frame(frame, directory, prefix="chunk0")],
+    }
+
+
+def _load_frame(spec: dict, path: str) -> pd.DataFrame:
+    directory = os.path.join(path, spec["dir"])
+    return _concat_chunks(
+        [_read_frame(chunk, directory) for chunk in spec["chunks"]],
+        spec["columns"],
+    )
+
+
+def _concat_chunks(
+    frames: List[pd.DataFrame], columns: Optional[List[str]] = None
+) -> pd.DataFrame:
+    if not frames:
+        return pd.DataFrame(columns=columns or [])
+    if len(frames) == 1:
+        return frames[0]
+    return pd.concat(frames, ignore_index=True)
+
+
+def _write_frame(df: pd.DataFrame, path: str, prefix: str) -> dict:
+    columns = []
+    for (i, column) in enumerate(df.columns):
+        values = df[column]
+        name = f"{prefix}_{i}"
+        file_name = os.path.join(path, name)
+        null = values.isna().to_numpy()
+        present = values.to_numpy()[~null]
+
+        if values.dtype.kind in "biuf":
+            kind = "array"
+            np.save(f"{file_name}.npy", values.to_numpy())
+        elif all(isinstance(v, str) for v in present):
+            # Fixed-width unicode arrays can be memory-mapped without pickle.
+            kind = "text"
+            text = np.where(null, "", values.to_numpy()).astype(str)
+            np.save(f"{file_name}.npy", text)
+            np.save(f"{file_name}_null.npy", null)
+        else:
+            # Mixed-type columns fall back to JSON.
+            kind = "json"
+            with open(f"{file_name}.json", "wt") as fp:
+                json.dump(
+                    [None if n else v for (n, v) in zip(null, values)],
+                    fp,
+                    default=lambda v: v.item(),  # numpy scalars
+                )
+
+        columns.append(
+            {
+                "name": column,
+                "kind": kind,
+                "file": name,
+                "n_null": int(null.sum()),
+            }
+        )
+
+    return {"columns": columns, "n_rows": len(df)}
+
+
+def _read_frame(spec: dict, path: str) -> pd.DataFrame:
+    data = {}
+    for column in spec["columns"]:
+        file_name = os.path.join(path, column["file"])
+        if column["kind"] == "array":
+            values = np.load(f"{file_name}.npy", mmap_mode="r")
+        elif column["kind"] == "text":
+            values = np.load(f"{file_name}.npy", mmap_mode="r")
+            values = values.astype(object)
+            values[np.load(f"{file_name}_null.npy")] = np.NaN
+        else:
+            with open(f"{file_name}.json", "rt") as fp:
+                values = np.array(json.load(fp), dtype=object)
+        data[column["name"]] = values
+
+    return pd.DataFrame(
+        data,
+        columns=[c["name"] for c in spec["columns"]],
+        index=pd.RangeIndex(spec["n_rows"]),
+    )
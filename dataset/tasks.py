@@ -3,14 +3,16 @@ from django.contrib.auth import get_user_model
 
 from celery.utils.log import get_task_logger
 
+from api.artifacts import render_download_artifacts
 from core.tasks import BaseTask
 
 from mavedb import celery_app
 
-from variant.models import Variant
+from variant.models import ColumnarVariantData, Variant, VariantSpan
 from variant.utilities import convert_df_to_variant_records
 
 from dataset import constants
+from dataset.staging import discard_staged_variants, load_staged_variants
 from dataset.utilities import delete_instance as delete_instance_util
 from dataset.utilities import get_model_by_urn
 
@@ -81,6 +83,22 @@ class BaseCreateVariantsTask(BaseDatasetTask):
     def run(self, *args, **kwargs):
         return create_variants(*args, **kwargs)
 
+    def discard_staged_upload(self, kwargs):
+        handle = (kwargs or {}).get("staged_upload", None)
+        if handle is not None:
+            logger.info("Discarding staged upload {}".format(handle))
+            discard_staged_variants(handle)
+
+    def on_success(self, retval, task_id, args, kwargs):
+        self.discard_staged_upload(kwargs)
+        return super().on_success(retval, task_id, args, kwargs)
+
+    def on_failure(self, exc, task_id, args, kwargs, einfo, user=None):
+        self.discard_staged_upload(kwargs)
+        return super().on_failure(
+            exc, task_id, args, kwargs, einfo, user=user
+        )
+
 
 class BasePublishTask(BaseDatasetTask):
     description = "publish the entry {urn}"
@@ -88,6 +106,20 @@ class BasePublishTask(BaseDatasetTask):
     def run(self, *args, **kwargs):
         return publish_scoreset(*args, **kwargs)
 
+    def on_success(self, retval, task_id, args, kwargs):
+        retval = super().on_success(retval, task_id, args, kwargs)
+        if self.instance is not None:
+            # Failing to render downloads should not fail the publication.
+            # They are served from the database until rendered.
+            try:
+                self.instance.refresh_from_db()
+                render_download_artifacts(self.instance)
+            except Exception:
+                logger.exception(
+                    "Could not render downloads for {}".format(self.urn)
+                )
+        return retval
+
     def on_failure(self, exc, task_id, args, kwargs, einfo, user=None):
         retval = super().on_failure(
             exc, task_id, args, kwargs, einfo, user=None
@@ -205,8 +237,13 @@ def delete_instance(self, user_pk, urn):
     if (not self.instance.private) or self.instance.has_public_urn:
         raise ValueError(f"{self.urn} is not private and cannot be deleted.")
 
+    def progress(scoreset, n_variants):
+        logger.info(
+            "Deleted {} variants from {}".format(n_variants, scoreset.urn)
+        )
+
     with transaction.atomic():
-        return delete_instance_util(self.instance)
+        return delete_instance_util(self.instance, progress=progress)
 
 
 @celery_app.task(
@@ -219,10 +256,11 @@ def create_variants(
     self,
     user_pk,
     scoreset_urn,
-    scores_records,
-    counts_records,
-    index,
-    dataset_columns,
+    scores_records=None,
+    counts_records=None,
+    index=None,
+    dataset_columns=None,
+    staged_upload=None,
 ):
     """
     Celery task to that creates and associates `variant.model.Variant` instances
@@ -236,16 +274,21 @@ def create_variants(
         Primary key (id) of the submitting user.
     scoreset_urn : str
         The urn of the instance to associate variants to.
-    scores_records : str
-        JSON formatted dataframe (NaN replaced with None).
-    counts_records :
-        JSON formatted dataframe (NaN replaced with None).
+    scores_records : str, optional
+        JSON formatted dataframe (NaN replaced with None). Ignored when
+        `staged_upload` is given.
+    counts_records : str, optional
+        JSON formatted dataframe (NaN replaced with None). Ignored when
+        `staged_upload` is given.
     index : str
         HGVS column to use as the index when matching up variant data between
         scores and counts.
     dataset_columns : dict
         Contains keys `scores` and `counts`. The values are lists of strings
         indicating the columns to be expected in the variants for this dataset.
+    staged_upload : str, optional
+        Handle returned by `dataset.staging.stage_variants`. The staged files
+        are deleted once the task succeeds or fails.
 
     Returns
     -------
@@ -260,6 +303,12 @@ def create_variants(
     self.user = User.objects.get(pk=user_pk)
     self.instance = models.scoreset.ScoreSet.objects.get(urn=scoreset_urn)
 
+    if staged_upload is not None:
+        logger.info(
+            "Loading staged upload {} for {}".format(staged_upload, self.urn)
+        )
+        scores_records, counts_records = load_staged_variants(staged_upload)
+
     logger.info(
         "Sending scores dataframe with {} rows.".format(len(scores_records))
     )
@@ -279,10 +328,16 @@ def create_variants(
         self.instance.delete_variants()
 
         logger.info("Creating variants for {}".format(self.urn))
-        Variant.bulk_create(self.instance, variants)
+        Variant.bulk_copy(self.instance, variants)
 
         logger.info("Saving {}".format(self.urn))
         self.instance.dataset_columns = dataset_columns
         self.instance.save()
 
+        logger.info("Building columnar data for {}".format(self.urn))
+        ColumnarVariantData.build(self.instance, variants)
+
+        logger.info("Indexing variant positions for {}".format(self.urn))
+        VariantSpan.build(self.instance, variants)
+
     return self.instance
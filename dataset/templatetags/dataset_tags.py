@@ -1,19 +1,30 @@
 import json
 import logging
-from typing import Optional
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
 
 from django import template
 from django.contrib.auth import get_user_model
 from django.utils.safestring import mark_safe
-from django.db.models import Q, QuerySet
+from django.db.models import Prefetch, Q, QuerySet
 
 from dataset import models
 from dataset.models.base import DatasetModel
 from dataset.models.experiment import Experiment
 from dataset.models.experimentset import ExperimentSet
 from dataset.models.scoreset import ScoreSet
+from genome.models import ReferenceMap, TargetGene
 from metadata.models import PubmedIdentifier
-from accounts.permissions import user_is_anonymous
+from accounts.permission_cache import (
+    get_members,
+    has_group_type,
+    is_contributor,
+)
+from accounts.permissions import (
+    GroupTypes,
+    user_is_anonymous,
+    visible_to_user,
+)
 
 register = template.Library()
 logger = logging.getLogger("django")
@@ -196,6 +207,49 @@ def display_targets(
         return mark_safe(", ".join(t_names))
 
 
+def batch_display_targets(scoresets) -> Dict[int, Tuple[str, str, str]]:
+    """
+    Batched version of `display_targets(scoreset, user, all_fields=True)`
+    for score sets. Loads the targets, reference maps and reference genomes
+    of all `scoresets` with two queries instead of several per score set.
+
+    Parameters
+    ----------
+    scoresets : Iterable[ScoreSet]
+
+    Returns
+    -------
+    dict[int, tuple[str, str, str]]
+        Target name, category and organism keyed by score set primary key.
+    """
+    pks = [scoreset.pk for scoreset in scoresets]
+    # Primary reference maps first, then in order of creation as in
+    # `get_ref_map`.
+    reference_maps = ReferenceMap.objects.select_related("genome").order_by(
+        "-is_primary", "pk"
+    )
+    targets = TargetGene.objects.filter(scoreset__in=pks).prefetch_related(
+        Prefetch("reference_maps", queryset=reference_maps)
+    )
+
+    result = {pk: ("-", "-", "-") for pk in pks}
+    for target in targets:
+        ref_maps = list(target.reference_maps.all())
+        if not ref_maps:
+            logger.warning(
+                "Could not find a reference map for {}/{}".format(
+                    target.get_name(), target.id
+                )
+            )
+            continue
+        result[target.scoreset_id] = (
+            mark_safe(target.get_name()),
+            mark_safe(target.category),
+            mark_safe(ref_maps[0].format_reference_genome_organism_html()),
+        )
+    return result
+
+
 @register.assignment_tag
 def organise_by_target(scoresets):
     """
@@ -239,6 +293,42 @@ def visible_children(instance, user=None):
     return filter_visible(instance.children, user=user)
 
 
+def group_visible_children(instances, user=None) -> Dict[int, List]:
+    """
+    Bulk version of `visible_children` for experiment sets or experiments.
+
+    Parameters
+    ----------
+    instances : Iterable[ExperimentSet] | Iterable[Experiment]
+    user : User
+
+    Returns
+    -------
+    dict[int, list[Experiment | ScoreSet]]
+        The visible children of each instance ordered by URN, keyed by the
+        primary key of the instance.
+    """
+    instances = list(instances)
+    grouped = defaultdict(list)
+    if not instances:
+        return grouped
+
+    if is_experiment_set(instances[0]):
+        children = Experiment.objects.filter(experimentset__in=instances)
+        visible = Experiment.non_meta_analyses().intersection(
+            filter_visible(children, user=user)
+        )
+        parent_field = "experimentset_id"
+    else:
+        children = ScoreSet.objects.filter(experiment__in=instances)
+        visible = filter_visible(children, user=user)
+        parent_field = "experiment_id"
+
+    for child in visible.order_by("urn"):
+        grouped[getattr(child, parent_field)].append(child)
+    return grouped
+
+
 @register.assignment_tag
 def current_versions(instances, user=None):
     """
@@ -257,11 +347,11 @@ def current_versions(instances, user=None):
     """
     if instances is None:
         return []
-    current = {}
-    for i in instances:
-        new = i.get_current_version(user)
-        current[new.urn] = new
-    return sorted(current.values(), key=lambda ss: ss.urn)
+    if not isinstance(instances, QuerySet):
+        instances = ScoreSet.objects.filter(pk__in=[i.pk for i in instances])
+    return list(
+        ScoreSet.resolve_current_versions(instances, user).order_by("urn")
+    )
 
 
 @register.assignment_tag
@@ -288,9 +378,6 @@ def filter_visible(
     if instances is None:
         return []
 
-    if (not instances) or (not instances.count()):
-        return instances
-
     if user is None or user_is_anonymous(user):
         result = instances.exclude(private=True)
         if distinct:
@@ -298,6 +385,12 @@ def filter_visible(
         else:
             return result
 
+    if instances.model is ScoreSet:
+        result = visible_to_user(instances, user).order_by("urn")
+        if distinct:
+            return result.distinct()
+        return result
+
     if instances.model is ExperimentSet:
         visible_meta = (
             ExperimentSet.meta_analyses()
@@ -334,12 +427,6 @@ def filter_visible(
             instances.filter(private=True).difference(visible_meta)
         )
 
-    elif instances.model is ScoreSet:
-        private_visible = user.profile.contributor_scoresets(
-            instances.filter(private=True)
-        )
-        visible_meta = instances.none()
-
     else:
         raise TypeError(
             f"Cannot filter non dataset class {instances.model.__name__}"
@@ -435,6 +522,41 @@ def format_urn_name_for_user(instance, user):
     -------
     str
     """
-    if instance.private and user in instance.contributors:
+    if instance.private and is_contributor(user, instance):
         return "{} [Private]".format(instance.urn)
     return instance.urn
+
+
+@register.assignment_tag
+def group_members(instance, group_type):
+    """
+    Returns the users assigned to `group_type` on `instance`, read from the
+    request's permission cache.
+
+    Parameters
+    ----------
+    instance : ExperimentSet | Experiment | ScoreSet
+        Instance to list the group members of.
+
+    group_type : str
+        One of 'administrator', 'editor' or 'viewer'.
+
+    Returns
+    -------
+    list[User]
+    """
+    return get_members(instance, group_type)
+
+
+@register.filter
+def is_administrator(user, instance):
+    """Returns `True` if `user` administers `instance`."""
+    return has_group_type(user, instance, GroupTypes.ADMIN)
+
+
+@register.filter
+def can_edit(user, instance):
+    """Returns `True` if `user` is an administrator or editor of `instance`."""
+    return has_group_type(
+        user, instance, GroupTypes.ADMIN, GroupTypes.EDITOR
+    )
@@ -5,8 +5,10 @@ from django.contrib.auth import get_user_model
 from django.db import transaction
 
 from accounts.factories import UserFactory
+from metadata.factories import KeywordFactory
 
 from dataset import models
+from dataset.models.base import full_text_search
 from dataset.templatetags.dataset_tags import visible_children
 from dataset.factories import (
     ExperimentSetFactory,
@@ -171,3 +173,51 @@ class TestDatasetModel(TestCase):
         user = UserFactory()
         parent.add_viewers(user)
         self.assertIs(parent, instance.parent_for_user(user))
+
+
+class TestSearchDocument(TestCase):
+    @staticmethod
+    def search(model, value):
+        return list(full_text_search(model.objects.all(), value))
+
+    def test_save_updates_search_document(self):
+        instance = ScoreSetFactory()
+        instance.title = "Deep mutational scan of ubiquitin"
+        instance.save()
+        self.assertEqual(
+            self.search(models.scoreset.ScoreSet, "ubiquitin"), [instance]
+        )
+
+    def test_matches_stemmed_words(self):
+        instance = ExperimentFactory(abstract_text="Mutations in kinases")
+        self.assertEqual(
+            self.search(models.experiment.Experiment, "kinase mutation"),
+            [instance],
+        )
+
+    def test_adding_keyword_updates_search_document(self):
+        instance = ExperimentFactory()
+        instance.keywords.add(KeywordFactory(text="thermostability"))
+        self.assertEqual(
+            self.search(models.experiment.Experiment, "thermostability"),
+            [instance],
+        )
+
+    def test_removing_keyword_updates_search_document(self):
+        instance = ExperimentFactory()
+        keyword = KeywordFactory(text="thermostability")
+        instance.keywords.add(keyword)
+        instance.keywords.remove(keyword)
+        self.assertEqual(
+            self.search(models.experiment.Experiment, "thermostability"), []
+        )
+
+    def test_adding_contributor_updates_search_document(self):
+        instance = ScoreSetFactory()
+        user = UserFactory(last_name="Fowler")
+        instance.add_viewers(user)
+        self.assertEqual(
+            self.search(models.scoreset.ScoreSet, "fowler"), [instance]
+        )
+        instance.remove_viewers(user)
+        self.assertEqual(self.search(models.scoreset.ScoreSet, "fowler"), [])
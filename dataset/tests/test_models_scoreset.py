@@ -76,6 +76,7 @@ class TestScoreSet(TestCase):
         scs_1 = ScoreSetFactory()
         scs_2 = ScoreSetFactory(experiment=scs_1.experiment, replaces=scs_1)
         scs_3 = ScoreSetFactory(experiment=scs_2.experiment, replaces=scs_2)
+        scs_1.refresh_from_db()
         self.assertEqual(scs_1.current_version, scs_3)
         self.assertEqual(scs_1.next_version, scs_2)
         self.assertEqual(scs_2.previous_version, scs_1)
@@ -122,6 +123,8 @@ class TestScoreSet(TestCase):
         scs_3 = ScoreSetFactory(
             private=True, experiment=scs_2.experiment, replaces=scs_2
         )
+        scs_1.refresh_from_db()
+        scs_2.refresh_from_db()
         self.assertEqual(scs_1.current_public_version, scs_2)
         self.assertEqual(scs_2.current_public_version, scs_2)
 
@@ -257,6 +260,109 @@ class TestScoreSet(TestCase):
             *("current_version", "current_public_version", None)
         )
 
+    def test_replacing_updates_latest_versions_of_chain(self):
+        instance1 = ScoreSetFactory(private=False)
+        instance2 = ScoreSetFactory(replaces=instance1, private=False)
+        instance3 = ScoreSetFactory(replaces=instance2, private=True)
+        for instance in (instance1, instance2, instance3):
+            instance.refresh_from_db()
+            self.assertEqual(instance.latest_version, instance3)
+            self.assertEqual(
+                instance.latest_public_version,
+                instance.current_public_version,
+            )
+
+    def test_saving_without_changing_chain_skips_version_update(self):
+        instance = ScoreSetFactory()
+        instance = ScoreSet.objects.get(pk=instance.pk)
+        with mock.patch(
+            "dataset.models.scoreset.update_current_versions"
+        ) as patch:
+            instance.short_description = "changed"
+            instance.save()
+            patch.assert_not_called()
+
+            instance.private = False
+            instance.save()
+            patch.assert_called_once_with(instance)
+
+    def test_publishing_updates_latest_public_version(self):
+        instance1 = ScoreSetFactory(private=False)
+        instance2 = ScoreSetFactory(replaces=instance1, private=True)
+        instance2.private = False
+        instance2.save()
+        instance1.refresh_from_db()
+        self.assertEqual(instance1.latest_public_version, instance2)
+
+    def test_deleting_replacement_updates_latest_versions(self):
+        instance1 = ScoreSetFactory(private=False)
+        instance2 = ScoreSetFactory(replaces=instance1, private=False)
+        instance2.delete()
+        instance1.refresh_from_db()
+        self.assertEqual(instance1.latest_version, instance1)
+        self.assertEqual(instance1.latest_public_version, instance1)
+
+    def test_resolve_current_versions_matches_get_current_version(self):
+        user = UserFactory()
+        instance1 = ScoreSetFactory(private=False)
+        instance2 = ScoreSetFactory(replaces=instance1, private=False)
+        instance3 = ScoreSetFactory(replaces=instance2, private=True)
+        other = ScoreSetFactory(private=False)
+        instance3.add_viewers(user)
+
+        for u in (None, user, UserFactory()):
+            expected = set(
+                i.get_current_version(u) for i in ScoreSet.objects.all()
+            )
+            resolved = ScoreSet.resolve_current_versions(
+                ScoreSet.objects.all(), u
+            )
+            self.assertEqual(set(resolved), expected)
+            self.assertIn(other, resolved)
+
+    def test_resolve_versions_matches_get_version_methods(self):
+        user = UserFactory()
+        instance1 = ScoreSetFactory(private=False)
+        instance2 = ScoreSetFactory(replaces=instance1, private=True)
+        instance3 = ScoreSetFactory(replaces=instance2, private=False)
+        instance4 = ScoreSetFactory(replaces=instance3, private=True)
+        ScoreSetFactory(private=False)
+        instance4.add_viewers(user)
+        instance2.add_viewers(user)
+
+        scoresets = list(ScoreSet.objects.all())
+        for u in (None, user, UserFactory()):
+            resolved = ScoreSet.resolve_versions(scoresets, u)
+            for instance in scoresets:
+                self.assertEqual(
+                    resolved[instance.pk],
+                    {
+                        "previous": instance.get_previous_version(u),
+                        "next": instance.get_next_version(u),
+                        "current": instance.get_current_version(u),
+                    },
+                )
+
+    def test_resolve_versions_uses_one_query(self):
+        instance1 = ScoreSetFactory(private=False)
+        instance2 = ScoreSetFactory(replaces=instance1, private=False)
+        scoresets = list(ScoreSet.objects.all())
+        with self.assertNumQueries(1):
+            resolved = ScoreSet.resolve_versions(scoresets)
+        self.assertEqual(resolved[instance1.pk]["next"], instance2)
+        self.assertEqual(resolved[instance2.pk]["previous"], instance1)
+
+    def test_annotate_variant_counts(self):
+        instance = ScoreSetFactory()
+        empty = ScoreSetFactory()
+        VariantFactory(scoreset=instance)
+        VariantFactory(scoreset=instance)
+        counts = dict(
+            ScoreSet.annotate_variant_counts(ScoreSet.objects.all())
+            .values_list("pk", "num_variants")
+        )
+        self.assertEqual(counts, {instance.pk: 2, empty.pk: 0})
+
     def test_has_uniprot_metadata_returns_correct_boolean(self):
         instance = ScoreSetWithTargetFactory()
         target = instance.target
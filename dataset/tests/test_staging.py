@@ -0,0 +1,104 @@
+import os
+
+import numpy as np
+import pandas as pd
+from pandas.testing import assert_frame_equal
+
+from django.test import TestCase
+
+from dataset import constants
+
+from ..staging import (
+    StagedFrame,
+    discard_staged_variants,
+    load_staged_variants,
+    stage_variants,
+    staged_variants_path,
+)
+
+
+class TestStagedVariants(TestCase):
+    def setUp(self):
+        self.scores = pd.DataFrame(
+            {
+                constants.hgvs_nt_column: ["c.1A>G", "c.2A>G"],
+                constants.hgvs_splice_column: [np.NaN, np.NaN],
+                constants.hgvs_pro_column: ["p.Ile1Val", np.NaN],
+                constants.required_score_column: [0.5, np.NaN],
+                "note": ["a", 1],
+            }
+        )
+        self.counts = pd.DataFrame(
+            {
+                constants.hgvs_nt_column: ["c.1A>G", "c.2A>G"],
+                constants.hgvs_splice_column: [np.NaN, np.NaN],
+                constants.hgvs_pro_column: ["p.Ile1Val", np.NaN],
+                "count": [1, 2],
+            }
+        )
+
+    def test_round_trips_frames(self):
+        handle = stage_variants(self.scores, self.counts)
+        self.addCleanup(discard_staged_variants, handle)
+
+        scores, counts = load_staged_variants(handle)
+        assert_frame_equal(scores, self.scores)
+        assert_frame_equal(counts, self.counts)
+
+    def test_round_trips_empty_counts(self):
+        handle = stage_variants(self.scores, pd.DataFrame())
+        self.addCleanup(discard_staged_variants, handle)
+
+        _, counts = load_staged_variants(handle)
+        self.assertTrue(counts.empty)
+
+    def test_discard_removes_files(self):
+        handle = stage_variants(self.scores, self.counts)
+        discard_staged_variants(handle)
+        self.assertFalse(os.path.exists(staged_variants_path(handle)))
+        with self.assertRaises(FileNotFoundError):
+            load_staged_variants(handle)
+
+    def test_error_invalid_handle(self):
+        with self.assertRaises(ValueError):
+            load_staged_variants("../../etc")
+
+    def test_moves_staged_frames(self):
+        frame = StagedFrame(list(self.scores.columns))
+        frame.append(self.scores.iloc[:1])
+        frame.append(self.scores.iloc[1:])
+        path = frame.path
+
+        handle = stage_variants(frame, None)
+        self.addCleanup(discard_staged_variants, handle)
+
+        self.assertFalse(os.path.exists(path))
+        scores, counts = load_staged_variants(handle)
+        self.assertListEqual(
+            list(scores[constants.hgvs_nt_column]), ["c.1A>G", "c.2A>G"]
+        )
+        self.assertTrue(counts.empty)
+
+
+class TestStagedFrame(TestCase):
+    def setUp(self):
+        self.df = pd.DataFrame({"a": ["x", np.NaN, "z"], "b": [1.0, 2.0, 3.0]})
+        self.frame = StagedFrame(["a", "b"])
+        self.frame.append(self.df.iloc[:2])
+        self.frame.append(self.df.iloc[2:])
+
+    def tearDown(self):
+        self.frame.discard()
+
+    def test_reads_chunks_in_order(self):
+        self.assertEqual(len(self.frame), 3)
+        self.assertListEqual([len(c) for c in self.frame], [2, 1])
+        assert_frame_equal(self.frame.read(), self.df)
+
+    def test_counts_null_values_across_chunks(self):
+        self.assertEqual(self.frame.null_count("a"), 1)
+        self.assertEqual(self.frame.null_count("b"), 0)
+
+    def test_discard_removes_files(self):
+        self.frame.discard()
+        self.assertFalse(os.path.exists(self.frame.path))
@@ -1,3 +1,5 @@
+import os
+
 import pandas as pd
 import numpy as np
 
@@ -9,10 +11,12 @@ from accounts.models import Profile
 from core.models import FailedTask
 
 from variant.factories import generate_hgvs, VariantFactory
+from variant.models import ColumnarVariantData
 
 from dataset import constants
 from dataset.models.scoreset import default_dataset, ScoreSet
 from dataset.factories import ScoreSetFactory
+from dataset.staging import stage_variants, staged_variants_path
 from dataset.tasks import (
     create_variants,
     publish_scoreset,
@@ -164,6 +168,42 @@ class TestCreateVariantsTask(TestCase):
         self.scoreset.refresh_from_db()
         self.assertEqual(self.scoreset.last_child_value, 1)
 
+    def test_builds_columnar_data(self):
+        self.dataset_columns[constants.count_columns] = ["counts"]
+        create_variants.run(**self.mock_kwargs())
+        self.scoreset.refresh_from_db()
+        columnar = ColumnarVariantData.for_scoreset(self.scoreset)
+        self.assertIsNotNone(columnar)
+        variant = self.scoreset.variants.first()
+        self.assertEqual(columnar.data_at(0), variant.data)
+
+    def test_loads_variants_from_staged_upload(self):
+        handle = stage_variants(self.df_scores, self.df_counts)
+        kwargs = self.mock_kwargs(staged_upload=handle)
+        kwargs.pop("scores_records")
+        kwargs.pop("counts_records")
+
+        create_variants.run(**kwargs)
+        self.scoreset.refresh_from_db()
+        self.assertEqual(self.scoreset.variants.count(), 1)
+        self.assertEqual(
+            self.scoreset.variants.first().hgvs_pro, self.hgvs_pro
+        )
+
+    @mock.patch.object(Profile, "notify_user_submission_status")
+    def test_discards_staged_upload_on_success(self, patch):
+        handle = stage_variants(self.df_scores, self.df_counts)
+        kwargs = self.mock_kwargs(staged_upload=handle)
+        create_variants.apply(kwargs=kwargs)
+        self.assertFalse(os.path.exists(staged_variants_path(handle)))
+
+    @mock.patch.object(Profile, "notify_user_submission_status")
+    def test_discards_staged_upload_on_failure(self, patch):
+        handle = stage_variants(self.df_scores, self.df_counts)
+        kwargs = self.mock_kwargs(staged_upload=handle, scoreset_urn="")
+        create_variants.apply(kwargs=kwargs)
+        self.assertFalse(os.path.exists(staged_variants_path(handle)))
+
 
 class TestPublishScoresetTask(TestCase):
     def setUp(self):
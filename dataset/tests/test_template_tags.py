@@ -175,6 +175,33 @@ class TestDisplayTargetsTag(TestCase):
         )
 
 
+class TestBatchDisplayTargets(TestCase):
+    def test_matches_display_targets(self):
+        scoresets = [ScoreSetFactory() for _ in range(3)]
+        for scoreset in scoresets:
+            ReferenceMapFactory(target=TargetGeneFactory(scoreset=scoreset))
+        user = UserFactory()
+
+        result = dataset_tags.batch_display_targets(scoresets)
+        for scoreset in scoresets:
+            self.assertEqual(
+                result[scoreset.pk],
+                dataset_tags.display_targets(scoreset, user, all_fields=True),
+            )
+
+    def test_uses_fixed_number_of_queries(self):
+        scoresets = [ScoreSetFactory() for _ in range(5)]
+        for scoreset in scoresets:
+            ReferenceMapFactory(target=TargetGeneFactory(scoreset=scoreset))
+        with self.assertNumQueries(2):
+            dataset_tags.batch_display_targets(scoresets)
+
+    def test_defaults_to_dash_without_target(self):
+        scoreset = ScoreSetFactory()
+        result = dataset_tags.batch_display_targets([scoreset])
+        self.assertEqual(result[scoreset.pk], ("-", "-", "-"))
+
+
 class TestVisibleChildren(TestCase):
     def test_hides_private_when_user_not_contrib(self):
         exp = ExperimentWithScoresetFactory()
@@ -451,14 +478,14 @@ class TestCurrentVersions(TestCase):
 
     @mock.patch.object(
         ScoreSet,
-        "get_current_version",
-        side_effect=lambda x: ScoreSetFactory(),
+        "resolve_current_versions",
+        return_value=ScoreSet.objects.none(),
     )
-    def test_calls_get_current_version_with_user(self, patch):
+    def test_calls_resolve_current_versions_with_user(self, patch):
         user = UserFactory()
         instance = ScoreSetFactory(private=False)
         dataset_tags.current_versions([instance], user=user)
-        patch.assert_called_with(*(user,))
+        self.assertEqual(patch.call_args[0][1], user)
 
     def test_keeps_current_private_version_for_contributor(self):
         user = UserFactory()
@@ -1,4 +1,5 @@
-from django.test import TestCase
+from django.contrib.auth.models import Group
+from django.test import TestCase, mock
 
 from metadata import models as meta_models
 
@@ -126,6 +127,36 @@ class TestDeleteScoreSet(TestCase):
         with self.assertRaises(TypeError):
             delete_scoreset(ExperimentSetFactory())
 
+    def test_deletes_permission_groups(self):
+        scs = ScoreSetWithTargetFactory()
+        self.assertEqual(Group.objects.count(), 9)
+        delete_experimentset(scs.parent.parent)
+        self.assertEqual(Group.objects.count(), 0)
+
+    def test_skips_groups_already_deleted_in_bulk(self):
+        scs = ScoreSetWithTargetFactory()
+        with mock.patch(
+            "dataset.models.scoreset.delete_all_groups_for_instance"
+        ) as scoreset_patch, mock.patch(
+            "dataset.models.experiment.delete_all_groups_for_instance"
+        ) as experiment_patch, mock.patch(
+            "dataset.models.experimentset.delete_all_groups_for_instance"
+        ) as experimentset_patch:
+            delete_experimentset(scs.parent.parent)
+        scoreset_patch.assert_not_called()
+        experiment_patch.assert_not_called()
+        experimentset_patch.assert_not_called()
+
+    def test_reports_deleted_variants_to_progress(self):
+        scs = ScoreSetWithTargetFactory()
+        VariantFactory(scoreset=scs)
+        VariantFactory(scoreset=scs)
+        progress = []
+        delete_experiment(
+            scs.parent, progress=lambda s, n: progress.append((s.urn, n))
+        )
+        self.assertEqual(progress, [(scs.urn, 2)])
+
     def test_deletes_private_parents_only_meta_child(self):
         meta = ScoreSetFactory(meta_analyses=1)
         self.assertEqual(models.ScoreSet.objects.count(), 2)
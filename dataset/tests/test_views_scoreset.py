@@ -5,7 +5,9 @@ from io import StringIO
 from django.core.files.uploadedfile import InMemoryUploadedFile
 from pandas.testing import assert_frame_equal
 
+from django.db import connection
 from django.test import TestCase, TransactionTestCase, RequestFactory, mock
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse_lazy
 from django.http import Http404
 from django.core.exceptions import PermissionDenied
@@ -56,6 +58,7 @@ from ..factories import (
     ScoreSetWithTargetFactory,
 )
 from ..models.scoreset import ScoreSet
+from ..staging import load_staged_variants
 from ..views.scoreset import (
     ScoreSetDetailView,
     ScoreSetCreateView,
@@ -122,6 +125,30 @@ class TestScoreSetSetDetailView(TestCase, TestMessageMixin):
         response = ScoreSetDetailView.as_view()(request, urn=obj.urn)
         self.assertEqual(response.status_code, 200)
 
+    def test_permission_queries_do_not_grow_with_contributors(self):
+        def count_permission_queries(obj):
+            with CaptureQueriesContext(connection) as context:
+                response = self.client.get("/scoreset/{}/".format(obj.urn))
+            self.assertEqual(response.status_code, 200)
+            return sum(
+                "auth_user_groups" in query["sql"]
+                or '"auth_group"' in query["sql"]
+                for query in context.captured_queries
+            )
+
+        user = UserFactory()
+        self.client.force_login(user)
+        small = ScoreSetFactory()
+        small.add_administrators(user)
+        large = ScoreSetFactory()
+        large.add_administrators(user)
+        large.add_editors([UserFactory(), UserFactory()])
+        large.add_viewers([UserFactory(), UserFactory()])
+
+        self.assertEqual(
+            count_permission_queries(small), count_permission_queries(large)
+        )
+
     def test_scores_get_ajax(self):
         scs = ScoreSetFactory(private=False)
         scs.dataset_columns = {
@@ -601,8 +628,9 @@ class TestCreateNewScoreSetView(TransactionTestCase, TestMessageMixin):
             create_mock.assert_called_once()
             scores, counts, index = form.serialize_variants()
             expected = create_mock.call_args[1]["kwargs"]
-            expected_scores = expected.pop("scores_records")
-            expected_counts = expected.pop("counts_records")
+            expected_scores, expected_counts = load_staged_variants(
+                expected.pop("staged_upload")
+            )
             self.assertEqual(
                 {
                     "user_pk": self.user.pk,
@@ -612,8 +640,12 @@ class TestCreateNewScoreSetView(TransactionTestCase, TestMessageMixin):
                 },
                 expected,
             )
-            assert_frame_equal(scores, expected_scores)
-            assert_frame_equal(counts, expected_counts)
+            assert_frame_equal(
+                scores.reset_index(drop=True), expected_scores
+            )
+            assert_frame_equal(
+                counts.reset_index(drop=True), expected_counts
+            )
 
     @mock.patch(
         "dataset.tasks.create_variants.submit_task", return_value=(True, None)
@@ -4,6 +4,8 @@ from typing import Union, Optional
 from django.contrib.auth import get_user_model
 from django.db import transaction
 
+from accounts.permissions import delete_all_groups_for_instances
+from api import caching
 from dataset import models
 from variant.models import Variant
 from urn.models import get_model_by_urn
@@ -16,13 +18,13 @@ User = get_user_model()
 
 
 @transaction.atomic
-def delete_instance(instance):
+def delete_instance(instance, progress=None):
     if isinstance(instance, ExperimentSet):
-        delete_experimentset(instance)
+        delete_experimentset(instance, progress=progress)
     elif isinstance(instance, Experiment):
-        delete_experiment(instance)
+        delete_experiment(instance, progress=progress)
     elif isinstance(instance, ScoreSet):
-        delete_scoreset(instance)
+        delete_scoreset(instance, progress=progress)
     else:
         raise TypeError(
             "Expected ExperimentsSet, Experiment or ScoreSet. "
@@ -31,37 +33,81 @@ def delete_instance(instance):
 
 
 @transaction.atomic
-def delete_experimentset(experimentset):
+def delete_experimentset(experimentset, progress=None):
+    """
+    Deletes an experiment set, its experiments and their score sets.
+
+    Permission groups for the whole tree are deleted with one query and the
+    variants of each score set with one query. Datasets themselves are still
+    deleted through `Model.delete` so that signal receivers and reversion
+    history are unaffected.
+
+    Parameters
+    ----------
+    experimentset : `ExperimentSet`
+        The experiment set to delete.
+    progress : Callable[[ScoreSet, int], None], optional
+        Called with each score set and its number of deleted variants.
+    """
     if not isinstance(experimentset, ExperimentSet):
         raise TypeError(
             "Expected ExperimentSet, found {}.".format(
                 type(experimentset).__name__
             )
         )
-    for child in experimentset.children:
-        delete_experiment(child)
+    experiments = list(experimentset.children)
+    scoresets = {e.pk: list(e.children) for e in experiments}
+    delete_all_groups_for_instances(
+        [experimentset]
+        + experiments
+        + [s for children in scoresets.values() for s in children]
+    )
+    for child in experiments:
+        _delete_experiment(child, scoresets[child.pk], progress)
     experimentset.delete()
 
 
 @transaction.atomic
-def delete_experiment(experiment):
+def delete_experiment(experiment, progress=None):
+    """
+    Deletes an experiment and its score sets. See `delete_experimentset`.
+    """
     if not isinstance(experiment, Experiment):
         raise TypeError(
             "Expected Experiment, found {}.".format(type(experiment).__name__)
         )
-    for child in experiment.children:
-        delete_scoreset(child)
-    experiment.delete()
+    scoresets = list(experiment.children)
+    delete_all_groups_for_instances([experiment] + scoresets)
+    _delete_experiment(experiment, scoresets, progress)
 
 
 @transaction.atomic
-def delete_scoreset(scoreset):
+def delete_scoreset(scoreset, progress=None):
+    """
+    Deletes a score set and its variants. Also deletes the private dummy
+    experiment and experiment set of a meta-analysis if `scoreset` is their
+    only child. See `delete_experimentset`.
+    """
     if not isinstance(scoreset, ScoreSet):
         raise TypeError(
             "Expected ScoreSet, found {}.".format(type(scoreset).__name__)
         )
-    for variant in scoreset.children:
-        variant.delete()
+    delete_all_groups_for_instances([scoreset])
+    return _delete_scoreset(scoreset, progress)
+
+
+def _delete_experiment(experiment, scoresets, progress):
+    # Delete the instances whose groups were deleted, rather than reloading
+    # the children, so their pre_delete receivers see `groups_deleted`.
+    for child in scoresets:
+        _delete_scoreset(child, progress)
+    experiment.delete()
+
+
+def _delete_scoreset(scoreset, progress):
+    n_variants = Variant.bulk_delete(scoreset)
+    if progress is not None:
+        progress(scoreset, n_variants)
 
     should_delete_exp = False
     should_delete_exp_set = False
@@ -86,9 +132,9 @@ def delete_scoreset(scoreset):
     result = scoreset.delete()
 
     if should_delete_exp and experiment is not None:
-        delete_experiment(experiment)
+        delete_experiment(experiment, progress=progress)
     if should_delete_exp_set and experimentset is not None:
-        delete_experimentset(experimentset)
+        delete_experimentset(experimentset, progress=progress)
 
     return result
 
@@ -130,6 +176,11 @@ def publish_dataset(
     experiment = None
     # Forces a full refresh on on the dataset including nested parents.
     dataset = get_model_by_urn(dataset.urn)
+    tmp_urns = []
+    parent = dataset
+    while parent is not None:
+        tmp_urns.append(parent.urn)
+        parent = parent.parent
 
     if isinstance(dataset, models.scoreset.ScoreSet):
         experimentset = models.experimentset.assign_public_urn(
@@ -137,12 +188,7 @@ def publish_dataset(
         )
         experiment = models.experiment.assign_public_urn(dataset.experiment)
         scoreset = models.scoreset.assign_public_urn(dataset)
-        urns = Variant.bulk_create_urns(
-            scoreset.children.count(), scoreset, reset_counter=True
-        )
-        for urn, child in zip(urns, scoreset.children.all()):
-            child.urn = urn
-            child.save()
+        Variant.bulk_renumber(scoreset)
     elif isinstance(dataset, models.experiment.Experiment):
         experimentset = models.experimentset.assign_public_urn(
             dataset.experimentset
@@ -181,5 +227,12 @@ def publish_dataset(
         experimentset.set_modified_by(user, propagate=False)
         experimentset.save()
 
+    # Saving above only invalidates responses cached under the new urns.
+    caching.invalidate(
+        caching.DATASETS,
+        caching.TARGETS,
+        *(caching.dataset_tag(urn) for urn in tmp_urns),
+    )
+
     dataset.refresh_from_db()
     return get_model_by_urn(dataset.urn)  # Full refresh on nested parents.
@@ -22,6 +22,8 @@ from metadata.forms import (
     RefseqOffsetForm,
 )
 
+from dataset.staging import discard_staged_variants
+
 # Absolute import tasks for celery to work
 from dataset.tasks import create_variants
 from dataset import constants
@@ -306,14 +308,13 @@ class BaseScoreSetFormView(ScoreSetAjaxMixin):
             self.object.processing_state = constants.processing
             self.object.save()
 
-            scores_rs, counts_rs, index = form.serialize_variants()
+            staged_upload, index = form.stage_variants()
             task_kwargs = {
                 "user_pk": self.request.user.pk,
                 "scoreset_urn": self.object.urn,
                 "dataset_columns": form.dataset_columns.copy(),
                 "index": index,
-                "scores_records": scores_rs,
-                "counts_records": counts_rs,
+                "staged_upload": staged_upload,
             }
 
             success, _ = create_variants.submit_task(
@@ -330,6 +331,7 @@ class BaseScoreSetFormView(ScoreSetAjaxMixin):
             if not success:
                 self.object.processing_state = constants.failed
                 self.object.save()
+                discard_staged_variants(staged_upload)
 
 
 class ScoreSetCreateView(BaseScoreSetFormView, CreateDatasetView):
@@ -79,8 +79,19 @@ while attempt < 3:
       sys.stdout.write("No response. Sleeping\n")
       time.sleep(5)
     else:
-      tasks = list(inspection.items())[0][1]
-      assert len(tasks) == 11, "Expected 11 tasks. {} tasks were registered.".format(len(tasks))
+      tasks = set(list(inspection.items())[0][1])
+      expected = {
+        "api.tasks.evict_results",
+        "api.tasks.format_variant_large_get_response",
+        "core.tasks.health_check",
+        "core.tasks.send_mail",
+        "dataset.tasks.create_variants",
+        "dataset.tasks.delete_instance",
+        "dataset.tasks.publish_scoreset",
+        "main.tasks.refresh_home_aggregates",
+      }
+      missing = expected - tasks
+      assert not missing, "Tasks {} were not registered.".format(sorted(missing))
   except Exception as e:
     raise e
 
@@ -125,6 +136,15 @@ celery multi start "${CELERY_NODES}" \
   --pidfile="${CELERY_PID_DIR}/%n.pid" \
   --logfile="${CELERY_LOG_DIR}/%n%I.log"
 
+echo "Starting Celery beat."
+celery beat \
+  -A "${CELERY_PROJECT}" \
+  --detach \
+  --loglevel="${CELERY_LOG_LEVEL}" \
+  --pidfile="${CELERY_PID_DIR}/beat.pid" \
+  --logfile="${CELERY_LOG_DIR}/beat.log" \
+  --schedule="${CELERY_PID_DIR}/celerybeat-schedule"
+
 echo "Checking Celery"
 until celery_has_initialized; do
   >&2 echo "Could not check registered Celery tasks - sleeping"
@@ -137,6 +157,7 @@ done
 ###############################################################################
 echo "Running management commands."
 python3 manage.py migrate
+python3 manage.py createcachetable
 python3 manage.py updatesiteinfo
 python3 manage.py createlicences
 python3 manage.py createreferences
@@ -0,0 +1,20 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import migrations
+
+from core.indexes import trigram_index
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("genome", "0012_auto_20201118_1240"),
+        # Creates the pg_trgm extension.
+        ("metadata", "0008_trigram_indexes"),
+    ]
+
+    operations = [
+        trigram_index("genome_targetgene", "name"),
+        trigram_index("genome_referencegenome", "organism_name"),
+    ]
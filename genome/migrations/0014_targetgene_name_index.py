@@ -0,0 +1,18 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [("genome", "0013_trigram_indexes")]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="targetgene",
+            index=models.Index(
+                fields=["name"], name="genome_target_name_idx"
+            ),
+        ),
+    ]
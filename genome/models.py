@@ -65,6 +65,9 @@ class TargetGene(TimeStampedModel):
         ordering = ("name",)
         verbose_name = "Target Gene"
         verbose_name_plural = "Target Genes"
+        indexes = [
+            models.Index(fields=["name"], name="genome_target_name_idx")
+        ]
 
     @classmethod
     def tracked_fields(cls):
@@ -185,7 +188,10 @@ class TargetGene(TimeStampedModel):
     def get_offset_annotation(self, related_field) -> Optional[Any]:
         value = getattr(self, related_field, None)
         if value is not None:
-            return value.first()
+            # Sort in Python rather than calling `first()` so that offsets
+            # loaded with `prefetch_related` are used.
+            offsets = sorted(value.all(), key=lambda offset: offset.pk)
+            return offsets[0] if offsets else None
         return None
 
     def get_uniprot_offset_annotation(self):
@@ -0,0 +1,196 @@
+"""
+Organism, target and keyword aggregates of public datasets shown on the
+home page.
+
+The aggregates are computed with ``GROUP BY`` queries and served from the
+default cache. Saving a public dataset, or the target or reference map of
+one, schedules the `refresh_home_aggregates` task once the transaction
+commits, which replaces the cached copy.
+"""
+from collections import Counter
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import ObjectDoesNotExist
+from django.db import transaction
+from django.db.models import Count
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+from dataset.models.experiment import Experiment
+from dataset.models.scoreset import ScoreSet
+from genome.models import ReferenceGenome, ReferenceMap, TargetGene
+
+CACHE_KEY = "main:home_aggregates"
+REFRESH_LOCK_KEY = "main:home_aggregates:refresh"
+# Seconds a submitted refresh suppresses further ones in case the task is
+# lost before it releases the lock.
+REFRESH_LOCK_TIMEOUT = 300
+
+
+def get_top_n(n, ls):
+    counter = list(Counter(ls).items())
+    return [i for i, count in sorted(counter, key=lambda x: x[1])[-n:]]
+
+
+def organism_counts():
+    """
+    Returns a dictionary mapping each organism name to the number of public
+    score sets with a target mapped to a genome of that organism.
+    """
+    rows = (
+        ReferenceGenome.objects.filter(
+            associated_reference_maps__target__scoreset__private=False
+        )
+        .values_list("organism_name")
+        .annotate(
+            count=Count(
+                "associated_reference_maps__target__scoreset", distinct=True
+            )
+        )
+        .order_by("organism_name")
+    )
+    return dict(rows)
+
+
+def target_counts():
+    """
+    Returns a dictionary mapping each target name to the number of public
+    score sets with that target.
+    """
+    rows = (
+        ScoreSet.objects.filter(private=False, target__isnull=False)
+        .values_list("target__name")
+        .annotate(count=Count("pk"))
+        .order_by("target__name")
+    )
+    return dict(rows)
+
+
+def keyword_counts():
+    """
+    Returns a `Counter` mapping each keyword to the number of public
+    experiments and score sets tagged with it.
+    """
+    counts = Counter()
+    for model in (Experiment, ScoreSet):
+        counts.update(
+            dict(
+                model.objects.filter(private=False, keywords__isnull=False)
+                .values_list("keywords__text")
+                .annotate(count=Count("pk"))
+                .order_by("keywords__text")
+            )
+        )
+    return counts
+
+
+def compute_home_aggregates(n=3):
+    """
+    Computes the home page aggregates from the database.
+
+    Organisms are paired with their formatted HTML name so that search
+    links can be built from the raw text. Targets and keywords are paired
+    with themselves for template compatibility.
+
+    Parameters
+    ----------
+    n : int, optional. Default: 3
+        Number of top organisms, targets and keywords to include.
+
+    Returns
+    -------
+    dict
+        Home page context with keys ``top_organisms``, ``top_targets``,
+        ``top_keywords``, ``all_organisms`` and ``all_targets``.
+    """
+    organisms = organism_counts()
+    targets = target_counts()
+    keywords = keyword_counts()
+
+    def organism_html(name):
+        genome = ReferenceGenome(organism_name=name)
+        return genome.format_organism_name_html()
+
+    return {
+        "top_organisms": sorted(
+            (name, organism_html(name))
+            for name in get_top_n(n, organisms)
+        ),
+        "top_targets": sorted(
+            (name, name) for name in get_top_n(n, targets)
+        ),
+        "top_keywords": sorted(
+            (text, text) for text in get_top_n(n, keywords)
+        ),
+        "all_organisms": sorted(organisms),
+        "all_targets": sorted(targets),
+    }
+
+
+def refresh_home_aggregates():
+    """Recomputes the home page aggregates and stores them in the cache."""
+    aggregates = compute_home_aggregates()
+    cache.set(
+        CACHE_KEY, aggregates, timeout=settings.HOME_AGGREGATES_CACHE_TTL
+    )
+    return aggregates
+
+
+def get_home_aggregates():
+    """
+    Returns the cached home page aggregates, computing them on a cache
+    miss.
+    """
+    aggregates = cache.get(CACHE_KEY)
+    if aggregates is None:
+        aggregates = refresh_home_aggregates()
+    return aggregates
+
+
+def schedule_refresh():
+    """
+    Submits the `refresh_home_aggregates` task unless one is already
+    pending. The pending task picks up every change committed before it
+    runs.
+    """
+    from .tasks import refresh_home_aggregates as refresh_task
+
+    if cache.add(REFRESH_LOCK_KEY, True, timeout=REFRESH_LOCK_TIMEOUT):
+        refresh_task.submit_task()
+
+
+def _affects_public_datasets(instance) -> bool:
+    """
+    Returns False if `instance` is a private dataset or the target or
+    reference map of one, since those are excluded from the aggregates.
+    """
+    try:
+        if isinstance(instance, ReferenceMap):
+            instance = instance.target
+        if isinstance(instance, TargetGene):
+            instance = instance.scoreset
+    except ObjectDoesNotExist:
+        return True
+    return instance is not None and not getattr(instance, "private", False)
+
+
+def invalidate_home_aggregates(sender=None, instance=None, **kwargs):
+    """
+    Schedules a refresh of the cached aggregates once the current
+    transaction commits. The cached copy is served until the refresh
+    replaces it.
+    """
+    if not kwargs.get("action", "post_").startswith("post_"):
+        return
+    if _affects_public_datasets(instance):
+        transaction.on_commit(schedule_refresh)
+
+
+def connect_signals():
+    for model in (Experiment, ScoreSet, TargetGene, ReferenceMap):
+        post_save.connect(invalidate_home_aggregates, sender=model)
+        post_delete.connect(invalidate_home_aggregates, sender=model)
+    for model in (Experiment, ScoreSet):
+        m2m_changed.connect(
+            invalidate_home_aggregates, sender=model.keywords.through
+        )
@@ -3,3 +3,8 @@ from django.apps import apps
 
 class MainConfig(apps.AppConfig):
     name = "main"
+
+    def ready(self):
+        from .aggregates import connect_signals
+
+        connect_signals()
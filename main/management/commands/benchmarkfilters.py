@@ -0,0 +1,153 @@
+import random
+import re
+import sys
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+
+from dataset.filters import ScoreSetFilter
+from dataset.models.experiment import Experiment
+from dataset.models.experimentset import ExperimentSet
+from dataset.models.scoreset import ScoreSet
+from metadata.models import Keyword
+
+WORDS = (
+    "abundance",
+    "activity",
+    "binding",
+    "BRCA1",
+    "deep",
+    "domain",
+    "enzyme",
+    "fitness",
+    "human",
+    "kinase",
+    "mutational",
+    "promoter",
+    "receptor",
+    "saturation",
+    "scan",
+    "splicing",
+    "stability",
+    "suppressor",
+    "tumour",
+    "ubiquitin",
+    "variant",
+    "yeast",
+)
+
+EXECUTION_TIME_RE = re.compile(r"execution time: ([0-9.]+) ms", re.I)
+
+
+class Command(BaseCommand):
+    help = (
+        "Compares the query plans of the score set filters with and without "
+        "trigram lookups on a synthetic catalogue. The catalogue is created "
+        "in a transaction that is rolled back afterwards."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--scoresets",
+            type=int,
+            default=50000,
+            help="Number of synthetic score sets to create.",
+        )
+        parser.add_argument(
+            "--keywords",
+            type=int,
+            default=2000,
+            help="Number of synthetic keywords to create.",
+        )
+        parser.add_argument(
+            "--seed", type=int, default=0, help="Random seed."
+        )
+        parser.add_argument(
+            "--queries",
+            nargs="+",
+            type=str,
+            default=["title=kinase", "urn=01234", "keyword=stabil"],
+            help="Filter queries of the form <filter name>=<value>.",
+        )
+
+    def handle(self, *args, **kwargs):
+        queries = [q.split("=", 1) for q in kwargs["queries"]]
+
+        with transaction.atomic():
+            self.create_catalogue(
+                n_scoresets=kwargs["scoresets"],
+                n_keywords=kwargs["keywords"],
+                rng=random.Random(kwargs["seed"]),
+            )
+
+            timings = []
+            for name, value in queries:
+                for trigram in (False, True):
+                    mode = "trigram" if trigram else "icontains"
+                    queryset = ScoreSetFilter(
+                        data={name: value},
+                        queryset=ScoreSet.objects.all(),
+                        trigram=trigram,
+                    ).qs
+                    plan = self.explain(queryset)
+                    sys.stdout.write(
+                        "{}={} ({}):\n\t{}\n\n".format(
+                            name, value, mode, "\n\t".join(plan)
+                        )
+                    )
+                    match = EXECUTION_TIME_RE.search("\n".join(plan))
+                    timings.append(
+                        (name, value, mode, match.group(1) if match else "?")
+                    )
+
+            sys.stdout.write("Execution times:\n")
+            for name, value, mode, time in timings:
+                sys.stdout.write(
+                    "\t{}={} ({}): {} ms\n".format(name, value, mode, time)
+                )
+
+            transaction.set_rollback(True)
+
+    @staticmethod
+    def create_catalogue(n_scoresets, n_keywords, rng):
+        experiment = Experiment.objects.create(
+            experimentset=ExperimentSet.objects.create()
+        )
+        keywords = Keyword.objects.bulk_create(
+            Keyword(text="{} {}".format(rng.choice(WORDS).lower(), i))
+            for i in range(n_keywords)
+        )
+        # Bulk creation skips the save signals, so no permission groups or
+        # search documents are created for the synthetic score sets.
+        scoresets = ScoreSet.objects.bulk_create(
+            (
+                ScoreSet(
+                    experiment=experiment,
+                    urn="tmp:benchmark-{:06d}".format(i),
+                    title=" ".join(rng.sample(WORDS, 4)),
+                    short_description=" ".join(rng.sample(WORDS, 8)),
+                )
+                for i in range(n_scoresets)
+            ),
+            batch_size=1000,
+        )
+        through = ScoreSet.keywords.through
+        through.objects.bulk_create(
+            (
+                through(scoreset_id=scoreset.pk, keyword_id=keyword.pk)
+                for scoreset in scoresets
+                for keyword in rng.sample(keywords, min(3, len(keywords)))
+            ),
+            batch_size=1000,
+        )
+
+        with connection.cursor() as cursor:
+            for model in (ScoreSet, Keyword, through):
+                cursor.execute("ANALYZE {}".format(model._meta.db_table))
+
+    @staticmethod
+    def explain(queryset):
+        sql, params = queryset.query.sql_with_params()
+        with connection.cursor() as cursor:
+            cursor.execute("EXPLAIN ANALYZE " + sql, params)
+            return [row[0] for row in cursor.fetchall()]
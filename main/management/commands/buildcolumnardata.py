@@ -0,0 +1,42 @@
+import sys
+
+from django.core.management.base import BaseCommand
+
+from dataset.models.scoreset import ScoreSet
+from variant.models import ColumnarVariantData
+
+
+class Command(BaseCommand):
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--urns", nargs="+", type=str, help="Score set urns to build."
+        )
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            dest="all",
+            help="Build columnar data for all score sets.",
+        )
+
+    def handle(self, *args, **kwargs):
+        urns = kwargs.get("urns", None) or []
+        all_ = kwargs.get("all", False)
+
+        scoresets = ScoreSet.objects.all()
+        if not all_:
+            scoresets = scoresets.filter(urn__in=urns)
+
+        for scoreset in scoresets:
+            instance = ColumnarVariantData.build(scoreset)
+            if instance is None:
+                sys.stdout.write(
+                    "{} has non-numeric data. Skipping.\n".format(
+                        scoreset.urn
+                    )
+                )
+                continue
+            sys.stdout.write(
+                "Built columnar data for {} ({} variants).\n".format(
+                    scoreset.urn, instance.n_rows
+                )
+            )
@@ -0,0 +1,33 @@
+import sys
+
+from django.core.management.base import BaseCommand
+
+from dataset.models.scoreset import ScoreSet
+from variant.models import VariantSpan
+
+
+class Command(BaseCommand):
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--urns", nargs="+", type=str, help="Score set urns to index."
+        )
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            dest="all",
+            help="Index variant positions of all score sets.",
+        )
+
+    def handle(self, *args, **kwargs):
+        urns = kwargs.get("urns", None) or []
+        all_ = kwargs.get("all", False)
+
+        scoresets = ScoreSet.objects.all()
+        if not all_:
+            scoresets = scoresets.filter(urn__in=urns)
+
+        for scoreset in scoresets:
+            n_spans = VariantSpan.build(scoreset)
+            sys.stdout.write(
+                "Indexed {} spans for {}.\n".format(n_spans, scoreset.urn)
+            )
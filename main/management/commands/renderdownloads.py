@@ -0,0 +1,44 @@
+import sys
+
+from django.core.management.base import BaseCommand
+
+from api.artifacts import render_download_artifacts
+from dataset.models.scoreset import ScoreSet
+
+
+class Command(BaseCommand):
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--urns", nargs="+", type=str, help="Score set urns to render."
+        )
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            dest="all",
+            help="Render downloads for all public score sets.",
+        )
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            dest="force",
+            help="Re-render downloads that have already been rendered.",
+        )
+
+    def handle(self, *args, **kwargs):
+        urns = kwargs.get("urns", None) or []
+        all_ = kwargs.get("all", False)
+        force = kwargs.get("force", False)
+
+        scoresets = ScoreSet.objects.filter(
+            private=False, urn__startswith="urn:"
+        )
+        if not all_:
+            scoresets = scoresets.filter(urn__in=urns)
+
+        for scoreset in scoresets:
+            written = render_download_artifacts(scoreset, force=force)
+            sys.stdout.write(
+                "Rendered {} files for {}.\n".format(
+                    len(written), scoreset.urn
+                )
+            )
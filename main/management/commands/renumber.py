@@ -7,10 +7,6 @@ from dataset.models.scoreset import ScoreSet
 from variant.models import Variant
 
 
-def get_number(variant):
-    return int(variant.urn.split("#")[-1])
-
-
 class Command(BaseCommand):
     def add_arguments(self, parser):
         parser.add_argument(
@@ -43,27 +39,7 @@ class Command(BaseCommand):
                 continue
 
             sys.stdout.write("Re-numbering {}.\n".format(scoreset.urn))
-
-            scoreset.last_child_value = 0
-            variants = sorted(
-                scoreset.children.all(), key=lambda v: get_number(v)
-            )
-            urns = Variant.bulk_create_urns(
-                scoreset.children.count(), scoreset
-            )
-            sys.stdout.write(
-                "\tCreated urns {}, ..., {}.\n".format(
-                    ", ".join(urns[0:3]), urns[-1]
-                )
-            )
-
-            sys.stdout.write("\tUpdating variant urns.\n")
-            for urn, variant in zip(urns, variants):
-                variant.urn = urn
-                variant.save()
-
-            scoreset.last_child_value = len(variants)
-            scoreset.save()
+            Variant.bulk_renumber(scoreset)
             sys.stdout.write(
                 "\tUpdated last child value to {}.\n\n".format(
                     scoreset.last_child_value
@@ -0,0 +1,20 @@
+from celery.utils.log import get_task_logger
+from django.core.cache import cache
+
+from core.tasks import BaseTask
+
+from mavedb import celery_app
+
+from . import aggregates
+
+logger = get_task_logger("main.tasks")
+
+
+@celery_app.task(ignore_result=True, base=BaseTask)
+def refresh_home_aggregates():
+    """Recomputes the cached home page aggregates."""
+    # Release the lock first so that changes committed while computing
+    # schedule another refresh.
+    cache.delete(aggregates.REFRESH_LOCK_KEY)
+    aggregates.refresh_home_aggregates()
+    logger.info("Refreshed home page aggregates.")
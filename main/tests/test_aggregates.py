@@ -0,0 +1,135 @@
+from django.core.cache import cache
+from django.test import TestCase, mock, override_settings
+
+from dataset.factories import ExperimentFactory, ScoreSetWithTargetFactory
+from metadata.factories import KeywordFactory
+
+from .. import aggregates, tasks
+
+
+LOCMEM_CACHE = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+}
+
+
+class TestGetTopN(TestCase):
+    def test_top_n(self):
+        result = aggregates.get_top_n(3, [1, 1, 2, 3, 4, 5, 3, 3, 3, 2])
+        self.assertListEqual(result, [1, 2, 3])
+
+    def test_top_n_from_counts(self):
+        result = aggregates.get_top_n(2, {"a": 1, "b": 5, "c": 3})
+        self.assertListEqual(result, ["c", "b"])
+
+
+class TestComputeHomeAggregates(TestCase):
+    def make_public(self, instance, keyword=None):
+        if keyword is not None:
+            instance.keywords.clear()
+            instance.keywords.add(KeywordFactory(text=keyword))
+        instance.private = False
+        instance.save()
+        return instance
+
+    def test_excludes_private_datasets(self):
+        ScoreSetWithTargetFactory()
+        ExperimentFactory()
+        result = aggregates.compute_home_aggregates()
+        self.assertListEqual(result["top_organisms"], [])
+        self.assertListEqual(result["top_targets"], [])
+        self.assertListEqual(result["top_keywords"], [])
+        self.assertListEqual(result["all_organisms"], [])
+        self.assertListEqual(result["all_targets"], [])
+
+    def test_counts_public_targets_and_organisms(self):
+        first = self.make_public(ScoreSetWithTargetFactory())
+        second = self.make_public(ScoreSetWithTargetFactory())
+        result = aggregates.compute_home_aggregates()
+        self.assertListEqual(
+            result["all_targets"],
+            sorted([first.target.name, second.target.name]),
+        )
+        self.assertListEqual(
+            result["top_targets"],
+            sorted([(s.target.name,) * 2 for s in (first, second)]),
+        )
+        genome = first.target.get_reference_genomes().first()
+        self.assertIn(genome.organism_name, result["all_organisms"])
+        self.assertIn(
+            (genome.organism_name, genome.format_organism_name_html()),
+            result["top_organisms"],
+        )
+
+    def test_counts_keywords_of_experiments_and_scoresets(self):
+        self.make_public(ScoreSetWithTargetFactory(), keyword="shared")
+        self.make_public(ExperimentFactory(), keyword="shared")
+        self.make_public(ExperimentFactory(), keyword="other")
+        self.assertEqual(
+            aggregates.keyword_counts(), {"shared": 2, "other": 1}
+        )
+        result = aggregates.compute_home_aggregates(n=1)
+        self.assertListEqual(result["top_keywords"], [("shared", "shared")])
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+class TestGetHomeAggregates(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def tearDown(self):
+        cache.clear()
+
+    def test_serves_cached_aggregates(self):
+        aggregates.get_home_aggregates()
+        with self.assertNumQueries(0):
+            aggregates.get_home_aggregates()
+
+    def test_refresh_replaces_cached_aggregates(self):
+        instance = ScoreSetWithTargetFactory()
+        self.assertListEqual(
+            aggregates.get_home_aggregates()["all_targets"], []
+        )
+        instance.private = False
+        instance.save()
+        self.assertListEqual(
+            aggregates.get_home_aggregates()["all_targets"], []
+        )
+        aggregates.refresh_home_aggregates()
+        self.assertListEqual(
+            aggregates.get_home_aggregates()["all_targets"],
+            [instance.target.name],
+        )
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+class TestInvalidateHomeAggregates(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def tearDown(self):
+        cache.clear()
+
+    @mock.patch("main.aggregates.transaction.on_commit")
+    def test_schedules_refresh_for_public_datasets(self, on_commit):
+        instance = ScoreSetWithTargetFactory()
+        on_commit.reset_mock()
+        instance.private = False
+        instance.save()
+        on_commit.assert_called_once_with(aggregates.schedule_refresh)
+
+    @mock.patch("main.aggregates.transaction.on_commit")
+    def test_ignores_private_datasets(self, on_commit):
+        instance = ScoreSetWithTargetFactory()
+        instance.save()
+        instance.target.save()
+        on_commit.assert_not_called()
+
+    @mock.patch.object(tasks.refresh_home_aggregates, "submit_task")
+    def test_submits_one_refresh_until_it_runs(self, submit_task):
+        aggregates.schedule_refresh()
+        aggregates.schedule_refresh()
+        submit_task.assert_called_once()
+
+        tasks.refresh_home_aggregates()
+        aggregates.schedule_refresh()
+        self.assertEqual(submit_task.call_count, 2)
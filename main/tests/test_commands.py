@@ -1,12 +1,21 @@
-from django.test import TestCase
+import io
+import os
+import tempfile
+from contextlib import redirect_stdout
+
+from django.test import TestCase, override_settings
 from django.core.management import call_command
 from django.core.exceptions import ValidationError, ObjectDoesNotExist
 
 from accounts.factories import UserFactory
+from api import artifacts
 from dataset.factories import ScoreSetFactory
+from dataset.models.scoreset import ScoreSet
+from dataset.utilities import publish_dataset
 from metadata.factories import PubmedIdentifierFactory
 from metadata.models import PubmedIdentifier
 from dataset import constants
+from variant.factories import VariantFactory
 
 
 class TestAddPmidCommand(TestCase):
@@ -140,3 +149,57 @@ class TestAddUserCommand(TestCase):
         self.assertIn(user, instance.viewers)
         self.assertNotIn(user, instance.administrators)
         self.assertNotIn(user, instance.editors)
+
+
+class TestRenumberCommand(TestCase):
+    def test_renumbers_public_scoreset_variants(self):
+        scoreset = publish_dataset(ScoreSetFactory())
+        v3 = VariantFactory(scoreset=scoreset, urn=f"{scoreset.urn}#3")
+        v5 = VariantFactory(scoreset=scoreset, urn=f"{scoreset.urn}#5")
+
+        call_command("renumber", urns=[scoreset.urn])
+
+        v3.refresh_from_db()
+        v5.refresh_from_db()
+        scoreset.refresh_from_db()
+        self.assertEqual(v3.urn, f"{scoreset.urn}#1")
+        self.assertEqual(v5.urn, f"{scoreset.urn}#2")
+        self.assertEqual(scoreset.last_child_value, 2)
+
+    def test_resets_private_scoreset_counter(self):
+        scoreset = ScoreSetFactory()
+        scoreset.last_child_value = 10
+        scoreset.save()
+
+        call_command("renumber", all=True)
+
+        scoreset.refresh_from_db()
+        self.assertEqual(scoreset.last_child_value, 0)
+
+
+class TestRenderDownloadsCommand(TestCase):
+    def test_renders_public_scoresets_only(self):
+        public = publish_dataset(ScoreSetFactory())
+        ScoreSetFactory()
+        with tempfile.TemporaryDirectory() as directory:
+            with override_settings(DOWNLOAD_ARTIFACT_DIR=directory):
+                call_command("renderdownloads", all=True)
+                for dtype in artifacts.DTYPES:
+                    path = artifacts.artifact_path(public, dtype)
+                    self.assertTrue(os.path.exists(path))
+                self.assertEqual(len(os.listdir(directory)), 1)
+
+
+class TestBenchmarkFiltersCommand(TestCase):
+    def test_explains_both_modes_and_rolls_back(self):
+        out = io.StringIO()
+        with redirect_stdout(out):
+            call_command(
+                "benchmarkfilters",
+                scoresets=20,
+                keywords=5,
+                queries=["title=kinase"],
+            )
+        self.assertIn("title=kinase (icontains)", out.getvalue())
+        self.assertIn("title=kinase (trigram)", out.getvalue())
+        self.assertEqual(ScoreSet.objects.count(), 0)
@@ -2,16 +2,9 @@ from django.test import TestCase
 
 from dataset.factories import ScoreSetWithTargetFactory
 
-from .. import views
 from ..factories import SiteInformationFactory, NewsFactory
 
 
-class TestGetTopN(TestCase):
-    def test_top_n(self):
-        result = views.get_top_n(3, [1, 1, 2, 3, 4, 5, 3, 3, 3, 2])
-        self.assertListEqual(result, [1, 2, 3])
-
-
 class HomePageTest(TestCase):
     """
     This class tests that the home page is rendered correctly,
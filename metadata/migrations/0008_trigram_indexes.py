@@ -0,0 +1,22 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+from core.indexes import trigram_index
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("metadata", "0007_auto_20210825_1634"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        trigram_index("metadata_keyword", "text"),
+        trigram_index("metadata_doiidentifier", "identifier"),
+        trigram_index("metadata_sraidentifier", "identifier"),
+        trigram_index("metadata_pubmedidentifier", "identifier"),
+    ]
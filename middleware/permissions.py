@@ -0,0 +1,42 @@
+from django.utils.deprecation import MiddlewareMixin
+
+from accounts import permission_cache
+
+
+class PermissionCacheMiddleware(MiddlewareMixin):
+    """Permission cache middleware
+
+    Methods
+    -------
+    process_request(request)
+      Activate a permission cache for the duration of the request.
+    process_response(request, response)
+      Discard the permission cache once the response has been rendered.
+    """
+
+    def process_request(self, request):
+        """Activate a fresh :class:`PermissionCache` for this request.
+
+        Parameters
+        ----------
+        request : HttpRequest
+          The current HTTP request
+        """
+        permission_cache.activate()
+
+    def process_response(self, request, response):
+        """Deactivate the request's :class:`PermissionCache`.
+
+        Parameters
+        ----------
+        request : HttpRequest
+          The current HTTP request
+        response : HttpResponse
+          The HTTP response being returned
+
+        Returns
+        -------
+        The HTTP response
+        """
+        permission_cache.deactivate()
+        return response
@@ -25,7 +25,21 @@ User = get_user_model()
 
 
 class BasicSearchForm(forms.Form):
+    CONTAINS = "contains"
+    FULL_TEXT = "fulltext"
+
     search = forms.CharField(required=False)
+    mode = forms.ChoiceField(
+        required=False,
+        choices=((CONTAINS, "Contains"), (FULL_TEXT, "Ranked full-text")),
+    )
+
+    def is_full_text(self):
+        return (
+            self.is_valid()
+            and bool(self.cleaned_data.get("search"))
+            and self.cleaned_data.get("mode") == self.FULL_TEXT
+        )
 
     def format_data_for_filter(self):
         if not self.is_valid():
@@ -8,6 +8,7 @@ from accounts.factories import UserFactory
 
 from dataset import factories
 from dataset import utilities
+from dataset.models.scoreset import ScoreSet
 
 from .. import views
 
@@ -206,3 +207,62 @@ class TestSearchView(TestCase):
                 .format_reference_genome_organism_html()
                 in [r["value"] for r in search_panes_data["organism"]]
             )
+
+    def test_search_panes_counts_each_scoreset(self):
+        scoresets = ScoreSet.objects.filter(
+            pk__in=[self.scs1.pk, self.scs2.pk, self.scs3.pk]
+        )
+        options = views.format_search_panes_options(scoresets, user=None)
+        for key in ("target", "type", "organism"):
+            self.assertEqual(
+                sum(r["count"] for r in options["options"][key]), 3
+            )
+
+    def test_full_text_mode_ranks_matches_from_search_document(self):
+        self.scs1.title = "Ubiquitin"
+        self.scs1.save()
+        self.scs3.abstract_text = "Ubiquitin ubiquitin ubiquitin"
+        self.scs3.save()
+        request = self.factory.post(
+            self.path,
+            data=self.mock_data(
+                {"search[value]": "ubiquitin", "search[mode]": "fulltext"}
+            ),
+            HTTP_X_REQUESTED_WITH="XMLHttpRequest",
+        )
+        request.user = None
+
+        response = views.search_view(request)
+        self.assertEqual(response.status_code, 200)
+
+        data = json.loads(response.content)
+        self.assertEqual(
+            [record["urn"] for record in data.get("data")],
+            [self.scs1.urn, self.scs3.urn],
+        )
+
+    def test_follows_next_cursor(self):
+        request = self.factory.post(
+            self.path,
+            data=self.mock_data({"length": 2}),
+            HTTP_X_REQUESTED_WITH="XMLHttpRequest",
+        )
+        request.user = None
+        data = json.loads(views.search_view(request).content)
+        self.assertEqual(data["recordsFiltered"], 3)
+        self.assertIsNone(data["cursor"]["previous"])
+
+        request = self.factory.post(
+            self.path,
+            data=self.mock_data(
+                {"start": 2, "length": 2, "cursor": data["cursor"]["next"]}
+            ),
+            HTTP_X_REQUESTED_WITH="XMLHttpRequest",
+        )
+        request.user = None
+        data = json.loads(views.search_view(request).content)
+        self.assertEqual(
+            [record["urn"] for record in data.get("data")], [self.scs3.urn]
+        )
+        self.assertIsNone(data["cursor"]["next"])
+        self.assertIsNotNone(data["cursor"]["previous"])
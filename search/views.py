@@ -1,26 +1,27 @@
 from typing import Dict, List, Union, Tuple, Optional
-from collections import Counter
 import math
 
-from django.db.models import QuerySet
+from django.db.models import Count, OuterRef, QuerySet, Subquery
 from django.forms import Form
 from django.shortcuts import render
 from django.contrib.auth import get_user_model
 from django.http.response import JsonResponse
-from django.core.paginator import Paginator, Page
 from django.views.decorators.csrf import (
     requires_csrf_token,
     ensure_csrf_cookie,
 )
 
+from core.pagination import keyset_page
+from dataset.models.base import full_text_search, search_rank
 from dataset.models.experiment import Experiment
 from dataset.models.scoreset import ScoreSet
 from dataset.templatetags.dataset_tags import (
+    batch_display_targets,
     format_urn_name_for_user,
-    display_targets,
     filter_visible,
 )
 from dataset.filters import ScoreSetFilter, ExperimentFilter
+from genome.models import ReferenceGenome, ReferenceMap
 
 from . import forms
 
@@ -29,6 +30,15 @@ User = get_user_model()
 ExperimentQuerySet = Union[QuerySet, List[Experiment]]
 ScoreSetQuerySet = Union[QuerySet, List[ScoreSet]]
 
+# Data-tables columns that can be paginated by keyset. Organisms are
+# excluded since a target can have several reference maps.
+KEYSET_COLUMNS = {
+    "0": "urn",
+    "1": "short_description",
+    "2": "target__name",
+    "3": "target__category",
+}
+
 
 @ensure_csrf_cookie
 @requires_csrf_token
@@ -56,11 +66,7 @@ def process_search_request(request) -> Dict:
     # Map to unique latest versions so deprecated versions won't shown in
     # search results.
     scoresets = filter_visible(
-        ScoreSet.objects.filter(
-            pk__in=set(
-                i.get_current_version(user).pk for i in ScoreSet.objects.all()
-            )
-        ),
+        ScoreSet.resolve_current_versions(ScoreSet.objects.all(), user),
         user=user,
         distinct=False,
     )
@@ -72,22 +78,28 @@ def process_search_request(request) -> Dict:
     if adv_form and adv_form.is_valid():
         data = adv_form.format_data_for_filter()
         experiment_filter = ExperimentFilter(
-            data=data, request=request, queryset=experiments
+            data=data, request=request, queryset=experiments, trigram=True
         )
         scoreset_filter = ScoreSetFilter(
-            data=data, request=request, queryset=scoresets
+            data=data, request=request, queryset=scoresets, trigram=True
         )
         experiments = experiment_filter.qs
         scoresets = scoreset_filter.qs
 
-    # Further filter results if the search box is used using full-text search
-    if basic_form and basic_form.is_valid():
+    # Further filter results if the search box is used, either ranked from
+    # the full-text search index or by matching substrings of each field.
+    search_value = None
+    if basic_form and basic_form.is_full_text():
+        search_value = basic_form.cleaned_data["search"]
+        experiments = full_text_search(experiments, search_value)
+        scoresets = full_text_search(scoresets, search_value)
+    elif basic_form and basic_form.is_valid():
         data = basic_form.format_data_for_filter()
         experiment_filter = ExperimentFilter(
-            data=data, request=request, queryset=experiments
+            data=data, request=request, queryset=experiments, trigram=True
         )
         scoreset_filter = ScoreSetFilter(
-            data=data, request=request, queryset=scoresets
+            data=data, request=request, queryset=scoresets, trigram=True
         )
         experiments = experiment_filter.qs_or
         scoresets = scoreset_filter.qs_or
@@ -124,6 +136,8 @@ def process_search_request(request) -> Dict:
             page_num=page_num,
             per_page=per_page,
             total_count=total_count,
+            search_value=search_value,
+            cursor=request.POST.get("cursor"),
         )
     )
     return datatables_data
@@ -138,7 +152,7 @@ def combine_scoresets(
     # Map to new versions again in case any deprecated versions have been
     # introduced from combining all the experiment children above.
     scoresets = scoresets.filter(
-        pk__in=set(i.get_current_version(user).pk for i in scoresets)
+        pk__in=ScoreSet.resolve_current_versions(scoresets, user).values("pk")
     )
     return filter_visible(scoresets, user=user, distinct=True)
 
@@ -177,7 +191,12 @@ def format_datatables_search(request) -> Tuple[Form, Optional[Form]]:
 
     basic_search = request.POST.get("search[value]")
     if basic_search:
-        basic_form = forms.BasicSearchForm(data={"search": basic_search})
+        basic_form = forms.BasicSearchForm(
+            data={
+                "search": basic_search,
+                "mode": request.POST.get("search[mode]", ""),
+            }
+        )
 
     return basic_form, adv_form
 
@@ -190,31 +209,50 @@ def format_datatables_response(
     per_page: int = 10,
     page_num: int = 1,
     total_count: Optional[int] = None,
+    search_value: Optional[str] = None,
+    cursor: Optional[str] = None,
 ) -> Dict:
-    # Apply ordering using data-tables POST parameters
-    scoresets = order_scoresets(
-        scoresets=scoresets, column=order_by, direction=order_dir
-    ).distinct()
-
-    paginator = Paginator(object_list=scoresets, per_page=per_page)
-    if page_num > paginator.num_pages:
-        page_num = paginator.num_pages
-    page: Page = paginator.page(page_num)
+    records_filtered = scoresets.count()
+    num_pages = max(1, math.ceil(records_filtered / per_page))
+    page_num = min(page_num, num_pages)
+
+    if search_value is None and order_by in KEYSET_COLUMNS:
+        # Seek from the cursor, or the page offset when jumping to a page
+        # without one, so that deep pages cost the same as the first.
+        page = keyset_page(
+            scoresets.select_related("experiment"),
+            field=KEYSET_COLUMNS[order_by],
+            descending=order_dir == "desc",
+            per_page=per_page,
+            cursor=cursor,
+            offset=(page_num - 1) * per_page,
+        )
+        object_list = page.object_list
+        cursors = {"next": page.next_cursor, "previous": page.previous_cursor}
+    else:
+        # Apply ordering using data-tables POST parameters
+        scoresets = order_scoresets(
+            scoresets=scoresets, column=order_by, direction=order_dir
+        )
+        if search_value:
+            # Full-text matches are ranked first, then ordered by column.
+            scoresets = scoresets.annotate(
+                rank=search_rank(search_value)
+            ).order_by("-rank", *scoresets.query.order_by)
+        scoresets = scoresets.select_related("experiment").distinct()
+        offset = (page_num - 1) * per_page
+        object_list = scoresets[offset : offset + per_page]
+        cursors = {"next": None, "previous": None}
+
+    # Rows are already the distinct current versions visible to the user,
+    # see `combine_scoresets`.
+    current = list(object_list)
 
     # JSON record data for data-tables
     data = []
-    seen = set()
-    for scoreset in page.object_list:
-        scoreset = scoreset.get_current_version(user=user)
-
-        # Older scoresets returned from search might map to same current
-        # version.
-        if scoreset.urn in seen:
-            continue
-        else:
-            seen.add(scoreset.urn)
-
-        names, types, orgs = display_targets(scoreset, user, all_fields=True)
+    targets = batch_display_targets(current)
+    for scoreset in current:
+        names, types, orgs = targets[scoreset.pk]
         data.append(
             {
                 "urn": scoreset.urn,
@@ -232,9 +270,10 @@ def format_datatables_response(
         )
 
     return {
-        "recordsFiltered": scoresets.count(),
+        "recordsFiltered": records_filtered,
         "recordsTotal": total_count,
         "data": data,
+        "cursor": cursors,
     }
 
 
@@ -263,29 +302,48 @@ def order_scoresets(
 def format_search_panes_options(
     scoresets: ScoreSetQuerySet, user: User
 ) -> Dict:
-    options_targets = []
-    options_target_types = []
-    options_target_orgs = []
+    """
+    Counts the score sets per target name, target type and organism with a
+    single GROUP BY query. Score sets without a target or reference map are
+    counted under '-', as in `display_targets`.
+    """
+    # Genome of the reference map `get_ref_map` would pick.
+    genome = Subquery(
+        ReferenceMap.objects.filter(target__scoreset=OuterRef("pk"))
+        .order_by("-is_primary", "pk")
+        .values("genome")[:1]
+    )
+    rows = (
+        ScoreSet.objects.filter(pk__in=scoresets.order_by().values("pk"))
+        .annotate(genome_pk=genome)
+        .order_by()
+        .values("target__name", "target__category", "genome_pk")
+        .annotate(count=Count("pk"))
+    )
+    rows = list(rows)
+    genomes = ReferenceGenome.objects.in_bulk(
+        set(row["genome_pk"] for row in rows if row["genome_pk"])
+    )
 
-    for scoreset in scoresets:
-        name, t_type, org = display_targets(scoreset, user, all_fields=True)
-        options_targets.append(name)
-        options_target_types.append(t_type)
-        options_target_orgs.append(org)
+    counts = {"target": {}, "type": {}, "organism": {}}
+    for row in rows:
+        if row["genome_pk"] is None:
+            values = ("-", "-", "-")
+        else:
+            values = (
+                row["target__name"],
+                row["target__category"],
+                genomes[row["genome_pk"]].format_organism_name_html(),
+            )
+        for key, value in zip(("target", "type", "organism"), values):
+            counts[key][value] = counts[key].get(value, 0) + row["count"]
 
     return {
         "options": {
-            "target": [
-                {"label": k, "value": k, "count": count, "total": count}
-                for k, count in Counter(options_targets).items()
-            ],
-            "type": [
-                {"label": k, "value": k, "count": count, "total": count}
-                for k, count in Counter(options_target_types).items()
-            ],
-            "organism": [
+            key: [
                 {"label": k, "value": k, "count": count, "total": count}
-                for k, count in Counter(options_target_orgs).items()
-            ],
+                for k, count in options.items()
+            ]
+            for key, options in counts.items()
         }
     }
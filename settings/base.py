@@ -18,6 +18,59 @@ SECURE_BROWSER_XSS_FILTER = True
 # MaveDB APP behaviour settings
 META_ANALYSIS_ALLOW_DAISY_CHAIN = False
 
+# Number of worker processes used to validate HGVS columns of uploaded
+# score/count files. Files with fewer rows than the threshold are validated
+# in-process, as are all files when set to 1 (the default).
+HGVS_VALIDATION_PROCESSES = int(os.getenv("APP_HGVS_VALIDATION_PROCESSES", 1))
+HGVS_VALIDATION_PARALLEL_THRESHOLD = int(
+    os.getenv("APP_HGVS_VALIDATION_PARALLEL_THRESHOLD", 50000)
+)
+
+# Directories the web application and the Celery workers both read and
+# write, so they must be on storage shared by every host running either:
+# validated uploads staged for the create_variants task, pre-rendered CSV
+# downloads of published score sets and results generated asynchronously
+# for large API requests.
+UPLOAD_SPOOL_DIR = os.getenv("APP_UPLOAD_SPOOL_DIR", "/tmp/mavedb/uploads")
+DOWNLOAD_ARTIFACT_DIR = os.getenv(
+    "APP_DOWNLOAD_ARTIFACT_DIR", "/tmp/mavedb/downloads"
+)
+API_RESULTS_DIR = os.getenv("APP_API_RESULTS_DIR", "/tmp/mavedb/results")
+
+DOWNLOAD_ARTIFACT_GZIP = os.getenv(
+    "APP_DOWNLOAD_ARTIFACT_GZIP", "false"
+).lower() in ("1", "true", "yes")
+
+# Aggregates refreshed and API responses invalidated by a Celery worker must
+# be seen by every web process, so per-process backends such as LocMemCache
+# are rejected by a system check unless Celery tasks run eagerly.
+CACHES = {
+    "default": {
+        "BACKEND": os.getenv(
+            "APP_CACHE_BACKEND",
+            "django.core.cache.backends.filebased.FileBasedCache",
+        ),
+        "LOCATION": os.getenv("APP_CACHE_LOCATION", "/tmp/mavedb/cache"),
+    }
+}
+
+# Seconds the home page organism, target and keyword aggregates are cached.
+HOME_AGGREGATES_CACHE_TTL = int(
+    os.getenv("APP_HOME_AGGREGATES_CACHE_TTL", 60 * 60)
+)
+
+# Seconds responses to anonymous API reads are cached. Set to 0 to disable.
+API_CACHE_TTL = int(os.getenv("APP_API_CACHE_TTL", 60 * 10))
+
+# Seconds results of large API requests are kept once ready.
+API_RESULTS_TTL = int(os.getenv("APP_API_RESULTS_TTL", 24 * 60 * 60))
+# Largest uncompressed size of a single result, and total size of the stored
+# results beyond which the oldest are evicted, in bytes.
+API_RESULTS_MAX_SIZE = int(os.getenv("APP_API_RESULTS_MAX_SIZE", 2 ** 30))
+API_RESULTS_MAX_TOTAL_SIZE = int(
+    os.getenv("APP_API_RESULTS_MAX_TOTAL_SIZE", 10 * 2 ** 30)
+)
+
 BASE_URL = os.getenv("APP_BASE_URL", "localhost:8000")
 API_BASE_URL = os.getenv("APP_API_BASE_URL", "localhost:8000/api")
 SECRET_KEY = os.getenv("APP_SECRET_KEY", "very_secret_key")
@@ -108,6 +161,7 @@ MIDDLEWARE = [
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "middleware.permissions.PermissionCacheMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
     # Social-auth middleware
@@ -113,6 +113,12 @@ CELERY_WORKER_HIJACK_ROOT_LOGGER = False
 CELERY_TASK_ALWAYS_EAGER = False
 CELERY_TASK_CREATE_MISSING_QUEUES = True
 CELERY_TASK_COMPRESSION = "gzip"
+CELERY_BEAT_SCHEDULE = {
+    "evict-api-results": {
+        "task": "api.tasks.evict_results",
+        "schedule": 60 * 60,
+    }
+}
 
 # Celery needs this for autodiscover to work
 INSTALLED_APPS = [
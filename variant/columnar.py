@@ -0,0 +1,104 @@
+"""
+Column-major binary encoding of variant score and count data.
+
+A block holds the values of each column one after another. Each column is
+laid out as::
+
+    <kind: 1 byte> <null bitmap: ceil(n / 8) bytes> <values: n * 8 bytes>
+
+where `kind` is ``b"q"`` for little-endian int64 and ``b"d"`` for
+little-endian float64 values, bit ``i`` of the bitmap (least significant bit
+first) is set when row ``i`` is null, and null rows hold a zero value. The
+number of rows and the column names are stored alongside the block.
+"""
+from numbers import Integral, Real
+from typing import Iterable, List, Optional, Sequence, Union
+
+import numpy as np
+
+INT64 = b"q"
+FLOAT64 = b"d"
+DTYPES = {INT64: np.dtype("<i8"), FLOAT64: np.dtype("<f8")}
+
+Number = Union[int, float]
+
+
+class NotEncodable(ValueError):
+    """Raised when a column holds values that are not numbers."""
+
+
+def column_kind(values: Iterable) -> bytes:
+    """
+    Returns the kind of column able to hold `values`, ignoring nulls. Integer
+    columns are only used if every value fits in an int64.
+    """
+    kind = INT64
+    for value in values:
+        if value is None:
+            continue
+        if isinstance(value, bool) or not isinstance(value, Real):
+            raise NotEncodable(
+                "Cannot encode value {!r} of type {}.".format(
+                    value, type(value).__name__
+                )
+            )
+        if not isinstance(value, Integral) or not (
+            -(2 ** 63) <= value < 2 ** 63
+        ):
+            kind = FLOAT64
+    return kind
+
+
+def encode_columns(columns: Sequence[Sequence[Optional[Number]]]) -> bytes:
+    """
+    Encodes `columns`, a list of equally long lists of numbers or `None`,
+    into a single block.
+
+    Raises
+    ------
+    NotEncodable : A column contains a value that is not a number.
+    """
+    chunks = []
+    for values in columns:
+        kind = column_kind(values)
+        mask = np.fromiter((v is None for v in values), dtype=bool)
+        array = np.array(
+            [0 if v is None else v for v in values], dtype=DTYPES[kind]
+        )
+        chunks.append(kind)
+        chunks.append(np.packbits(mask, bitorder="little").tobytes())
+        chunks.append(array.tobytes())
+    return b"".join(chunks)
+
+
+def decode_columns(
+    block: bytes, n_columns: int, n_rows: int
+) -> List[List[Optional[Number]]]:
+    """
+    Decodes a block written by `encode_columns` into a list of columns,
+    each a list of python `int`/`float` values with `None` for nulls.
+    """
+    block = bytes(block)
+    mask_size = (n_rows + 7) // 8
+    offset = 0
+    columns = []
+    for _ in range(n_columns):
+        kind = block[offset : offset + 1]
+        offset += 1
+        bitmap = np.frombuffer(
+            block, dtype=np.uint8, count=mask_size, offset=offset
+        )
+        mask = np.unpackbits(
+            bitmap, count=n_rows, bitorder="little"
+        ).astype(bool)
+        offset += mask_size
+        array = np.frombuffer(
+            block, dtype=DTYPES[kind], count=n_rows, offset=offset
+        )
+        offset += n_rows * DTYPES[kind].itemsize
+
+        values = array.tolist()
+        for i in np.flatnonzero(mask).tolist():
+            values[i] = None
+        columns.append(values)
+    return columns
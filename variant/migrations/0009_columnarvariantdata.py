@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+import django.contrib.postgres.fields
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("dataset", "0020_trigram_indexes"),
+        ("variant", "0008_auto_20210213_0000"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ColumnarVariantData",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "variant_ids",
+                    django.contrib.postgres.fields.ArrayField(
+                        base_field=models.IntegerField(),
+                        default=list,
+                        size=None,
+                    ),
+                ),
+                (
+                    "score_columns",
+                    django.contrib.postgres.fields.ArrayField(
+                        base_field=models.TextField(),
+                        default=list,
+                        size=None,
+                    ),
+                ),
+                (
+                    "count_columns",
+                    django.contrib.postgres.fields.ArrayField(
+                        base_field=models.TextField(),
+                        default=list,
+                        size=None,
+                    ),
+                ),
+                ("scores", models.BinaryField(default=b"")),
+                ("counts", models.BinaryField(default=b"")),
+                ("modification_date", models.DateField(auto_now=True)),
+                (
+                    "scoreset",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="columnar_data",
+                        to="dataset.ScoreSet",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Columnar variant data",
+                "verbose_name_plural": "Columnar variant data",
+            },
+        ),
+    ]
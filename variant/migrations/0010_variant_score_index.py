@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("variant", "0009_columnarvariantdata"),
+    ]
+
+    operations = [
+        # Partial index, so that rows with a null or non-numeric score are
+        # neither cast nor indexed. See `variant.models.numeric_scores`.
+        migrations.RunSQL(
+            sql=(
+                'CREATE INDEX "variant_variant_scoreset_score" '
+                'ON "variant_variant" ('
+                '"scoreset_id", '
+                "(((data -> 'score_data') ->> 'score')::double precision), "
+                '"id") '
+                "WHERE jsonb_typeof((data -> 'score_data') -> 'score') "
+                "= 'number'"
+            ),
+            reverse_sql=(
+                'DROP INDEX IF EXISTS "variant_variant_scoreset_score"'
+            ),
+        ),
+    ]
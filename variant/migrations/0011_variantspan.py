@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("dataset", "0020_trigram_indexes"),
+        ("variant", "0010_variant_score_index"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="VariantSpan",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "hgvs_column",
+                    models.CharField(
+                        choices=[
+                            ("hgvs_nt", "hgvs_nt"),
+                            ("hgvs_pro", "hgvs_pro"),
+                            ("hgvs_splice", "hgvs_splice"),
+                        ],
+                        max_length=16,
+                    ),
+                ),
+                ("start", models.IntegerField()),
+                ("end", models.IntegerField()),
+                (
+                    "ref",
+                    models.CharField(default=None, max_length=3, null=True),
+                ),
+                ("alt", models.TextField(default=None, null=True)),
+                ("variant_type", models.CharField(max_length=8)),
+                (
+                    "scoreset",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="variant_spans",
+                        to="dataset.ScoreSet",
+                    ),
+                ),
+                (
+                    "variant",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.DO_NOTHING,
+                        related_name="spans",
+                        to="variant.Variant",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Variant span",
+                "verbose_name_plural": "Variant spans",
+            },
+        ),
+        migrations.AddIndex(
+            model_name="variantspan",
+            index=models.Index(
+                fields=["scoreset", "hgvs_column", "start", "end"],
+                name="variant_span_region_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,22 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [("variant", "0011_variantspan")]
+
+    operations = [
+        migrations.AlterField(
+            model_name="variantspan",
+            name="variant",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="spans",
+                to="variant.Variant",
+            ),
+        ),
+    ]
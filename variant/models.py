@@ -1,13 +1,21 @@
+import csv
+import datetime
+import io
+import json
 from collections import defaultdict
-from typing import List, Union, Optional
+from itertools import islice
+from typing import Iterable, List, Union, Optional
 
-from django.contrib.postgres.fields import JSONField
-from django.db import models, transaction
+from django.contrib.postgres.fields import ArrayField, JSONField
+from django.db import connection, models, transaction
+from django.db.models.functions import Cast, Coalesce
 
 from dataset import constants as constants
 from urn.models import UrnModel
 from dataset.models import ScoreSet
 from urn.validators import validate_mavedb_urn_variant
+from variant.columnar import NotEncodable, decode_columns, encode_columns
+from variant.positions import hgvs_spans
 from variant.validators import (
     validate_nt_variant,
     validate_pro_variant,
@@ -27,6 +35,72 @@ def default_data_dict():
     )
 
 
+def urn_number_expression():
+    """
+    Returns an expression evaluating to the numeric suffix of a variant urn,
+    or 0 if the urn has no numeric suffix. Use it to order variants in SQL
+    by their position in the upload.
+    """
+    return Coalesce(
+        Cast(
+            models.Func(
+                models.F("urn"),
+                models.Value("#([0-9]+)$"),
+                function="substring",
+            ),
+            models.BigIntegerField(),
+        ),
+        models.Value(0),
+    )
+
+
+# Index on the primary score of numeric-scored variants, created in
+# migration 0010. Queries must use `numeric_scores` to be answered from it.
+SCORE_INDEX = "variant_variant_scoreset_score"
+
+
+def score_expression():
+    """
+    Returns an expression evaluating to the primary score of a variant,
+    ``(data -> 'score_data' ->> 'score')::double precision``, as indexed by
+    `SCORE_INDEX`.
+    """
+    template = "(((%(expressions)s -> '{}') ->> '{}')::double precision)"
+    return models.Func(
+        models.F("data"),
+        template=template.format(
+            constants.variant_score_data, constants.required_score_column
+        ),
+        output_field=models.FloatField(),
+    )
+
+
+def score_type_expression():
+    """Returns an expression evaluating to the JSON type of the score."""
+    template = "jsonb_typeof((%(expressions)s -> '{}') -> '{}')"
+    return models.Func(
+        models.F("data"),
+        template=template.format(
+            constants.variant_score_data, constants.required_score_column
+        ),
+        output_field=models.TextField(),
+    )
+
+
+def numeric_scores(queryset):
+    """
+    Restricts a variant `queryset` to variants whose primary score is a
+    JSON number and annotates the score as `score`. The filter matches the
+    predicate of the partial index `SCORE_INDEX`, so range filters and
+    ordering on `score` within a score set can be answered from the index.
+    """
+    return (
+        queryset.annotate(score_type=score_type_expression())
+        .filter(score_type="number")
+        .annotate(score=score_expression())
+    )
+
+
 @transaction.atomic
 def assign_public_urn(variant):
     """
@@ -80,6 +154,28 @@ def assign_public_urn(variant):
     return variant
 
 
+class VariantQuerySet(models.QuerySet):
+    def overlapping(
+        self,
+        start: int,
+        end: int,
+        column: str = constants.hgvs_pro_column,
+        scoreset: Optional[ScoreSet] = None,
+    ) -> "VariantQuerySet":
+        """
+        Filters variants with an HGVS string in `column` touching any
+        position from `start` to `end` inclusive, using the spans indexed in
+        :class:`VariantSpan`. Pass `scoreset` to restrict the index scan to a
+        single score set.
+        """
+        spans = VariantSpan.objects.filter(
+            hgvs_column=column, start__lte=end, end__gte=start
+        )
+        if scoreset is not None:
+            spans = spans.filter(scoreset_id=scoreset.pk)
+        return self.filter(pk__in=spans.values("variant_id"))
+
+
 class Variant(UrnModel):
     """
     This is the class representing an individual variant belonging to one
@@ -119,6 +215,11 @@ class Variant(UrnModel):
         verbose_name = "Variant"
         verbose_name_plural = "Variants"
 
+    # Number of rows sent to the database per COPY statement in `bulk_copy`.
+    COPY_BATCH_SIZE = 10000
+
+    objects = VariantQuerySet.as_manager()
+
     # ---------------------------------------------------------------------- #
     #                       Required Model fields
     # ---------------------------------------------------------------------- #
@@ -184,9 +285,187 @@ class Variant(UrnModel):
             for urn, kwargs in zip(variant_urns, variant_kwargs_list)
         )
         cls.objects.bulk_create(variants, batch_size=batch_size)
+        ColumnarVariantData.discard(parent)
         parent.save()
         return parent.variants.count()
 
+    @classmethod
+    @transaction.atomic
+    def bulk_copy(
+        cls, parent, variant_kwargs_list: Iterable[dict], batch_size=None
+    ) -> int:
+        """
+        Loads variants into the variant table using PostgreSQL's
+        `COPY FROM STDIN`, bypassing model instantiation and field
+        validators. Records must already be validated, for example by
+        `MaveDataset`, and formatted by `convert_df_to_variant_records`.
+
+        Rows are written to an in-memory CSV buffer which is flushed every
+        `batch_size` rows. Runs in the caller's transaction, so it can be
+        paired with `ScoreSet.delete_variants`. Discards the columnar copy
+        of the variant data of `parent`; see `ColumnarVariantData.build`.
+
+        Parameters
+        ----------
+        parent : `ScoreSet`
+            Score set to associate the variants with.
+        variant_kwargs_list : Iterable[dict]
+            Records with the hgvs columns and the `data` dictionary.
+        batch_size : int, optional
+            Number of rows sent per `COPY` statement. Defaults to
+            `COPY_BATCH_SIZE`.
+
+        Returns
+        -------
+        int
+            The number of variants associated with `parent`.
+        """
+        batch_size = batch_size or cls.COPY_BATCH_SIZE
+        fields = [
+            "urn",
+            constants.hgvs_nt_column,
+            constants.hgvs_splice_column,
+            constants.hgvs_pro_column,
+            "scoreset",
+            "data",
+            "creation_date",
+            "modification_date",
+        ]
+        sql = "COPY {table} ({columns}) FROM STDIN WITH (FORMAT csv)".format(
+            table=connection.ops.quote_name(cls._meta.db_table),
+            columns=", ".join(
+                connection.ops.quote_name(cls._meta.get_field(f).column)
+                for f in fields
+            ),
+        )
+
+        today = datetime.date.today().isoformat()
+        parent_urn = parent.urn
+        child_value = parent.last_child_value
+
+        def flush(buffer):
+            buffer.seek(0)
+            with connection.cursor() as cursor:
+                cursor.cursor.copy_expert(sql, buffer)
+
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        n_buffered = 0
+        for kwargs in variant_kwargs_list:
+            child_value += 1
+            writer.writerow(
+                [
+                    "{}#{}".format(parent_urn, child_value),
+                    kwargs.get(constants.hgvs_nt_column),
+                    kwargs.get(constants.hgvs_splice_column),
+                    kwargs.get(constants.hgvs_pro_column),
+                    parent.pk,
+                    json.dumps(kwargs.get("data", default_data_dict())),
+                    today,
+                    today,
+                ]
+            )
+            n_buffered += 1
+            if n_buffered == batch_size:
+                flush(buffer)
+                buffer = io.StringIO()
+                writer = csv.writer(buffer)
+                n_buffered = 0
+
+        if n_buffered:
+            flush(buffer)
+
+        ColumnarVariantData.discard(parent)
+        parent.last_child_value = child_value
+        parent.save()
+        return parent.variants.count()
+
+    @classmethod
+    @transaction.atomic
+    def bulk_renumber(cls, parent) -> int:
+        """
+        Assigns the urns `<parent urn>#1, ..., <parent urn>#n` to all
+        variants of `parent` with set-based UPDATE statements, preserving
+        the order of the existing numeric urn suffixes. Variants without a
+        numeric suffix are numbered last, in order of creation. Sets
+        `last_child_value` on `parent` to the number of variants.
+
+        Bypasses `Variant.save` and its validators.
+
+        Parameters
+        ----------
+        parent : `ScoreSet`
+            Score set whose variants should be renumbered.
+
+        Returns
+        -------
+        int
+            The number of renumbered variants.
+        """
+        table = connection.ops.quote_name(cls._meta.db_table)
+        with connection.cursor() as cursor:
+            renumbering = parent.children.filter(
+                urn__startswith=f"{parent.urn}#"
+            ).exists()
+            if renumbering:
+                # Unique constraints are checked row by row, so move the
+                # existing urns out of the way while keeping their suffix.
+                cursor.execute(
+                    f"UPDATE {table} "
+                    f"SET urn = 'renumber:' || id || ':' || urn "
+                    f"WHERE scoreset_id = %s",
+                    [parent.pk],
+                )
+            cursor.execute(
+                f"UPDATE {table} AS variant "
+                f"SET urn = %s || '#' || numbered.number "
+                f"FROM ("
+                f"  SELECT id, ROW_NUMBER() OVER ("
+                f"    ORDER BY substring(urn from '#([0-9]+)$')::bigint "
+                f"    NULLS LAST, id"
+                f"  ) AS number "
+                f"  FROM {table} WHERE scoreset_id = %s"
+                f") AS numbered "
+                f"WHERE variant.id = numbered.id",
+                [parent.urn, parent.pk],
+            )
+            n_variants = cursor.rowcount
+
+        parent.last_child_value = n_variants
+        parent.save()
+        return n_variants
+
+    @classmethod
+    def bulk_delete(cls, parent) -> int:
+        """
+        Deletes all variants of `parent` with a single DELETE statement,
+        after deleting their indexed spans and the columnar copy of their
+        data. Variants have no other dependent rows or delete signal
+        receivers, so the per-instance collection done by `Model.delete`,
+        which cascades to the spans, is skipped.
+
+        Parameters
+        ----------
+        parent : `ScoreSet`
+            Score set whose variants should be deleted.
+
+        Returns
+        -------
+        int
+            The number of deleted variants.
+        """
+        ColumnarVariantData.discard(parent)
+        table = connection.ops.quote_name(cls._meta.db_table)
+        spans = connection.ops.quote_name(VariantSpan._meta.db_table)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"DELETE FROM {spans} WHERE scoreset_id = %s", [parent.pk]
+            )
+            cursor.execute(
+                f"DELETE FROM {table} WHERE scoreset_id = %s", [parent.pk]
+            )
+            return cursor.rowcount
+
     @staticmethod
     def bulk_create_urns(n, parent, reset_counter=False) -> List[str]:
         start_value = 0 if reset_counter else parent.last_child_value
@@ -262,3 +541,348 @@ class Variant(UrnModel):
                 result.append(self.data[data_key][column])
 
         return result
+
+
+class ColumnarVariantData(models.Model):
+    """
+    Column-major copy of the score and count data of the variants of a
+    score set, encoded by :mod:`variant.columnar`. Columns follow the order
+    of the score set's `dataset_columns` and rows the order of
+    `variant_ids`.
+
+    Numbers are stored as int64 or float64 with a null bitmap instead of a
+    JSON object per variant, so readers can load the data of a score set
+    without decoding the `data` field of every row. `Variant.data` remains
+    the source of truth: the copy is discarded whenever variants of the
+    score set are written and rebuilt with `build`.
+
+    Attributes
+    ----------
+    scoreset : `ScoreSet`
+        The score set the data belongs to.
+    variant_ids : list[int]
+        Primary keys of the variants, in row order.
+    score_columns : list[str]
+        Names of the columns in `scores`.
+    count_columns : list[str]
+        Names of the columns in `counts`.
+    scores : bytes
+        Encoded score columns.
+    counts : bytes
+        Encoded count columns.
+    """
+
+    class Meta:
+        verbose_name = "Columnar variant data"
+        verbose_name_plural = "Columnar variant data"
+
+    scoreset = models.OneToOneField(
+        to="dataset.ScoreSet",
+        on_delete=models.CASCADE,
+        related_name="columnar_data",
+    )
+    variant_ids = ArrayField(models.IntegerField(), default=list)
+    score_columns = ArrayField(models.TextField(), default=list)
+    count_columns = ArrayField(models.TextField(), default=list)
+    scores = models.BinaryField(default=b"")
+    counts = models.BinaryField(default=b"")
+    modification_date = models.DateField(auto_now=True)
+
+    @classmethod
+    def discard(cls, scoreset):
+        """Deletes the columnar copy of the data of `scoreset`, if any."""
+        if scoreset.pk is not None:
+            cls.objects.filter(scoreset_id=scoreset.pk).delete()
+
+    @classmethod
+    @transaction.atomic
+    def build(
+        cls, scoreset, records: Optional[List[dict]] = None
+    ) -> Optional["ColumnarVariantData"]:
+        """
+        Builds the columnar copy of the variant data of `scoreset`.
+
+        Parameters
+        ----------
+        scoreset : `ScoreSet`
+            Score set to build the copy for.
+        records : list[dict], optional
+            Records the variants were just created from by `bulk_copy`, in
+            the same order. When given, the `data` field of the variants is
+            not read back from the database.
+
+        Returns
+        -------
+        ColumnarVariantData, optional
+            `None` if a column is missing from a variant or contains values
+            that are not numbers, in which case readers keep using
+            `Variant.data`.
+        """
+        variants = scoreset.children.order_by(urn_number_expression(), "id")
+        if records is None:
+            rows = list(variants.values_list("id", "data"))
+        else:
+            ids = list(variants.values_list("id", flat=True))
+            if len(ids) != len(records):
+                raise ValueError(
+                    "Expected {} records, found {} variants.".format(
+                        len(ids), len(records)
+                    )
+                )
+            rows = [
+                (pk, record.get("data", default_data_dict()))
+                for pk, record in zip(ids, records)
+            ]
+
+        score_columns = list(
+            scoreset.dataset_columns.get(constants.score_columns, [])
+        )
+        count_columns = list(
+            scoreset.dataset_columns.get(constants.count_columns, [])
+        )
+        try:
+            scores = encode_columns(
+                cls._columns(rows, constants.variant_score_data, score_columns)
+            )
+            counts = encode_columns(
+                cls._columns(rows, constants.variant_count_data, count_columns)
+            )
+        except (KeyError, NotEncodable):
+            cls.discard(scoreset)
+            return None
+
+        instance, _ = cls.objects.update_or_create(
+            scoreset=scoreset,
+            defaults=dict(
+                variant_ids=[pk for pk, _ in rows],
+                score_columns=score_columns,
+                count_columns=count_columns,
+                scores=scores,
+                counts=counts,
+            ),
+        )
+        return instance
+
+    @classmethod
+    def for_scoreset(cls, scoreset) -> Optional["ColumnarVariantData"]:
+        """
+        Returns the columnar copy of the data of `scoreset` if it exists and
+        its columns match the score set's `dataset_columns`.
+        """
+        instance = cls.objects.filter(scoreset_id=scoreset.pk).first()
+        if instance is None or not instance.is_current(scoreset):
+            return None
+        return instance
+
+    @classmethod
+    def load_variants(cls, scoreset, variants: models.QuerySet):
+        """
+        Evaluates the `variants` of `scoreset`, reading their `data` from the
+        columnar copy when one is available and from the variant rows
+        otherwise.
+
+        Loading the copy decodes every column of the score set, so only use
+        this for reads that visit most of its variants, such as downloads.
+        Small pages are cheaper to read from `Variant.data`.
+
+        Returns
+        -------
+        Iterable[Variant]
+        """
+        instance = cls.for_scoreset(scoreset)
+        if instance is None:
+            return variants.iterator()
+        return instance.attach_data(variants.defer("data").iterator())
+
+    @staticmethod
+    def _columns(rows, data_key, columns) -> List[List]:
+        return [[data[data_key][c] for _, data in rows] for c in columns]
+
+    def is_current(self, scoreset) -> bool:
+        return list(self.score_columns) == list(
+            scoreset.dataset_columns.get(constants.score_columns, [])
+        ) and list(self.count_columns) == list(
+            scoreset.dataset_columns.get(constants.count_columns, [])
+        )
+
+    @property
+    def n_rows(self) -> int:
+        return len(self.variant_ids)
+
+    def score_values(self) -> List[List[Optional[Union[int, float]]]]:
+        """Returns the decoded score columns."""
+        if not hasattr(self, "_score_values"):
+            self._score_values = decode_columns(
+                self.scores, len(self.score_columns), self.n_rows
+            )
+        return self._score_values
+
+    def count_values(self) -> List[List[Optional[Union[int, float]]]]:
+        """Returns the decoded count columns."""
+        if not hasattr(self, "_count_values"):
+            self._count_values = decode_columns(
+                self.counts, len(self.count_columns), self.n_rows
+            )
+        return self._count_values
+
+    def row_index(self) -> dict:
+        """Maps each variant primary key to its row."""
+        if not hasattr(self, "_row_index"):
+            self._row_index = {pk: i for i, pk in enumerate(self.variant_ids)}
+        return self._row_index
+
+    def data_at(self, row: int) -> dict:
+        """Returns the `Variant.data` dictionary of `row`."""
+        return {
+            constants.variant_score_data: {
+                column: values[row]
+                for column, values in zip(
+                    self.score_columns, self.score_values()
+                )
+            },
+            constants.variant_count_data: {
+                column: values[row]
+                for column, values in zip(
+                    self.count_columns, self.count_values()
+                )
+            },
+        }
+
+    def attach_data(self, variants: Iterable[Variant]):
+        """
+        Sets the `data` of each variant from the columnar copy. Variants
+        missing from the copy load their `data` field when it is accessed.
+        """
+        index = self.row_index()
+        for variant in variants:
+            row = index.get(variant.pk)
+            if row is not None:
+                variant.data = self.data_at(row)
+            yield variant
+
+
+class VariantSpan(models.Model):
+    """
+    Positions touched by one component of an HGVS string of a variant,
+    parsed at ingest time so region queries can use a B-tree index instead
+    of matching HGVS strings. Multi-variants have one span per component.
+    Variants without a position (``p.=``) and components using intronic or
+    UTR positions are not indexed.
+
+    Spans are written by `build`, which `create_variants` calls once the
+    variants of a score set are created, and deleted with the variants.
+
+    Attributes
+    ----------
+    variant : `Variant`
+        The variant the span belongs to.
+    scoreset : `ScoreSet`
+        The score set of `variant`, copied to lead the region index.
+    hgvs_column : str
+        The HGVS field of `variant` the span was parsed from.
+    start : int
+        First position touched.
+    end : int
+        Last position touched, equal to `start` for single positions.
+    ref : str, optional
+        Reference base or amino acid at `start`, if the string states it.
+    alt : str, optional
+        Substituted or inserted residues.
+    variant_type : str
+        The `mavehgvs` variant type, such as ``sub`` or ``delins``.
+    """
+
+    class Meta:
+        verbose_name = "Variant span"
+        verbose_name_plural = "Variant spans"
+        indexes = [
+            models.Index(
+                fields=["scoreset", "hgvs_column", "start", "end"],
+                name="variant_span_region_idx",
+            )
+        ]
+
+    # Number of spans inserted per statement by `build`.
+    BATCH_SIZE = 10000
+
+    # Score sets delete their variants with `Variant.bulk_delete`, which
+    # deletes the spans first instead of collecting them per variant.
+    variant = models.ForeignKey(
+        to=Variant, on_delete=models.CASCADE, related_name="spans"
+    )
+    scoreset = models.ForeignKey(
+        to="dataset.ScoreSet",
+        on_delete=models.CASCADE,
+        related_name="variant_spans",
+    )
+    hgvs_column = models.CharField(
+        max_length=16, choices=[(c, c) for c in constants.hgvs_columns]
+    )
+    start = models.IntegerField()
+    end = models.IntegerField()
+    ref = models.CharField(max_length=3, null=True, default=None)
+    alt = models.TextField(null=True, default=None)
+    variant_type = models.CharField(max_length=8)
+
+    @classmethod
+    def discard(cls, scoreset):
+        """Deletes the spans of the variants of `scoreset`."""
+        if scoreset.pk is not None:
+            cls.objects.filter(scoreset_id=scoreset.pk).delete()
+
+    @classmethod
+    @transaction.atomic
+    def build(cls, scoreset, records: Optional[List[dict]] = None) -> int:
+        """
+        Replaces the spans of the variants of `scoreset`.
+
+        Parameters
+        ----------
+        scoreset : `ScoreSet`
+            Score set to index.
+        records : list[dict], optional
+            Records the variants were just created from by `bulk_copy`, in
+            the same order. When given, the HGVS strings of the variants
+            are not read back from the database.
+
+        Returns
+        -------
+        int
+            The number of spans created.
+        """
+        columns = constants.hgvs_columns
+        variants = scoreset.children.order_by(urn_number_expression(), "id")
+        if records is None:
+            rows = variants.values_list("id", *columns).iterator()
+        else:
+            ids = list(variants.values_list("id", flat=True))
+            if len(ids) != len(records):
+                raise ValueError(
+                    "Expected {} records, found {} variants.".format(
+                        len(ids), len(records)
+                    )
+                )
+            rows = (
+                (pk, *(record.get(c) for c in columns))
+                for pk, record in zip(ids, records)
+            )
+
+        cls.discard(scoreset)
+        spans = (
+            cls(
+                variant_id=pk,
+                scoreset_id=scoreset.pk,
+                hgvs_column=column,
+                **span._asdict(),
+            )
+            for pk, *values in rows
+            for column, value in zip(columns, values)
+            for span in hgvs_spans(value)
+        )
+        n_spans = 0
+        while True:
+            batch = list(islice(spans, cls.BATCH_SIZE))
+            if not batch:
+                return n_spans
+            cls.objects.bulk_create(batch)
+            n_spans += len(batch)
@@ -0,0 +1,71 @@
+"""
+Positions touched by HGVS strings, as stored in the region index of
+:class:`variant.models.VariantSpan`.
+"""
+from functools import lru_cache
+from typing import NamedTuple, Optional, Tuple
+
+from mavehgvs import Variant, MaveHgvsParseError
+
+from variant.validators.hgvs import HGVS_PARSE_CACHE_SIZE
+
+
+class Span(NamedTuple):
+    start: int
+    end: int
+    ref: Optional[str]
+    alt: Optional[str]
+    variant_type: str
+
+
+def component_span(variant_type, positions, sequence) -> Optional[Span]:
+    """
+    Returns the span of a single (component of a) parsed variant, or `None`
+    if it has no position or uses intronic or UTR positions.
+    """
+    if positions is None:
+        return None
+    if not isinstance(positions, tuple):
+        positions = (positions, positions)
+    start, end = positions
+    if start.is_extended() or end.is_extended():
+        return None
+
+    ref, alt = start.amino_acid, None
+    if isinstance(sequence, tuple):
+        ref, alt = sequence
+    elif sequence is not None:
+        alt = sequence
+    return Span(
+        start=start.position,
+        end=end.position,
+        ref=ref,
+        alt=alt,
+        variant_type=variant_type,
+    )
+
+
+@lru_cache(maxsize=HGVS_PARSE_CACHE_SIZE)
+def hgvs_spans(value: Optional[str]) -> Tuple[Span, ...]:
+    """
+    Parses `value` with `mavehgvs` and returns the span of each component
+    variant. Returns an empty tuple for null or unparsable values and for
+    variants without indexable positions, such as `p.=`.
+    """
+    if not value or not isinstance(value, str):
+        return ()
+    try:
+        variant = Variant(value)
+    except MaveHgvsParseError:
+        return ()
+
+    if variant.is_multi_variant():
+        components = zip(
+            variant.variant_type, variant.positions, variant.sequence
+        )
+    else:
+        components = [
+            (variant.variant_type, variant.positions, variant.sequence)
+        ]
+    spans = (component_span(*component) for component in components)
+    return tuple(span for span in spans if span is not None)
@@ -0,0 +1,46 @@
+from django.test import TestCase
+
+from .. import columnar
+
+
+class TestEncodeColumns(TestCase):
+    def test_round_trips_numbers_and_nulls(self):
+        columns = [
+            [1.5, None, -2.0, 3.25e10],
+            [1, None, 5, 2 ** 62],
+            [None, None, None, None],
+        ]
+        block = columnar.encode_columns(columns)
+        self.assertListEqual(
+            columnar.decode_columns(block, n_columns=3, n_rows=4), columns
+        )
+
+    def test_integer_columns_decode_as_int(self):
+        block = columnar.encode_columns([[1, 2, None]])
+        values = columnar.decode_columns(block, n_columns=1, n_rows=3)[0]
+        self.assertIsInstance(values[0], int)
+
+    def test_mixed_columns_decode_as_float(self):
+        block = columnar.encode_columns([[1, 2.5]])
+        values = columnar.decode_columns(block, n_columns=1, n_rows=2)[0]
+        self.assertListEqual(values, [1.0, 2.5])
+        self.assertIsInstance(values[0], float)
+
+    def test_large_integers_are_stored_as_float(self):
+        self.assertEqual(columnar.column_kind([2 ** 63]), columnar.FLOAT64)
+        self.assertEqual(columnar.column_kind([2 ** 63 - 1]), columnar.INT64)
+
+    def test_encodes_empty_columns(self):
+        block = columnar.encode_columns([[], []])
+        self.assertListEqual(
+            columnar.decode_columns(block, n_columns=2, n_rows=0), [[], []]
+        )
+
+    def test_values_that_are_not_numbers_are_not_encodable(self):
+        for value in ("1.0", True):
+            with self.assertRaises(columnar.NotEncodable):
+                columnar.encode_columns([[1, value]])
+
+    def test_stores_eight_bytes_per_value(self):
+        block = columnar.encode_columns([[1.0] * 16])
+        self.assertEqual(len(block), 1 + 2 + 16 * 8)
@@ -49,3 +49,32 @@ class TestValidateHgvsString(TestCase):
         hgvs.validate_hgvs_string("g.1A>G", column="nt", splice_present=True)
         hgvs.validate_hgvs_string("c.1A>G", column="splice")
         hgvs.validate_hgvs_string("p.(=)", column="p")
+
+
+class TestParseHgvsString(TestCase):
+    def setUp(self):
+        hgvs.parse_hgvs_string.cache_clear()
+
+    def test_returns_normalized_variant_and_prefix(self):
+        self.assertEqual(
+            hgvs.parse_hgvs_string("c.1A>G"), ("c.1A>G", "c", None)
+        )
+
+    def test_returns_error_for_invalid_variant(self):
+        validated, prefix, error = hgvs.parse_hgvs_string("c.ad")
+        self.assertIsNone(validated)
+        self.assertIsNone(prefix)
+        self.assertIn("c.ad", error)
+
+    def test_memoizes_repeated_variants(self):
+        for _ in range(3):
+            hgvs.parse_hgvs_string("p.(=)")
+        info = hgvs.parse_hgvs_string.cache_info()
+        self.assertEqual(info.misses, 1)
+        self.assertEqual(info.hits, 2)
+
+    def test_cache_keyed_by_targetseq(self):
+        hgvs.parse_hgvs_string("c.1A>G", targetseq="ATC")
+        _, _, error = hgvs.parse_hgvs_string("c.1A>G", targetseq="GTC")
+        self.assertIsNotNone(error)
+        self.assertEqual(hgvs.parse_hgvs_string.cache_info().misses, 2)
@@ -7,7 +7,13 @@ from dataset.factories import ScoreSetFactory
 from dataset.utilities import publish_dataset
 from urn.validators import MAVEDB_VARIANT_URN_RE
 from ..factories import VariantFactory
-from ..models import assign_public_urn, Variant
+from ..models import (
+    assign_public_urn,
+    ColumnarVariantData,
+    numeric_scores,
+    Variant,
+    VariantSpan,
+)
 
 
 class TestVariant(TestCase):
@@ -187,6 +193,72 @@ class TestVariant(TestCase):
         )
         self.assertDictEqual(variants[1].data, variant_kwargs_list[1]["data"])
 
+    def test_bulk_copy_creates_variants_with_kwargs(self):
+        parent = ScoreSetFactory(
+            dataset_columns={
+                constants.score_columns: [constants.required_score_column],
+                constants.count_columns: ["count"],
+            }
+        )
+        parent.last_child_value = 10
+        column = constants.required_score_column
+        variant_kwargs_list = [
+            {
+                constants.hgvs_nt_column: "g.{}A>G".format(i),
+                constants.hgvs_pro_column: None,
+                constants.hgvs_splice_column: "c.{}A>G".format(i),
+                "data": dict(
+                    {
+                        constants.variant_score_data: {column: i / 2},
+                        constants.variant_count_data: {"count": None},
+                    }
+                ),
+            }
+            for i in range(1, 6)
+        ]
+        count = Variant.bulk_copy(parent, variant_kwargs_list, batch_size=2)
+        self.assertEqual(count, 5)
+
+        parent.refresh_from_db()
+        self.assertEqual(parent.last_child_value, 15)
+        variants = parent.variants.order_by("id")
+        for i, variant in enumerate(variants):
+            self.assertEqual(variant.urn, "{}#{}".format(parent.urn, 11 + i))
+            self.assertIsNone(variant.hgvs_pro)
+            self.assertEqual(
+                variant.hgvs_nt,
+                variant_kwargs_list[i][constants.hgvs_nt_column],
+            )
+            self.assertDictEqual(variant.data, variant_kwargs_list[i]["data"])
+
+
+    def test_bulk_renumber_orders_by_numeric_suffix(self):
+        parent = publish_dataset(ScoreSetFactory())
+        v10 = VariantFactory(scoreset=parent, urn=f"{parent.urn}#10")
+        v2 = VariantFactory(scoreset=parent, urn=f"{parent.urn}#2")
+        v1 = VariantFactory(scoreset=parent, urn=f"{parent.urn}#1")
+
+        count = Variant.bulk_renumber(parent)
+        self.assertEqual(count, 3)
+
+        for variant in (v1, v2, v10):
+            variant.refresh_from_db()
+        self.assertEqual(v1.urn, f"{parent.urn}#1")
+        self.assertEqual(v2.urn, f"{parent.urn}#2")
+        self.assertEqual(v10.urn, f"{parent.urn}#3")
+
+        parent.refresh_from_db()
+        self.assertEqual(parent.last_child_value, 3)
+
+    def test_bulk_renumber_numbers_temporary_urns_in_creation_order(self):
+        parent = ScoreSetFactory()
+        variants = [VariantFactory(scoreset=parent) for _ in range(3)]
+        parent = publish_dataset(parent)
+
+        for i, variant in enumerate(variants, start=1):
+            variant.refresh_from_db()
+            self.assertEqual(variant.urn, f"{parent.urn}#{i}")
+
 
 class TestAssignPublicUrn(TestCase):
     def setUp(self):
@@ -230,3 +302,205 @@ class TestAssignPublicUrn(TestCase):
         self.assertEqual(
             assign_public_urn(instance).urn, assign_public_urn(instance).urn
         )
+
+
+class TestColumnarVariantData(TestCase):
+    def setUp(self):
+        self.parent = ScoreSetFactory(
+            dataset_columns={
+                constants.score_columns: [
+                    constants.required_score_column,
+                    "se",
+                ],
+                constants.count_columns: ["count"],
+            }
+        )
+        self.records = [
+            {
+                constants.hgvs_nt_column: "g.{}A>G".format(i),
+                constants.hgvs_pro_column: None,
+                constants.hgvs_splice_column: None,
+                "data": {
+                    constants.variant_score_data: {
+                        constants.required_score_column: i / 4,
+                        "se": None if i % 2 else 0.5,
+                    },
+                    constants.variant_count_data: {"count": i},
+                },
+            }
+            for i in range(1, 6)
+        ]
+        Variant.bulk_copy(self.parent, self.records)
+
+    def load_data(self):
+        variants = ColumnarVariantData.load_variants(
+            self.parent, self.parent.variants.order_by("id")
+        )
+        return [v.data for v in variants]
+
+    def test_build_from_variant_rows(self):
+        instance = ColumnarVariantData.build(self.parent)
+        self.assertEqual(instance.n_rows, 5)
+        self.assertListEqual(
+            self.load_data(), [r["data"] for r in self.records]
+        )
+
+    def test_build_from_records(self):
+        ColumnarVariantData.build(self.parent, self.records)
+        self.assertListEqual(
+            self.load_data(), [r["data"] for r in self.records]
+        )
+
+    def test_loading_data_does_not_read_variant_data(self):
+        ColumnarVariantData.build(self.parent)
+        with self.assertNumQueries(2):
+            variants = list(
+                ColumnarVariantData.load_variants(
+                    self.parent, self.parent.variants.all()
+                )
+            )
+        with self.assertNumQueries(0):
+            self.assertListEqual(
+                variants[0].score_data[3:],
+                [
+                    self.records[0]["data"][constants.variant_score_data][c]
+                    for c in (constants.required_score_column, "se")
+                ],
+            )
+
+    def test_variant_properties_read_attached_data(self):
+        ColumnarVariantData.build(self.parent)
+        variant = next(
+            ColumnarVariantData.load_variants(
+                self.parent, self.parent.variants.order_by("id")
+            )
+        )
+        self.assertListEqual(variant.count_data, ["g.1A>G", None, None, 1])
+
+    def test_writing_variants_discards_the_copy(self):
+        ColumnarVariantData.build(self.parent)
+        Variant.bulk_create(self.parent, [{"data": self.records[0]["data"]}])
+        self.assertIsNone(ColumnarVariantData.for_scoreset(self.parent))
+
+        ColumnarVariantData.build(self.parent)
+        self.parent.delete_variants()
+        self.assertIsNone(ColumnarVariantData.for_scoreset(self.parent))
+
+    def test_copy_with_other_columns_is_not_used(self):
+        ColumnarVariantData.build(self.parent)
+        self.parent.dataset_columns[constants.count_columns] = []
+        self.assertIsNone(ColumnarVariantData.for_scoreset(self.parent))
+
+    def test_non_numeric_data_is_not_stored(self):
+        Variant.objects.filter(pk=self.parent.variants.first().pk).update(
+            data={
+                constants.variant_score_data: {
+                    constants.required_score_column: "high",
+                    "se": None,
+                },
+                constants.variant_count_data: {"count": 1},
+            }
+        )
+        self.assertIsNone(ColumnarVariantData.build(self.parent))
+        self.assertFalse(
+            ColumnarVariantData.objects.filter(scoreset=self.parent).exists()
+        )
+
+
+class TestNumericScores(TestCase):
+    def test_annotates_numeric_scores_only(self):
+        parent = ScoreSetFactory()
+        for score in (1, -0.5, None, "NA"):
+            VariantFactory(
+                scoreset=parent,
+                data={
+                    constants.variant_score_data: {
+                        constants.required_score_column: score
+                    },
+                    constants.variant_count_data: {},
+                },
+            )
+        scores = numeric_scores(parent.variants.all()).order_by("score")
+        self.assertListEqual(
+            list(scores.values_list("score", flat=True)), [-0.5, 1.0]
+        )
+        self.assertEqual(scores.filter(score__gt=0).count(), 1)
+
+
+class TestVariantSpan(TestCase):
+    def setUp(self):
+        self.parent = ScoreSetFactory()
+        self.records = [
+            {
+                constants.hgvs_nt_column: "c.{}A>G".format(i * 3),
+                constants.hgvs_pro_column: hgvs_pro,
+                constants.hgvs_splice_column: None,
+                "data": {
+                    constants.variant_score_data: {
+                        constants.required_score_column: i
+                    },
+                    constants.variant_count_data: {},
+                },
+            }
+            for i, hgvs_pro in enumerate(
+                [
+                    "p.Leu1Pro",
+                    "p.[Gly2Ala;Met5Val]",
+                    "p.Lys3_Leu4del",
+                    "p.=",
+                ],
+                start=1,
+            )
+        ]
+        Variant.bulk_copy(self.parent, self.records)
+        self.variants = list(self.parent.variants.order_by("id"))
+
+    def urns(self, queryset):
+        return sorted(queryset.values_list("urn", flat=True))
+
+    def test_build_from_records_matches_build_from_variants(self):
+        fields = ("variant_id", "hgvs_column", "start", "end", "ref", "alt")
+        self.assertEqual(VariantSpan.build(self.parent, self.records), 8)
+        from_records = set(self.parent.variant_spans.values_list(*fields))
+        self.assertEqual(VariantSpan.build(self.parent), 8)
+        self.assertSetEqual(
+            set(self.parent.variant_spans.values_list(*fields)), from_records
+        )
+
+    def test_overlapping_filters_by_region(self):
+        VariantSpan.build(self.parent)
+        variants = self.parent.variants.all()
+        self.assertListEqual(
+            self.urns(variants.overlapping(4, 5, scoreset=self.parent)),
+            [self.variants[1].urn, self.variants[2].urn],
+        )
+        self.assertListEqual(
+            self.urns(variants.overlapping(1, 2)),
+            [self.variants[0].urn, self.variants[1].urn],
+        )
+        self.assertListEqual(
+            self.urns(
+                variants.overlapping(6, 6, column=constants.hgvs_nt_column)
+            ),
+            [self.variants[1].urn],
+        )
+        self.assertFalse(variants.overlapping(6, 100).exists())
+
+    def test_deleting_variants_deletes_spans(self):
+        VariantSpan.build(self.parent)
+        self.parent.delete_variants()
+        self.assertFalse(VariantSpan.objects.exists())
+
+        Variant.bulk_copy(self.parent, self.records)
+        VariantSpan.build(self.parent)
+        Variant.bulk_delete(self.parent)
+        self.assertFalse(VariantSpan.objects.exists())
+
+    def test_deleting_a_variant_deletes_its_spans(self):
+        VariantSpan.build(self.parent)
+        n_spans = VariantSpan.objects.count()
+        spans = VariantSpan.objects.filter(variant_id=self.variants[1].pk)
+        n_deleted = spans.count()
+        self.variants[1].delete()
+        self.assertEqual(VariantSpan.objects.count(), n_spans - n_deleted)
+        self.assertFalse(spans.exists())
@@ -0,0 +1,35 @@
+from django.test import TestCase
+
+from ..positions import Span, hgvs_spans
+
+
+class TestHgvsSpans(TestCase):
+    def test_substitution_spans_one_position(self):
+        self.assertEqual(
+            hgvs_spans("p.Leu12Pro"), (Span(12, 12, "Leu", "Pro", "sub"),)
+        )
+        self.assertEqual(
+            hgvs_spans("c.12A>G"), (Span(12, 12, "A", "G", "sub"),)
+        )
+
+    def test_ranges_span_start_to_end(self):
+        self.assertEqual(
+            hgvs_spans("c.12_14del"), (Span(12, 14, None, None, "del"),)
+        )
+        self.assertEqual(
+            hgvs_spans("p.Lys2_Leu3insAla"),
+            (Span(2, 3, "Lys", "Ala", "ins"),),
+        )
+
+    def test_multi_variant_has_a_span_per_component(self):
+        spans = hgvs_spans("p.[Leu12Pro;Gly20Ala]")
+        self.assertListEqual(
+            [(span.start, span.end) for span in spans], [(12, 12), (20, 20)]
+        )
+
+    def test_skips_extended_positions(self):
+        self.assertEqual(hgvs_spans("c.12+1A>G"), ())
+
+    def test_no_spans_without_positions(self):
+        for value in (None, "", "p.=", "not hgvs"):
+            self.assertEqual(hgvs_spans(value), (), value)
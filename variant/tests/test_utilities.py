@@ -178,6 +178,40 @@ class TestCreateVariantAttrsUtility(TestCase):
         ]
         self.assertListEqual(variants, expected)
 
+    def test_pairs_duplicate_index_rows_in_order_of_appearance(self):
+        score_df = pd.DataFrame(
+            {
+                constants.hgvs_nt_column: [None] * 3,
+                constants.hgvs_pro_column: ["p.G1L", "p.G2L", "p.G1L"],
+                constants.hgvs_splice_column: [None] * 3,
+                constants.required_score_column: [1.0, 2.0, 3.0],
+            }
+        )
+        count_df = pd.DataFrame(
+            {
+                constants.hgvs_nt_column: [None] * 3,
+                constants.hgvs_pro_column: ["p.G2L", "p.G1L", "p.G1L"],
+                constants.hgvs_splice_column: [None] * 3,
+                "count": [20, 10, 30],
+            }
+        )
+        variants = utilities.convert_df_to_variant_records(
+            score_df, count_df, index=constants.hgvs_pro_column
+        )
+        self.assertListEqual(
+            [
+                (
+                    v[constants.hgvs_pro_column],
+                    v["data"][constants.variant_score_data][
+                        constants.required_score_column
+                    ],
+                    v["data"][constants.variant_count_data]["count"],
+                )
+                for v in variants
+            ],
+            [("p.G1L", 1.0, 10), ("p.G1L", 3.0, 30), ("p.G2L", 2.0, 20)],
+        )
+
     def test_empty_variant_count_data_when_no_counts_detected(self):
         d1, _ = self.fixture_data()
         variants = utilities.convert_df_to_variant_records(d1, None)
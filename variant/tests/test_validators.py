@@ -2,7 +2,7 @@ from io import BytesIO, StringIO
 
 import pandas as pd
 from django.core.exceptions import ValidationError
-from django.test import TestCase
+from django.test import TestCase, mock, override_settings
 from pandas.testing import assert_index_equal, assert_frame_equal
 
 from core.utilities import null_values_list
@@ -338,6 +338,149 @@ class TestMaveDataset(TestCase):
         self.assertEqual(len(dataset.errors), 1)
         print(dataset.errors)
 
+    def test_reports_error_for_each_row_with_repeated_invalid_variant(self):
+        data = "{},{}\np.Val1Phe,1.0\np.Val1Phe,2.0\np.(=),3.0".format(
+            self.HGVS_PRO_COL, "count"
+        )
+
+        dataset = MaveDataset.for_counts(StringIO(data))
+        dataset.validate(targetseq="ATC", allow_index_duplicates=True)
+
+        self.assertFalse(dataset.is_valid)
+        self.assertEqual(dataset.n_errors, 2)
+        for error in dataset.errors:
+            self.assertIn("p.Val1Phe", error)
+
+    def test_broadcasts_validated_variants_back_to_rows(self):
+        data = "{},{},{}\nc.1A>G,p.(=),1.0\nc.2T>G,p.(=),2.0".format(
+            self.HGVS_NT_COL, self.HGVS_PRO_COL, self.SCORE_COL
+        )
+
+        dataset = MaveDataset.for_scores(StringIO(data))
+        dataset.validate()
+
+        self.assertTrue(dataset.is_valid)
+        self.assertListEqual(
+            list(dataset.data()[self.HGVS_PRO_COL]), ["p.(=)", "p.(=)"]
+        )
+        self.assertListEqual(
+            list(dataset.data()[self.HGVS_NT_COL]), ["c.1A>G", "c.2T>G"]
+        )
+
+    def test_process_pool_matches_in_process_validation(self):
+        rows = ["c.1A>G,p.Val1Phe,1.0", "c.2T>G,p.(=),2.0", "c.ad,p.(=),3.0"]
+        data = "{},{},{}\n{}".format(
+            self.HGVS_NT_COL,
+            self.HGVS_PRO_COL,
+            self.SCORE_COL,
+            "\n".join(rows * 4),
+        )
+
+        serial = MaveDataset.for_scores(StringIO(data))
+        serial.validate(targetseq="ATC", allow_index_duplicates=True)
+
+        with override_settings(
+            HGVS_VALIDATION_PROCESSES=2, HGVS_VALIDATION_PARALLEL_THRESHOLD=0
+        ):
+            parallel = MaveDataset.for_scores(StringIO(data))
+            parallel.validate(targetseq="ATC", allow_index_duplicates=True)
+
+        self.assertFalse(parallel.is_valid)
+        self.assertListEqual(parallel.errors, serial.errors)
+
+    def test_parses_numeric_column_with_padded_null_values(self):
+        data = "{},{},{}\n{}".format(
+            self.HGVS_NT_COL,
+            self.SCORE_COL,
+            "count",
+            "c.1A>G,1.0, NA \nc.2A>G,2.0,2\nc.3A>G,3.0, N/a ",
+        )
+
+        dataset = MaveDataset.for_scores(BytesIO(data.encode()))
+        dataset.validate()
+
+        self.assertTrue(dataset.is_valid)
+        self.assertListEqual(
+            list(dataset.data(serializable=True)["count"]), [None, 2.0, None]
+        )
+
+    def test_error_row_of_null_values(self):
+        data = "{},{}\n{},1.0\n NA ,".format(
+            self.HGVS_NT_COL, self.SCORE_COL, generate_hgvs(prefix="c")
+        )
+
+        dataset = MaveDataset.for_scores(StringIO(data))
+        dataset.validate()
+
+        self.assertFalse(dataset.is_valid)
+        self.assertEqual(dataset.n_rows, 2)
+
+    def test_replaces_whitespace_padded_null_values(self):
+        data = "{},{},{}\n{},1.0, N/a \n{},2.0,3".format(
+            self.HGVS_NT_COL,
+            self.SCORE_COL,
+            "count",
+            generate_hgvs(prefix="c"),
+            generate_hgvs(prefix="c"),
+        )
+
+        dataset = MaveDataset.for_scores(StringIO(data))
+        dataset.validate()
+
+        self.assertListEqual(
+            list(dataset.data(serializable=True)["count"]), [None, 3.0]
+        )
+
+    @mock.patch("variant.validators.dataset.READ_CHUNK_SIZE", 2)
+    def test_stages_file_in_chunks(self):
+        data = "{},{},{}\n{}".format(
+            self.HGVS_NT_COL,
+            self.SCORE_COL,
+            "count",
+            "c.1A>G,1.0,1\nc.2A>G,2.0,NA\nc.3A>G,3.0,x",
+        )
+
+        dataset = MaveDataset.for_scores(StringIO(data))
+        dataset.validate()
+
+        self.assertTrue(dataset.is_valid)
+        self.assertEqual(len(dataset.frame.chunks), 2)
+        self.assertEqual(dataset.n_rows, 3)
+        # A column is only numeric if it is numeric in every chunk.
+        self.assertListEqual(
+            list(dataset.data(serializable=True)["count"]), ["1", None, "x"]
+        )
+
+    @mock.patch("variant.validators.dataset.READ_CHUNK_SIZE", 2)
+    def test_invalid_duplicates_in_different_chunks(self):
+        data = "{},{}\n{}".format(
+            self.HGVS_NT_COL,
+            self.SCORE_COL,
+            "c.1A>G,1.0\nc.2A>G,2.0\nc.1A>G,3.0",
+        )
+
+        dataset = MaveDataset.for_scores(StringIO(data))
+        dataset.validate()
+
+        self.assertFalse(dataset.is_valid)
+        self.assertEqual(len(dataset.errors), 1)
+        self.assertIn("c.1A>G: [1, 3]", dataset.errors[0])
+
+    @mock.patch("variant.validators.dataset.READ_CHUNK_SIZE", 1)
+    def test_splice_defined_in_later_chunk_applies_to_every_chunk(self):
+        data = "{},{},{}\n{}".format(
+            self.HGVS_NT_COL,
+            self.HGVS_SPLICE_COL,
+            self.SCORE_COL,
+            "g.1A>G,,1.0\ng.2A>G,c.2A>G,2.0",
+        )
+
+        dataset = MaveDataset.for_scores(StringIO(data))
+        dataset.validate()
+
+        self.assertTrue(dataset.is_valid)
+        self.assertEqual(dataset.index_column, self.HGVS_NT_COL)
+
     def test_data_method_converts_null_values_to_None(self):
         hgvs = generate_hgvs()
         for value in null_values_list:
@@ -2,7 +2,7 @@ import numpy as np
 import pandas as pd
 from pandas.testing import assert_index_equal
 
-from core.utilities import is_null
+from core.utilities import null_mask
 
 
 def convert_df_to_variant_records(scores, counts=None, index=None):
@@ -65,58 +65,67 @@ def convert_df_to_variant_records(scores, counts=None, index=None):
         )
         validate_datasets_define_same_variants(scores, counts)
 
-    variants = []
-    for (primary_hgvs, group) in scores.groupby(by=scores.index, sort=False):
-        score_records = group.to_dict(orient="records")
-        if has_count_data:
-            count_records = counts[counts.index == primary_hgvs].to_dict(
-                orient="records"
-            )
-            assert len(score_records) == len(count_records)
-        else:
-            # Make duplicates to zip with self when no count data.
-            count_records = [r.copy() for r in score_records]
-
-        for (sr, cr) in zip(score_records, count_records):
-            hgvs_nt = sr.pop(hgvs_nt_column)
-            hgvs_splice = sr.pop(hgvs_splice_column)
-            hgvs_pro = sr.pop(hgvs_pro_column)
-
-            if is_null(hgvs_nt) or hgvs_nt is np.NaN or hgvs_nt == "nan":
-                hgvs_nt = None
-            if (
-                is_null(hgvs_splice)
-                or hgvs_splice is np.NaN
-                or hgvs_splice == "nan"
-            ):
-                hgvs_splice = None
-            if is_null(hgvs_pro) or hgvs_pro is np.NaN or hgvs_pro == "nan":
-                hgvs_pro = None
-
-            cr.pop(hgvs_nt_column)
-            cr.pop(hgvs_splice_column)
-            cr.pop(hgvs_pro_column)
-
-            # Postgres JSON field cannot store np.NaN values so convert
-            # any np.NaN to None.
-            for key, value in sr.items():
-                if is_null(value) or value is np.NaN:
-                    sr[key] = None
-            if cr:
-                for key, value in cr.items():
-                    if is_null(value) or value is np.NaN:
-                        cr[key] = None
-
-            data = {
+    # Rows sharing a primary hgvs value are emitted together, in order of
+    # first appearance, as when grouping by the index.
+    codes, _ = pd.factorize(scores.index, sort=False)
+    scores = scores.iloc[np.argsort(codes, kind="stable")]
+
+    if has_count_data:
+        # Pair the n-th score row of each primary hgvs value with the n-th
+        # count row of that value using a single index join.
+        counts = counts.set_axis(_occurrence_index(counts), axis=0)
+        counts = counts.reindex(_occurrence_index(scores))
+
+    hgvs_columns = [hgvs_nt_column, hgvs_splice_column, hgvs_pro_column]
+    hgvs_values = [
+        _column_values(scores[c])
+        if c in scores.columns
+        else [None] * len(scores)
+        for c in hgvs_columns
+    ]
+    score_records = _column_records(scores, exclude=hgvs_columns)
+    if has_count_data:
+        count_records = _column_records(counts, exclude=hgvs_columns)
+    else:
+        count_records = [{} for _ in range(len(scores))]
+
+    return [
+        {
+            hgvs_nt_column: hgvs_nt,
+            hgvs_splice_column: hgvs_splice,
+            hgvs_pro_column: hgvs_pro,
+            "data": {
                 variant_score_data: sr,
-                variant_count_data: {} if cr == sr else cr,
-            }
-            variant = {
-                hgvs_nt_column: hgvs_nt,
-                hgvs_splice_column: hgvs_splice,
-                hgvs_pro_column: hgvs_pro,
-                "data": data,
-            }
-            variants.append(variant)
-
-    return variants
+                variant_count_data: cr,
+            },
+        }
+        for (hgvs_nt, hgvs_splice, hgvs_pro, sr, cr) in zip(
+            *hgvs_values, score_records, count_records
+        )
+    ]
+
+
+def _occurrence_index(df):
+    """
+    Index of `(primary hgvs, n)` tuples, where `n` counts the occurrences of
+    the primary hgvs value among the preceding rows of `df`.
+    """
+    occurrence = df.groupby(level=0, sort=False).cumcount()
+    return pd.MultiIndex.from_arrays([df.index, occurrence.to_numpy()])
+
+
+def _column_values(values):
+    """
+    Returns a list of python objects for a column, with values considered
+    null replaced by None since Postgres JSON fields cannot store `np.NaN`.
+    """
+    mask = null_mask(values).to_numpy()
+    return values.astype(object).where(~mask, None).tolist()
+
+
+def _column_records(df, exclude):
+    columns = [c for c in df.columns if c not in exclude]
+    if not columns:
+        return [{} for _ in range(len(df))]
+    values = [_column_values(df[c]) for c in columns]
+    return [dict(zip(columns, row)) for row in zip(*values)]
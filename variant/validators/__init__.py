@@ -9,6 +9,7 @@ from .hgvs import (
     validate_pro_variant,
     validate_splice_variant,
     validate_hgvs_string,
+    parse_hgvs_string,
 )
 
 from .variant import (
@@ -24,6 +25,7 @@ __all__ = [
     "validate_splice_variant",
     "validate_pro_variant",
     "validate_hgvs_string",
+    "parse_hgvs_string",
     "validate_columns_match",
     "validate_variant_json",
     "MaveCountsDataset",
@@ -1,23 +1,57 @@
 import re
 from collections import defaultdict
-from io import StringIO
-from itertools import groupby
-from operator import itemgetter
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import partial
 from typing import Union, Optional, Tuple, List, TextIO, BinaryIO, Set, Dict
 
 import pandas as pd
 import numpy as np
-from mavehgvs import MaveHgvsParseError, Variant
+from django.conf import settings
 from fqfa.util.translate import translate_dna
 from fqfa.util.infer import infer_sequence_type
 
 import dataset.constants
 from core.utilities import (
+    chunks,
     is_null,
     null_values_list,
-    null_values_re,
     readable_null_values,
 )
+from dataset.staging import StagedFrame
+
+from .hgvs import parse_hgvs_string
+
+# Number of rows parsed, validated and staged at a time.
+READ_CHUNK_SIZE = 50000
+
+# Cell values parsed as null after stripping whitespace and lower-casing.
+# Includes the values pandas treats as null by default since converters
+# bypass `na_values`.
+NULL_TOKENS = frozenset(
+    [v.lower() for v in null_values_list]
+    + [
+        "#n/a",
+        "#n/a n/a",
+        "#na",
+        "-1.#ind",
+        "-1.#qnan",
+        "-nan",
+        "1.#ind",
+        "1.#qnan",
+        "<na>",
+    ]
+)
+
+
+def _parse_text(value: str) -> Union[str, float]:
+    value = value.strip()
+    if value.lower() in NULL_TOKENS:
+        return np.NaN
+    return value
+
+
+def _parse_float(value: str) -> float:
+    return float(_parse_text(value))
 
 
 class MaveDataset:
@@ -57,50 +91,63 @@ class MaveDataset:
         cls, file: Union[str, TextIO, BinaryIO], dataset_type: str
     ) -> Union["MaveScoresDataset", "MaveCountsDataset"]:
 
-        if isinstance(file, str):
-            handle = file
-        elif hasattr(file, "read"):
-            file_contents = file.read()
-            if hasattr(file_contents, "decode"):
-                file_contents = file_contents.decode("utf-8")
-            file_contents = file_contents.strip()
-            handle = StringIO(file_contents)
-        else:
+        if not (isinstance(file, str) or hasattr(file, "read")):
             raise TypeError(
                 f"Expected file path or buffer object. "
                 f"Got '{type(file).__name__}'"
             )
 
-        extra_na_values = set(
-            list(null_values_list)
-            + [str(x).lower() for x in null_values_list]
-            + [str(x).upper() for x in null_values_list]
-            + [str(x).capitalize() for x in null_values_list]
-        )
-
-        df = pd.read_csv(
-            filepath_or_buffer=handle,
-            sep=",",
-            encoding="utf-8",
-            quotechar='"',
-            comment="#",
-            na_values=extra_na_values,
-            keep_default_na=True,
-            dtype={
-                **{c: str for c in cls.HGVSColumns.options()},
-                MaveScoresDataset.AdditionalColumns.SCORES: float,
-            },
-        ).replace(null_values_re, np.NaN)
-
         if dataset_type == cls.DatasetType.SCORES:
-            return MaveScoresDataset(df)
+            dataset_cls = MaveScoresDataset
         elif dataset_type == cls.DatasetType.COUNTS:
-            return MaveCountsDataset(df)
+            dataset_cls = MaveCountsDataset
         else:
             raise ValueError(
                 f"'{dataset_type}' is not a recognised dataset type."
             )
 
+        options = dict(sep=",", encoding="utf-8", quotechar='"', comment="#")
+
+        # Read the header on its own so each column can be given a converter
+        # which strips whitespace and parses null values. Converters bypass
+        # `na_values`, so null tokens are matched by the converter itself.
+        start = None if isinstance(file, str) else file.tell()
+        columns = list(pd.read_csv(file, nrows=0, **options).columns)
+        if start is not None:
+            file.seek(start)
+
+        score_column = MaveScoresDataset.AdditionalColumns.SCORES
+        converters = {
+            i: (_parse_float if column == score_column else _parse_text)
+            for (i, column) in enumerate(columns)
+        }
+
+        # Stage the file a chunk at a time so that neither the raw upload
+        # nor the parsed rows are held in memory at once. Other columns are
+        # kept as text until `validate`, since a column is only numeric if
+        # every chunk parses as numbers.
+        frame = StagedFrame(columns)
+        text_columns = set()
+        for chunk in pd.read_csv(
+            file, converters=converters, chunksize=READ_CHUNK_SIZE, **options
+        ):
+            if chunk.empty:
+                continue
+            for column in columns:
+                if (
+                    column in text_columns
+                    or column in cls.HGVSColumns.options()
+                    or column == score_column
+                ):
+                    continue
+                try:
+                    pd.to_numeric(chunk[column])
+                except (ValueError, TypeError):
+                    text_columns.add(column)
+            frame.append(chunk)
+
+        return dataset_cls(frame, text_columns=text_columns)
+
     # ---------------------- Public ----------------------------------------- #
     @property
     def label(self) -> str:
@@ -124,11 +171,13 @@ class MaveDataset:
 
     @property
     def is_empty(self) -> bool:
-        return self._df.empty
+        return self.n_rows == 0
 
     @property
     def columns(self) -> List[str]:
-        return list(self._df.columns)
+        if self._frame is None:
+            return []
+        return list(self._frame.columns)
 
     @property
     def hgvs_columns(self) -> List[str]:
@@ -140,7 +189,9 @@ class MaveDataset:
 
     @property
     def n_rows(self) -> int:
-        return len(self._df)
+        if self._frame is None:
+            return 0
+        return len(self._frame)
 
     @property
     def n_columns(self) -> int:
@@ -156,22 +207,32 @@ class MaveDataset:
     def index(self) -> Optional[pd.Index]:
         if self._errors:
             return None
-        return self._df.index.copy(deep=True)
+        return self.data().index
+
+    @property
+    def frame(self) -> Optional[StagedFrame]:
+        """
+        The staged rows of the dataset, which are the validated rows once
+        `validate` has been called.
+        """
+        return self._frame
 
     def data(self, serializable=False) -> pd.DataFrame:
         """
-        Return underlying dataframe object.
+        Return the staged rows as a dataframe. The dataframe is indexed by
+        the primary column if the dataset is valid.
 
         Parameters
         ----------
         serializable: bool
             Replaces `np.NaN` with `None` for JSON compatibility.
         """
+        df = pd.DataFrame() if self._frame is None else self._frame.read()
+        if self.is_valid:
+            df.index = pd.Index(df[self.index_column])
         if serializable:
-            return self._df.where(
-                cond=pd.notnull(self._df), other=None, inplace=False
-            )
-        return self._df.copy(deep=True)
+            return df.where(cond=pd.notnull(df), other=None, inplace=False)
+        return df
 
     def match_other(self, other: "MaveDataset") -> Optional[bool]:
         """
@@ -193,9 +254,18 @@ class MaveDataset:
         if self.index_column != other.index_column:
             return False
 
+        if self.n_rows != other.n_rows:
+            return False
+
+        # Both files are staged in chunks of `READ_CHUNK_SIZE` rows, so the
+        # chunks can be compared pairwise.
         return all(
-            self._df[column].equals(other._df[column])
-            for column in self.HGVSColumns.options()
+            len(chunk) == len(other_chunk)
+            and all(
+                chunk[column].equals(other_chunk[column])
+                for column in self.HGVSColumns.options()
+            )
+            for (chunk, other_chunk) in zip(self._frame, other._frame)
         )
 
     def to_dict(self) -> Dict[str, Dict]:
@@ -207,9 +277,7 @@ class MaveDataset:
         # Convert np.NaN values to None for consistency across all columns and
         # for compatibility in PostgresSQL queries. Replaces all values which
         # are considered null by pandas with None by masking pd.notnull cells.
-        return self._df.where(
-            cond=pd.notnull(self._df), other=None, inplace=False
-        ).to_dict(orient="index")
+        return self.data(serializable=True).to_dict(orient="index")
 
     def validate(
         self,
@@ -219,20 +287,15 @@ class MaveDataset:
     ) -> "MaveDataset":
 
         self._errors = []
-        self._df.index = pd.RangeIndex(start=0, stop=self.n_rows, step=1)
         self._index_column = None
 
         self._validate_columns()
         # Only attempt to validate variants if columns are valid
         if not self._errors:
-            (
-                self._normalize_data()
-                ._validate_genomic_variants(targetseq, relaxed_ordering)
-                ._validate_transcript_variants(targetseq, relaxed_ordering)
-                ._validate_protein_variants(targetseq, relaxed_ordering)
-                ._validate_index_column(
-                    allow_duplicates=allow_index_duplicates
-                )
+            self._validate_chunks(
+                targetseq=targetseq,
+                relaxed_ordering=relaxed_ordering,
+                allow_index_duplicates=allow_index_duplicates,
             )
 
         if self.is_empty:
@@ -240,26 +303,22 @@ class MaveDataset:
                 f"No variants could be parsed from your {self.label} file. "
                 f"Please upload a non-empty file."
             )
-            return self
-
-        if not self._errors:
-            # Set index last as original index is used when indicating duplicate
-            # hgvs string row numbers in the column name used as the index (
-            # either hgvs_nt when present or hgvs_pro when hgvs_nt is absent).
-            self._df.index = pd.Index(self._df[self.index_column])
 
         return self
 
     # ---------------------- Private ---------------------------------------- #
     def __init__(
         self,
-        df: Optional[pd.DataFrame] = None,
+        frame: Optional[StagedFrame] = None,
         index_column: Optional[str] = None,
         errors: Optional[List[str]] = None,
+        text_columns: Optional[Set[str]] = None,
     ):
-        self._df: pd.DataFrame = pd.DataFrame() if df is None else df
+        self._frame = frame
         self._index_column = index_column or None
         self._errors = None if errors is None else list(errors)
+        # Non-HGVS columns holding values which are not numbers.
+        self._text_columns = set(text_columns or [])
 
     def __repr__(self):
         return (
@@ -332,235 +391,321 @@ class MaveDataset:
 
         return self
 
-    def _normalize_data(self) -> "MaveDataset":
-        if self._errors:
-            return self
-
-        # Initialize missing hgvs columns as empty.
-        for c in self.HGVSColumns.options():
-            if c not in self.columns:
-                self._df[c] = np.NaN
-
-        column_order = self._column_order
-        sorted_columns = list(
-            sorted(self.columns, key=lambda x: column_order[x])
-        )
-
-        self._df = self._df[sorted_columns]
-        return self
-
-    def _validate_genomic_variants(
-        self, targetseq: Optional[str] = None, relaxed_ordering: bool = False
+    def _normalize_chunk(
+        self, chunk: pd.DataFrame, columns: List[str]
+    ) -> pd.DataFrame:
+        # Initialize missing hgvs columns as empty and sort the columns.
+        chunk = chunk.reindex(columns=columns)
+        for c in self.non_hgvs_columns:
+            if c not in self._text_columns:
+                chunk[c] = pd.to_numeric(chunk[c])
+        return chunk
+
+    def _validate_chunks(
+        self,
+        targetseq: Optional[str] = None,
+        relaxed_ordering: bool = False,
+        allow_index_duplicates: bool = False,
     ) -> "MaveDataset":
-        if self._column_is_null(self.HGVSColumns.NUCLEOTIDE):
-            return self
-
-        defines_transcript_variants = not self._column_is_null(
-            self.HGVSColumns.TRANSCRIPT
-        )
-        validated_variants, prefixes, errors = self._validate_variants(
-            column=self.HGVSColumns.NUCLEOTIDE,
-            splice_defined=defines_transcript_variants,
-            targetseq=targetseq,
-            relaxed_ordering=relaxed_ordering,
-        )
-
-        if ("c" in prefixes or "n" in prefixes) and "g" in prefixes:
-            self._errors.append(
-                f"{self.HGVSColumns.NUCLEOTIDE}: Genomic variants "
-                f"(prefix 'g.') cannot be mixed with transcript variants "
-                f"(prefix 'c.' or 'n.')"
+        """
+        Validates the staged rows one chunk at a time, staging the validated
+        chunks in place of the parsed rows. Which HGVS columns are defined
+        is decided up front from the null counts recorded while staging, so
+        that every chunk is validated the same way. Prefixes, errors and the
+        rows of each primary column variant are carried across chunks.
+        """
+        nt = self.HGVSColumns.NUCLEOTIDE
+        tx = self.HGVSColumns.TRANSCRIPT
+        pro = self.HGVSColumns.PROTEIN
+        defines_nt = not self._column_is_null(nt)
+        defines_tx = not self._column_is_null(tx)
+        defines_pro = not self._column_is_null(pro)
+
+        remainder = None
+        variant_columns = {}
+        if defines_nt:
+            variant_columns[nt] = dict(
+                splice_defined=defines_tx, targetseq=targetseq
             )
+        if defines_tx:
+            # Don't validate transcript variants against sequence. Might come
+            # back to this later with research into implementing gene models.
+            variant_columns[tx] = dict(targetseq=None)
+        if defines_pro:
+            protein_seq = None
+            if not defines_tx:
+                protein_seq = targetseq
+                if (
+                    targetseq
+                    and "dna" in infer_sequence_type(targetseq).lower()
+                ):
+                    protein_seq, remainder = translate_dna(targetseq)
+            variant_columns[pro] = dict(targetseq=protein_seq)
+
+        # The primary column is hgvs_nt unless only hgvs_pro is defined.
+        index_column = pro if (defines_pro and not defines_nt) else nt
 
-        if prefixes == {"g"} and not defines_transcript_variants:
-            self._errors.append(
-                f"Transcript variants ('{self.HGVSColumns.TRANSCRIPT}' column) "
-                f"are required when specifying genomic variants "
-                f"(prefix 'g.' in the 'hgvs_nt' column)"
+        column_order = self._column_order
+        columns = sorted(
+            set(self.columns) | set(self.HGVSColumns.options()),
+            key=lambda x: column_order[x],
+        )
+        prefixes = {column: set() for column in variant_columns}
+        errors = {column: [] for column in variant_columns}
+        # Row number of the first occurrence of each primary column variant
+        # and the row numbers of those occurring more than once.
+        first_rows = {}
+        duplicates = {}
+        validated = StagedFrame(columns)
+        executor = None
+        if (
+            settings.HGVS_VALIDATION_PROCESSES > 1
+            and self.n_rows >= settings.HGVS_VALIDATION_PARALLEL_THRESHOLD
+        ):
+            executor = ProcessPoolExecutor(
+                max_workers=settings.HGVS_VALIDATION_PROCESSES
             )
 
-        self._errors += errors
-
-        if not self._errors:
-            self._df[self.HGVSColumns.NUCLEOTIDE] = validated_variants
-
-        self._index_column = self.HGVSColumns.NUCLEOTIDE
-        return self
-
-    def _validate_transcript_variants(
-        self, targetseq: Optional[str] = None, relaxed_ordering: bool = False
-    ) -> "MaveDataset":
-        defines_nt = not self._column_is_null(self.HGVSColumns.NUCLEOTIDE)
-        defines_tx = not self._column_is_null(self.HGVSColumns.TRANSCRIPT)
-
-        if defines_tx and (not defines_nt):
+        try:
+            offset = 0
+            for chunk in self._frame:
+                chunk = self._normalize_chunk(chunk, columns)
+                for (column, kwargs) in variant_columns.items():
+                    (
+                        chunk[column],
+                        chunk_prefixes,
+                        chunk_errors,
+                    ) = self._validate_variants(
+                        chunk[column],
+                        column=column,
+                        relaxed_ordering=relaxed_ordering,
+                        executor=executor,
+                        **kwargs,
+                    )
+                    prefixes[column] |= chunk_prefixes
+                    errors[column] += chunk_errors
+
+                if not allow_index_duplicates:
+                    for (i, variant) in chunk[index_column].dropna().items():
+                        row = offset + i + 1
+                        first_row = first_rows.setdefault(variant, row)
+                        if first_row != row:
+                            duplicates.setdefault(variant, [first_row])
+                            duplicates[variant].append(row)
+
+                validated.append(chunk)
+                offset += len(chunk)
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        if remainder:
             self._errors.append(
-                f"Genomic variants ('{self.HGVSColumns.NUCLEOTIDE}' column) "
-                f"must be defined when specifying transcript "
-                f"variants ('{self.HGVSColumns.TRANSCRIPT}' column)"
+                "Protein variants could not be validated because the "
+                "length of your target sequence is not a multiple of 3"
             )
 
-        if not defines_tx:
-            return self
-
-        # Don't validate transcript variants against sequence. Might come
-        # back to this later with research into implementing gene models.
-        validated_variants, _, errors = self._validate_variants(
-            column=self.HGVSColumns.TRANSCRIPT,
-            targetseq=None,
-            relaxed_ordering=relaxed_ordering,
-        )
-
-        self._errors += errors
-
-        if not self._errors:
-            self._df[self.HGVSColumns.TRANSCRIPT] = validated_variants
-
-        return self
-
-    def _validate_protein_variants(
-        self, targetseq: Optional[str] = None, relaxed_ordering: bool = False
-    ) -> "MaveDataset":
-        if self._column_is_null(self.HGVSColumns.PROTEIN):
-            return self
-
-        defines_nt = not self._column_is_null(self.HGVSColumns.NUCLEOTIDE)
-        defines_splice = not self._column_is_null(self.HGVSColumns.TRANSCRIPT)
-
-        if defines_splice:
-            protein_seq = None
-        else:
-            protein_seq = targetseq
-            if targetseq and "dna" in infer_sequence_type(targetseq).lower():
-                protein_seq, remainder = translate_dna(targetseq)
-                if remainder:
-                    self._errors.insert(
-                        0,
-                        "Protein variants could not be validated because the "
-                        "length of your target sequence is not a multiple of 3",
-                    )
-
-        validated_variants, _, errors = self._validate_variants(
-            column=self.HGVSColumns.PROTEIN,
-            targetseq=protein_seq,
-            relaxed_ordering=relaxed_ordering,
-        )
-
-        self._errors += errors
-
-        if not self._errors:
-            self._df[self.HGVSColumns.PROTEIN] = validated_variants
+        if defines_nt:
+            if ("c" in prefixes[nt] or "n" in prefixes[nt]) and (
+                "g" in prefixes[nt]
+            ):
+                self._errors.append(
+                    f"{nt}: Genomic variants "
+                    f"(prefix 'g.') cannot be mixed with transcript variants "
+                    f"(prefix 'c.' or 'n.')"
+                )
+            if prefixes[nt] == {"g"} and not defines_tx:
+                self._errors.append(
+                    f"Transcript variants ('{tx}' column) "
+                    f"are required when specifying genomic variants "
+                    f"(prefix 'g.' in the 'hgvs_nt' column)"
+                )
+            self._errors += errors[nt]
 
-        if not defines_nt:
-            self._index_column = self.HGVSColumns.PROTEIN
+        if defines_tx:
+            if not defines_nt:
+                self._errors.append(
+                    f"Genomic variants ('{nt}' column) "
+                    f"must be defined when specifying transcript "
+                    f"variants ('{tx}' column)"
+                )
+            self._errors += errors[tx]
 
-        return self
+        if defines_pro:
+            self._errors += errors[pro]
 
-    def _validate_index_column(
-        self, allow_duplicates: bool = False
-    ) -> "MaveDataset":
+        self._index_column = index_column
         if self._errors:
+            validated.discard()
             return self
 
-        if self._index_column is None:
-            self._index_column = self.HGVSColumns.NUCLEOTIDE
+        self._frame.discard()
+        self._frame = validated
 
-        if self._column_is_partially_null(self._index_column):
+        if self._column_is_partially_null(index_column):
             self._errors.append(
-                f"Primary column (inferred as '{self._index_column}') "
+                f"Primary column (inferred as '{index_column}') "
                 f"cannot contain any null values from "
                 f"{', '.join(readable_null_values)} (case-insensitive)"
             )
 
-        if not allow_duplicates:
-            dupes = self._df[self._index_column].duplicated(keep=False)
-            if np.any(dupes):
-                dup_list = zip(
-                    self._df.loc[dupes, self._index_column],
-                    dupes.index[dupes],
-                )
-                dupes_str = ", ".join(
-                    f"{v}: {[(g[1] + 1) for g in groups]}"  # get row numbers
-                    for (v, groups) in groupby(dup_list, key=itemgetter(0))
-                )
-                self._errors.append(
-                    f"Primary column (inferred as '{self._index_column}') "
-                    f"contains duplicate HGVS variants: {dupes_str}"
-                )
+        if duplicates:
+            dupes_str = ", ".join(
+                f"{v}: {variant_rows}"
+                for (v, variant_rows) in duplicates.items()
+            )
+            self._errors.append(
+                f"Primary column (inferred as '{index_column}') "
+                f"contains duplicate HGVS variants: {dupes_str}"
+            )
 
         return self
 
     def _validate_variants(
         self,
+        values: pd.Series,
         column: str,
         splice_defined: Optional[bool] = None,
         targetseq: Optional[str] = None,
         relaxed_ordering: bool = False,
+        executor: Optional[Executor] = None,
     ) -> Tuple[pd.Series, Set[str], List[str]]:
+        # Deduplicate the column so each distinct variant is only validated
+        # once, then broadcast the validated values and errors back to rows.
+        codes, distinct = pd.factorize(values, sort=False)
+
+        if executor is None or len(distinct) <= 1:
+            outcomes = [
+                self._validate_variant(
+                    variant=variant,
+                    column=column,
+                    splice_defined=splice_defined,
+                    targetseq=targetseq,
+                    relaxed_ordering=relaxed_ordering,
+                )
+                for variant in distinct
+            ]
+        else:
+            # Split distinct variants into a few chunks per worker so slow
+            # chunks don't stall the pool. `map` preserves chunk order, so
+            # merged outcomes line up with `distinct` as they do in-process.
+            distinct = list(distinct)
+            n_chunks = settings.HGVS_VALIDATION_PROCESSES * 4
+            chunk_size = max(1, -(-len(distinct) // n_chunks))
+            # The validation parameters travel with each chunk since pool
+            # initializers need Python 3.7.
+            validate_chunk = partial(
+                _validate_variant_chunk,
+                type(self),
+                dict(
+                    column=column,
+                    splice_defined=splice_defined,
+                    targetseq=targetseq,
+                    relaxed_ordering=relaxed_ordering,
+                ),
+            )
+            outcomes = [
+                outcome
+                for chunk_outcomes in executor.map(
+                    validate_chunk, chunks(distinct, chunk_size)
+                )
+                for outcome in chunk_outcomes
+            ]
 
-        prefixes = set()
-        errors = []
-
-        def validate_variant(variant: str):
-            # TODO: logic mirrors that in validate_hgvs_string, which is kept
-            #   as a standalone function for backwards compatibility with
-            #   django's model validator field. Merge at some point.
+        return self._broadcast_outcomes(values, codes, outcomes)
 
-            if is_null(variant):
-                return np.NaN
-            else:
-                try:
-                    if variant.lower() == "_sy":
-                        errors.append(
-                            "'_sy' is no longer supported and should be "
-                            "replaced by 'p.(=)'"
-                        )
-                        return variant
-                    elif variant.lower() == "_wt":
-                        errors.append(
-                            "'_wt' is no longer supported and should be "
-                            "replaced by one of 'g.=', 'c.=' or 'n.='"
-                        )
-                        return variant
-
-                    validated = Variant(
-                        variant,
-                        targetseq=targetseq,
-                        relaxed_ordering=relaxed_ordering,
-                    )
-                    prefix = validated.prefix.lower()
-                    prefixes.add(prefix)
+    def _validate_variant(
+        self,
+        variant: str,
+        column: str,
+        splice_defined: Optional[bool] = None,
+        targetseq: Optional[str] = None,
+        relaxed_ordering: bool = False,
+    ) -> Tuple[Union[str, float], Optional[str], List[str]]:
+        # TODO: logic mirrors that in validate_hgvs_string, which is kept
+        #   as a standalone function for backwards compatibility with
+        #   django's model validator field. Merge at some point.
+        if is_null(variant):
+            return np.NaN, None, []
+
+        if variant.lower() == "_sy":
+            return (
+                variant,
+                None,
+                [
+                    "'_sy' is no longer supported and should be "
+                    "replaced by 'p.(=)'"
+                ],
+            )
+        elif variant.lower() == "_wt":
+            return (
+                variant,
+                None,
+                [
+                    "'_wt' is no longer supported and should be "
+                    "replaced by one of 'g.=', 'c.=' or 'n.='"
+                ],
+            )
 
-                    prefix_error = self._validate_variant_prefix_for_column(
-                        variant=validated,
-                        prefix=validated.prefix,
-                        column=column,
-                        splice_defined=splice_defined,
-                    )
-                    if prefix_error:
-                        errors.append(prefix_error)
+        validated, prefix, error = parse_hgvs_string(
+            variant, targetseq=targetseq, relaxed_ordering=relaxed_ordering
+        )
+        if error:
+            return np.NaN, None, [error]
+
+        prefix_error = self._validate_variant_prefix_for_column(
+            variant=validated,
+            prefix=prefix,
+            column=column,
+            splice_defined=splice_defined,
+        )
+        return validated, prefix, [prefix_error] if prefix_error else []
 
-                    return str(validated)
+    def _broadcast_outcomes(
+        self,
+        values: pd.Series,
+        codes: np.ndarray,
+        outcomes: List[Tuple[Union[str, float], Optional[str], List[str]]],
+    ) -> Tuple[pd.Series, Set[str], List[str]]:
+        """
+        Maps the outcomes of validating each distinct variant in `values`
+        back onto the rows identified by `codes` (as returned by
+        `pd.factorize`). Errors are repeated for each offending row, in row
+        order.
+        """
+        prefixes = set(prefix for (_, prefix, _) in outcomes if prefix)
 
-                except MaveHgvsParseError as error:
-                    errors.append(f"{variant}: {str(error)}")
-                    return np.NaN
+        validated = np.empty(len(outcomes) + 1, dtype=object)
+        validated[:-1] = [value for (value, _, _) in outcomes]
+        validated[-1] = np.NaN  # Null rows are coded as -1 by `pd.factorize`
+        validated_variants = pd.Series(
+            validated[codes], index=values.index, name=values.name
+        )
 
-        validated_variants = self._df[column].apply(validate_variant)
+        errors = []
+        invalid = [i for (i, (_, _, e)) in enumerate(outcomes) if e]
+        if invalid:
+            for code in codes[np.isin(codes, invalid)]:
+                errors += outcomes[code][2]
 
         return validated_variants, prefixes, errors
 
+    def _null_count(self, column) -> int:
+        if column not in self.columns:
+            return self.n_rows
+        return self._frame.null_count(column)
+
     def _column_is_null(self, column) -> bool:
-        return len(self._df[self._df[column].isna()]) == len(self._df)
+        return self._null_count(column) == self.n_rows
 
     def _column_is_partially_null(self, column) -> bool:
-        return 0 < len(self._df[self._df[column].isna()]) < len(self._df)
+        return 0 < self._null_count(column) < self.n_rows
 
     def _column_is_fully_specified(self, column) -> bool:
-        return len(self._df[self._df[column].isna()]) == 0
+        return self._null_count(column) == 0
 
     def _validate_variant_prefix_for_column(
-        self, variant: Variant, prefix: str, column: str, splice_defined: bool
+        self, variant: str, prefix: str, column: str, splice_defined: bool
     ) -> Optional[str]:
         prefix = prefix.lower()
 
@@ -606,6 +751,20 @@ class MaveDataset:
         return None
 
 
+def _validate_variant_chunk(
+    dataset_cls, kwargs: dict, variants: List[str]
+) -> List[Tuple[Union[str, float], Optional[str], List[str]]]:
+    """
+    Validates a chunk of distinct variants in a worker process of the pool
+    created in `MaveDataset._validate_variants`.
+    """
+    validator = dataset_cls()
+    return [
+        validator._validate_variant(variant=variant, **kwargs)
+        for variant in variants
+    ]
+
+
 class MaveScoresDataset(MaveDataset):
     class AdditionalColumns:
         SCORES = dataset.constants.required_score_column
@@ -630,21 +789,6 @@ class MaveScoresDataset(MaveDataset):
 
         return self
 
-    def _normalize_data(self) -> "MaveDataset":
-        super()._normalize_data()
-
-        should_be_numeric = [self.AdditionalColumns.SCORES]
-        for c in should_be_numeric:
-            if c in self.columns:
-                try:
-                    self._df[c] = self._df[c].astype(
-                        dtype=float, errors="raise"
-                    )
-                except ValueError as e:
-                    self._errors.append(f"{c}: {str(e)}")
-
-        return self
-
 
 class MaveCountsDataset(MaveDataset):
     @property
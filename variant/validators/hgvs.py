@@ -1,5 +1,5 @@
-from functools import partial
-from typing import Optional, Union
+from functools import lru_cache, partial
+from typing import Optional, Tuple, Union
 
 from django.core.exceptions import ValidationError
 
@@ -82,6 +82,47 @@ def validate_hgvs_string(
     return str(variant)
 
 
+# Upper bound on the number of distinct (value, targetseq, relaxed_ordering)
+# triples memoized by `parse_hgvs_string`.
+HGVS_PARSE_CACHE_SIZE = 2 ** 16
+
+
+@lru_cache(maxsize=HGVS_PARSE_CACHE_SIZE)
+def parse_hgvs_string(
+    value: str,
+    targetseq: Optional[str] = None,
+    relaxed_ordering: bool = False,
+) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+    """
+    Parses a single HGVS string using `mavehgvs`. Results are memoized
+    in a bounded LRU cache keyed by `(value, targetseq, relaxed_ordering)`
+    since uploaded datasets commonly repeat the same variant many times.
+
+    Parameters
+    ----------
+    value : str
+        Non-null HGVS string to parse.
+    targetseq : str, optional
+        Target sequence to validate the variant against.
+    relaxed_ordering : bool
+        Passed through to `mavehgvs.Variant`.
+
+    Returns
+    -------
+    Tuple[Optional[str], Optional[str], Optional[str]]
+        The normalized variant string, its lower-case prefix and an error
+        message. The first two are `None` when the value could not be
+        parsed, in which case the error message is set.
+    """
+    try:
+        variant = Variant(
+            s=value, targetseq=targetseq, relaxed_ordering=relaxed_ordering
+        )
+    except MaveHgvsParseError as error:
+        return None, None, f"{value}: {str(error)}"
+    return str(variant), variant.prefix.lower(), None
+
+
 validate_nt_variant = partial(validate_hgvs_string, **{"column": "nt"})
 validate_splice_variant = partial(validate_hgvs_string, **{"column": "splice"})
 validate_pro_variant = partial(validate_hgvs_string, **{"column": "p"})